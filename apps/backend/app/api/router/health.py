@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, status, Depends
 
 from app.core import get_db_session
+from app.services import document_converter
 
 health_check = APIRouter()
 
@@ -19,4 +20,8 @@ async def ping(db: AsyncSession = Depends(get_db_session)):
         import logging
         logging.error("Database health check failed", exc_info=True)
         db_status = "unreachable"
-    return {"message": "pong", "database": db_status}
+    return {
+        "message": "pong",
+        "database": db_status,
+        "document_converter": document_converter.stats(),
+    }
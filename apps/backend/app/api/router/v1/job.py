@@ -1,19 +1,44 @@
+import json
 import logging
 import traceback
 
 from uuid import uuid4
+from datetime import datetime
+from typing import Literal, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, HTTPException, Depends, Request, status, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.types import Receive, Scope, Send
 
 from app.core import get_db_session
-from app.services import JobService, JobNotFoundError
-from app.schemas.pydantic.job import JobUploadRequest
+from app.services import (
+    JobService,
+    JobIngestion,
+    RecordLister,
+    JobNotFoundError,
+    InvalidListQueryError,
+)
+from app.schemas.pydantic import JobUploadRequest, JobBatchRequest
 
 job_router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    Streams the response while the request body is still being read.
+
+    ``StreamingResponse`` listens for a client disconnect on ``receive`` while
+    streaming, which would consume the body chunks the response is built from.
+    Here the body iterator is the only reader; a disconnect ends it instead.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
 @job_router.post(
     "/upload",
     summary="stores the job posting in the database by parsing the JD into a structured format JSON",
@@ -25,6 +50,10 @@ async def upload_job(
 ):
     """
     Accepts a job description as a MarkDown text and stores it in the database.
+
+    If none of the job descriptions could be stored, responds with 422 when
+    every failure was invalid extracted data and 500 otherwise, with the
+    per-JD ``results`` in ``detail``.
     """
     request_id = getattr(request.state, "request_id", str(uuid4()))
 
@@ -47,7 +76,8 @@ async def upload_job(
 
     try:
         job_service = JobService(db)
-        job_ids = await job_service.create_and_store_job(payload.model_dump())
+        results = await job_service.create_and_store_jobs(payload.model_dump())
+        job_ids = [result["job_id"] for result in results if result["status"] != "failed"]
 
     except AssertionError as e:
         raise HTTPException(
@@ -61,9 +91,25 @@ async def upload_job(
             detail=f"{str(e)}",
         )
 
+    if results and not job_ids:
+        validation_only = all(result["error_type"] == "validation" for result in results)
+        raise HTTPException(
+            status_code=(
+                status.HTTP_422_UNPROCESSABLE_ENTITY
+                if validation_only
+                else status.HTTP_500_INTERNAL_SERVER_ERROR
+            ),
+            detail={
+                "message": "none of the job descriptions could be stored",
+                "results": results,
+                "request_id": request_id,
+            },
+        )
+
     return {
         "message": "data successfully processed",
         "job_id": job_ids,
+        "results": results,
         "request": {
             "request_id": request_id,
             "payload": payload,
@@ -71,6 +117,176 @@ async def upload_job(
     }
 
 
+@job_router.post(
+    "/ingest",
+    summary="stores a stream of job postings sent as NDJSON, streaming back one result per posting",
+)
+async def ingest_jobs(
+    request: Request,
+    resume_id: Optional[str] = Query(
+        None, description="Resume ID for the postings that do not specify one"
+    ),
+):
+    """
+    Accepts job postings as newline-delimited JSON, one
+    ``{"job_description": ..., "resume_id": ..., "id": ...}`` object per line.
+
+    The body is parsed as it arrives and the postings are processed with
+    bounded concurrency. The response is NDJSON as well: one
+    ``{"line", "id", "status", "job_id" | "error"}`` object per posting, in
+    completion order, followed by a ``{"status": "completed", ...}`` summary.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+
+    allowed_content_types = [
+        "application/x-ndjson",
+        "application/ndjson",
+    ]
+
+    content_type = request.headers.get("content-type")
+    if not content_type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Content-Type header is missing",
+        )
+
+    if content_type.split(";")[0].strip() not in allowed_content_types:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid Content-Type. Only {', '.join(allowed_content_types)} is/are allowed.",
+        )
+
+    async def results():
+        total = succeeded = 0
+        try:
+            async for result in JobIngestion().ingest(request.stream(), resume_id):
+                total += 1
+                if result["status"] != "failed":
+                    succeeded += 1
+                yield json.dumps(result) + "\n"
+        except Exception as e:
+            logger.error(f"Job ingestion failed: {str(e)} - traceback: {traceback.format_exc()}")
+            yield json.dumps({"status": "error", "error": "Job ingestion failed"}) + "\n"
+            return
+        yield json.dumps(
+            {
+                "status": "completed",
+                "total": total,
+                "succeeded": succeeded,
+                "failed": total - succeeded,
+            }
+        ) + "\n"
+
+    return _DuplexStreamingResponse(
+        results(),
+        media_type="application/x-ndjson",
+        headers={"X-Request-ID": request_id},
+    )
+
+
+@job_router.post(
+    "/batch",
+    summary="Get many jobs in one call, keyed by job ID",
+)
+async def get_jobs_batch(
+    payload: JobBatchRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Retrieves several jobs with their processed data in one request.
+
+    Returns a map of job ID to the same data as `GET /jobs`, limited to the
+    requested `fields`, and the IDs that were not found.
+
+    Raises:
+        HTTPException: If there's an error fetching the jobs.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+    headers = {"X-Request-ID": request_id}
+
+    try:
+        jobs = await JobService(db).get_jobs_with_processed_data(
+            job_ids=payload.job_ids,
+            fields=payload.fields,
+        )
+        return JSONResponse(
+            content={
+                "request_id": request_id,
+                "data": jobs,
+            },
+            headers=headers,
+        )
+    except Exception as e:
+        logger.error(f"Error fetching jobs: {str(e)} - traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching job data",
+        )
+
+
+@job_router.get(
+    "/list",
+    summary="List jobs page by page, newest first, with optional filters",
+)
+async def list_jobs(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500, description="Number of jobs per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    order: Literal["desc", "asc"] = Query("desc", description="Order of creation"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return; content and processed_job are only returned when listed",
+    ),
+    resume_id: Optional[str] = Query(None, description="Only jobs of this resume"),
+    created_after: Optional[datetime] = Query(None, description="Only jobs created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only jobs created before this time"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Lists stored jobs using cursor pagination.
+
+    Pass the `next_cursor` of a page as `cursor` to fetch the next one; it is
+    null on the last page.
+
+    Raises:
+        HTTPException: If the cursor or fields are invalid or if there's an error listing jobs.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+    headers = {"X-Request-ID": request_id}
+
+    try:
+        page = await RecordLister(db).jobs(
+            limit=limit,
+            cursor=cursor,
+            order=order,
+            fields=[field.strip() for field in fields.split(",") if field.strip()]
+            if fields
+            else None,
+            resume_id=resume_id,
+            created_after=created_after,
+            created_before=created_before,
+        )
+        return JSONResponse(
+            content={
+                "request_id": request_id,
+                "data": page,
+            },
+            headers=headers,
+        )
+    except InvalidListQueryError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error listing jobs: {str(e)} - traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error listing jobs",
+        )
+
+
 @job_router.get(
     "",
     summary="Get job data from both job and processed_job models",
@@ -1,7 +1,10 @@
+import json
 import logging
 import traceback
 
 from uuid import uuid4
+from datetime import datetime
+from typing import List, Literal, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi import (
@@ -15,9 +18,11 @@ from fastapi import (
     Query,
 )
 
-from app.core import get_db_session
+from app.core import settings, get_db_session
 from app.services import (
     ResumeService,
+    BulkResumeIngestion,
+    RecordLister,
     ScoreImprovementService,
     ResumeNotFoundError,
     ResumeParsingError,
@@ -26,8 +31,12 @@ from app.services import (
     JobParsingError,
     ResumeKeywordExtractionError,
     JobKeywordExtractionError,
+    PipelineStageTimeoutError,
+    DocumentConversionTimeoutError,
+    InvalidListQueryError,
+    task_queue,
 )
-from app.schemas.pydantic import ResumeImprovementRequest
+from app.schemas.pydantic import ResumeImprovementRequest, ResumeBatchRequest
 
 resume_router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -40,11 +49,19 @@ logger = logging.getLogger(__name__)
 async def upload_resume(
     request: Request,
     file: UploadFile = File(...),
+    defer_extraction: bool = Query(
+        False,
+        description="Return as soon as the resume is stored and extract structured data in the background",
+    ),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
     Accepts a PDF or DOCX file (max 2MB), converts it to HTML/Markdown, and stores it in the database.
 
+    With `defer_extraction=true` the structured extraction runs as a background
+    task; follow it through `processing_status` in `GET /api/v1/resumes`. If the
+    task cannot be queued, the stored resume is returned as `failed`.
+
     Raises:
         HTTPException: If the file type is not supported, file is empty, or file exceeds 2MB limit.
     """
@@ -100,13 +117,31 @@ async def upload_resume(
             file_type=file.content_type,
             filename=file.filename,
             content_type="md",
+            defer_extraction=defer_extraction,
         )
+        processing_status = await resume_service.get_processing_status(resume_id)
+        if processing_status == "pending":
+            try:
+                await task_queue.submit("extract_resume", {"resume_id": resume_id})
+            except Exception as e:
+                # The resume is already stored; report it as failed rather than leave it pending
+                logger.error(f"Failed to queue the extraction of resume {resume_id}: {str(e)}")
+                processing_status = "failed"
+                await resume_service.mark_processing_failed(
+                    resume_id, f"Failed to queue the extraction: {str(e)}"
+                )
     except ResumeValidationError as e:
         logger.warning(f"Resume validation failed: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e),
         )
+    except DocumentConversionTimeoutError as e:
+        logger.warning(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(
             f"Error processing file: {str(e)} - traceback: {traceback.format_exc()}"
@@ -120,9 +155,85 @@ async def upload_resume(
         "message": f"File {file.filename} successfully processed as MD and stored in the DB",
         "request_id": request_id,
         "resume_id": resume_id,
+        "processing_status": processing_status,
     }
 
 
+@resume_router.post(
+    "/bulk-upload",
+    summary="Upload many resumes (PDF/DOCX files or zip archives of them) in one request",
+)
+async def bulk_upload_resumes(
+    request: Request,
+    files: List[UploadFile] = File(...),
+    stream: bool = Query(
+        False, description="Report per-file progress using Server-Sent Events"
+    ),
+):
+    """
+    Converts, stores and extracts every resume in the uploaded files and zip
+    archives, several at a time. A failing document is reported in the
+    results and does not stop the others.
+
+    Raises:
+        HTTPException: If an archive cannot be read or the upload holds too many documents.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+    headers = {"X-Request-ID": request_id}
+
+    ingestion = BulkResumeIngestion()
+    try:
+        documents = ingestion.collect(
+            [(file.filename or "", file.content_type, file.file) for file in files]
+        )
+    except ValueError as e:
+        logger.warning(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if stream:
+
+        async def events():
+            total = len(documents)
+            completed = succeeded = 0
+            yield f"data: {json.dumps({'status': 'started', 'total': total})}\n\n"
+            async for result in ingestion.ingest(documents):
+                completed += 1
+                succeeded += result["status"] == "processed"
+                progress = {**result, "completed": completed, "total": total}
+                yield f"data: {json.dumps(progress)}\n\n"
+            summary = {
+                "status": "completed",
+                "total": total,
+                "succeeded": succeeded,
+                "failed": total - succeeded,
+            }
+            yield f"data: {json.dumps(summary)}\n\n"
+
+        return StreamingResponse(
+            content=events(),
+            media_type="text/event-stream",
+            headers=headers,
+        )
+
+    results = [result async for result in ingestion.ingest(documents)]
+    succeeded = sum(result["status"] == "processed" for result in results)
+    return JSONResponse(
+        content={
+            "request_id": request_id,
+            "data": {
+                "total": len(results),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+                "results": results,
+            },
+        },
+        headers=headers,
+    )
+
+
 @resume_router.post(
     "/improve",
     summary="Score and improve a resume against a job description",
@@ -134,10 +245,22 @@ async def score_and_improve(
     stream: bool = Query(
         False, description="Enable streaming response using Server-Sent Events"
     ),
+    background: bool = Query(
+        False,
+        description="Queue the request as a background task and return its task id immediately",
+    ),
+    force: bool = Query(
+        False,
+        description="Recompute even if a result for identical resume and job content is cached",
+    ),
 ):
     """
     Scores and improves a resume against a job description.
 
+    With `background=true` the work is queued and a task id is returned right
+    away; poll `GET /api/v1/tasks/{task_id}` or follow
+    `GET /api/v1/tasks/{task_id}/events` for the result.
+
     Raises:
         HTTPException: If the resume or job is not found.
     """
@@ -157,6 +280,20 @@ async def score_and_improve(
             raise JobNotFoundError(
                 message="invalid value passed in `job_id` field, please try again with valid job_id."
             )
+        if background:
+            task_id = await task_queue.submit(
+                "improve", {"resume_id": resume_id, "job_id": job_id, "force": force}
+            )
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content={
+                    "request_id": request_id,
+                    "task_id": task_id,
+                    "status": "queued",
+                },
+                headers=headers,
+            )
+
         score_improvement_service = ScoreImprovementService(db=db)
 
         if stream:
@@ -164,6 +301,7 @@ async def score_and_improve(
                 content=score_improvement_service.run_and_stream(
                     resume_id=resume_id,
                     job_id=job_id,
+                    force=force,
                 ),
                 media_type="text/event-stream",
                 headers=headers,
@@ -172,6 +310,7 @@ async def score_and_improve(
             improvements = await score_improvement_service.run(
                 resume_id=resume_id,
                 job_id=job_id,
+                force=force,
             )
             return JSONResponse(
                 content={
@@ -216,6 +355,12 @@ async def score_and_improve(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e),
         )
+    except PipelineStageTimeoutError as e:
+        logger.error(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(f"Error: {str(e)} - traceback: {traceback.format_exc()}")
         raise HTTPException(
@@ -224,6 +369,179 @@ async def score_and_improve(
         )
 
 
+@resume_router.get(
+    "/ranking",
+    summary="Rank stored resumes against a job, lexically first and by embeddings for the top candidates",
+)
+async def rank_resumes(
+    request: Request,
+    job_id: str = Query(..., description="Job ID to rank resumes against"),
+    limit: int = Query(20, ge=1, le=500, description="Number of resumes to return"),
+    rerank_top_k: int = Query(
+        settings.LEXICAL_RERANK_TOP_K,
+        ge=0,
+        le=100,
+        description="How many of the best lexical matches to re-rank with embeddings",
+    ),
+    min_coverage: float = Query(
+        settings.LEXICAL_GATE_MIN_COVERAGE,
+        ge=0.0,
+        le=1.0,
+        description="Minimum job keyword coverage for a resume to be considered",
+    ),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Ranks all stored resumes against a job description.
+
+    A BM25/keyword-coverage pass scores every resume without any model call;
+    only the best `rerank_top_k` are embedded and ordered by cosine similarity.
+
+    Raises:
+        HTTPException: If the job is not found or if there's an error ranking resumes.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+    headers = {"X-Request-ID": request_id}
+
+    try:
+        ranking = await ScoreImprovementService(db=db).rank_resumes(
+            job_id=job_id,
+            limit=limit,
+            min_coverage=min_coverage,
+            rerank_top_k=rerank_top_k,
+        )
+        return JSONResponse(
+            content={
+                "request_id": request_id,
+                "data": ranking,
+            },
+            headers=headers,
+        )
+    except JobNotFoundError as e:
+        logger.error(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except (JobParsingError, JobKeywordExtractionError) as e:
+        logger.warning(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error ranking resumes: {str(e)} - traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error ranking resumes",
+        )
+
+
+@resume_router.post(
+    "/batch",
+    summary="Get many resumes in one call, keyed by resume ID",
+)
+async def get_resumes_batch(
+    payload: ResumeBatchRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Retrieves several resumes with their processed data in one request.
+
+    Returns a map of resume ID to the same data as `GET /resumes`, limited to
+    the requested `fields`, and the IDs that were not found.
+
+    Raises:
+        HTTPException: If there's an error fetching the resumes.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+    headers = {"X-Request-ID": request_id}
+
+    try:
+        resumes = await ResumeService(db).get_resumes_with_processed_data(
+            resume_ids=payload.resume_ids,
+            fields=payload.fields,
+        )
+        return JSONResponse(
+            content={
+                "request_id": request_id,
+                "data": resumes,
+            },
+            headers=headers,
+        )
+    except Exception as e:
+        logger.error(f"Error fetching resumes: {str(e)} - traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching resume data",
+        )
+
+
+@resume_router.get(
+    "/list",
+    summary="List resumes page by page, newest first, with optional filters",
+)
+async def list_resumes(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500, description="Number of resumes per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    order: Literal["desc", "asc"] = Query("desc", description="Order of creation"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return; content and processed_resume are only returned when listed",
+    ),
+    processing_status: Optional[str] = Query(None, description="Only resumes in this processing status"),
+    content_type: Optional[str] = Query(None, description="Only resumes of this content type"),
+    created_after: Optional[datetime] = Query(None, description="Only resumes created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only resumes created before this time"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Lists stored resumes using cursor pagination.
+
+    Pass the `next_cursor` of a page as `cursor` to fetch the next one; it is
+    null on the last page.
+
+    Raises:
+        HTTPException: If the cursor or fields are invalid or if there's an error listing resumes.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+    headers = {"X-Request-ID": request_id}
+
+    try:
+        page = await RecordLister(db).resumes(
+            limit=limit,
+            cursor=cursor,
+            order=order,
+            fields=[field.strip() for field in fields.split(",") if field.strip()]
+            if fields
+            else None,
+            processing_status=processing_status,
+            content_type=content_type,
+            created_after=created_after,
+            created_before=created_before,
+        )
+        return JSONResponse(
+            content={
+                "request_id": request_id,
+                "data": page,
+            },
+            headers=headers,
+        )
+    except InvalidListQueryError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error listing resumes: {str(e)} - traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error listing resumes",
+        )
+
+
 @resume_router.get(
     "",
     summary="Get resume data from both resume and processed_resume models",
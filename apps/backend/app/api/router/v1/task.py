@@ -0,0 +1,89 @@
+import json
+import logging
+import traceback
+
+from uuid import uuid4
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.services import task_queue, TaskNotFoundError
+
+task_router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@task_router.get(
+    "/{task_id}",
+    summary="Get the status and result of a background task",
+)
+async def get_task(request: Request, task_id: str):
+    """
+    Retrieves a background task by its id.
+
+    Args:
+        task_id: The ID of the task to retrieve
+
+    Returns:
+        The task status, and its result or error once finished
+
+    Raises:
+        HTTPException: If the task is not found or if there's an error fetching it.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+    headers = {"X-Request-ID": request_id}
+
+    try:
+        task = await task_queue.get(task_id)
+        return JSONResponse(
+            content={
+                "request_id": request_id,
+                "data": task,
+            },
+            headers=headers,
+        )
+    except TaskNotFoundError as e:
+        logger.error(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error fetching task: {str(e)} - traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching task data",
+        )
+
+
+@task_router.get(
+    "/{task_id}/events",
+    summary="Follow a background task using Server-Sent Events",
+)
+async def follow_task(request: Request, task_id: str):
+    """
+    Streams the task state every time it changes until it succeeds or fails.
+
+    Raises:
+        HTTPException: If the task is not found.
+    """
+    request_id = getattr(request.state, "request_id", str(uuid4()))
+    headers = {"X-Request-ID": request_id}
+
+    try:
+        await task_queue.get(task_id)
+    except TaskNotFoundError as e:
+        logger.error(str(e))
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+
+    async def events():
+        async for snapshot in task_queue.follow(task_id):
+            yield f"data: {json.dumps(snapshot)}\n\n"
+
+    return StreamingResponse(
+        content=events(),
+        media_type="text/event-stream",
+        headers=headers,
+    )
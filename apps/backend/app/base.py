@@ -11,19 +11,28 @@ from .api import health_check, v1_router, RequestIDMiddleware
 from .core import (
     settings,
     async_engine,
+    checkpoint_sqlite,
     setup_logging,
     custom_http_exception_handler,
     validation_exception_handler,
     unhandled_exception_handler,
 )
 from .models import Base
+from .migrations import run_migrations
+from .services import task_queue, document_converter
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations)
+    document_converter.start()
+    await task_queue.start()
     yield
+    await task_queue.stop()
+    await document_converter.stop()
+    await checkpoint_sqlite(async_engine)
     await async_engine.dispose()
 
 
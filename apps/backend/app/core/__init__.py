@@ -1,4 +1,12 @@
-from .database import init_models, async_engine, get_db_session, get_sync_db_session
+from .database import (
+    init_models,
+    async_engine,
+    checkpoint_sqlite,
+    AsyncSessionLocal,
+    get_db_session,
+    get_sync_db_session,
+    release_connection,
+)
 from .config import settings, setup_logging
 from .exceptions import (
     custom_http_exception_handler,
@@ -11,9 +19,12 @@ __all__ = [
     "settings",
     "init_models",
     "async_engine",
+    "checkpoint_sqlite",
+    "AsyncSessionLocal",
     "setup_logging",
     "get_db_session",
     "get_sync_db_session",
+    "release_connection",
     "custom_http_exception_handler",
     "validation_exception_handler",
     "unhandled_exception_handler",
@@ -2,7 +2,7 @@ import os
 import sys
 import logging
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal, Union
 
 
 class Settings(BaseSettings):
@@ -12,6 +12,15 @@ class Settings(BaseSettings):
     FRONTEND_PATH: str = os.path.join(os.path.dirname(__file__), "frontend", "assets")
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_CHECKOUT_WARN_SECONDS: float = 5.0
+    SQLITE_PROFILE: Literal["baseline", "tuned"] = "tuned"
+    SQLITE_PRAGMAS: Dict[str, Union[int, str]] = {}
     PYTHONDONTWRITEBYTECODE: int = 1
     SYNC_DATABASE_URL: Optional[str] = None
     ASYNC_DATABASE_URL: Optional[str] = None
@@ -24,6 +33,30 @@ class Settings(BaseSettings):
     EMBEDDING_API_KEY: Optional[str] = None
     EMBEDDING_BASE_URL: Optional[str] = None
     EMBEDDING_MODEL: Optional[str] = "dengcao/Qwen3-Embedding-0.6B:Q8_0"
+    TASK_WORKERS: int = 2
+    TASK_LEASE_SECONDS: int = 300
+    TASK_POLL_INTERVAL_SECONDS: float = 1.0
+    TASK_MAX_ATTEMPTS: int = 3
+    MEMORY_PROFILING: bool = False
+    MEMORY_PROFILING_TOP_N: int = 10
+    MEMORY_PROFILING_FRAMES: int = 1
+    LEXICAL_GATE_MIN_COVERAGE: float = 0.0
+    LEXICAL_RERANK_TOP_K: int = 10
+    BULK_UPLOAD_CONCURRENCY: int = 4
+    BULK_UPLOAD_MAX_FILES: int = 1000
+    JOB_EXTRACTION_CONCURRENCY: int = 4
+    JOB_INGEST_CONCURRENCY: int = 8
+    JOB_INGEST_MAX_LINE_BYTES: int = 1024 * 1024
+    RESUME_EXTRACTION_MODE: Literal["llm", "hybrid", "sectioned"] = "llm"
+    RESUME_SECTION_RETRIES: int = 2
+    KEYWORD_EXTRACTION_MODE: Literal["llm", "taxonomy", "verify"] = "llm"
+    SKILL_TAXONOMY_PATH: Optional[str] = None
+    RESUME_DEDUP_MODE: Literal["off", "reuse", "return_existing"] = "reuse"
+    JOB_DEDUP_MODE: Literal["off", "share"] = "share"
+    EMBEDDING_STORE_PATH: Optional[str] = None
+    CONVERTER_WORKERS: int = 2
+    CONVERTER_TIMEOUT_SECONDS: float = 60.0
+    EMBEDDING_STORE_DTYPE: Literal["float32", "float16", "int8"] = "float32"
 
     model_config = SettingsConfigDict(
         env_file=os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, ".env"),
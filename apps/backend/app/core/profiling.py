@@ -0,0 +1,53 @@
+import logging
+import tracemalloc
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_IGNORED_FRAMES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+)
+
+
+def _format_bytes(size: int) -> str:
+    return f"{size / 1024:+.1f} KiB"
+
+
+@contextmanager
+def track_allocations(label: str) -> Iterator[None]:
+    """
+    Log the allocations made while the block runs, when MEMORY_PROFILING is on.
+
+    * Net traced memory and peak over the block
+    * Top MEMORY_PROFILING_TOP_N allocation sites by size difference
+    * Noop (no tracemalloc overhead) when profiling is disabled
+
+    tracemalloc is process-wide, so with concurrent requests the numbers
+    include allocations made by the other requests in flight.
+    """
+    if not settings.MEMORY_PROFILING:
+        yield
+        return
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(settings.MEMORY_PROFILING_FRAMES)
+
+    before = tracemalloc.take_snapshot().filter_traces(_IGNORED_FRAMES)
+    start_current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        after = tracemalloc.take_snapshot().filter_traces(_IGNORED_FRAMES)
+        current, peak = tracemalloc.get_traced_memory()
+        logger.info(
+            f"[memory] {label}: net {_format_bytes(current - start_current)}, "
+            f"peak {_format_bytes(peak - start_current)}"
+        )
+        for stat in after.compare_to(before, "lineno")[: settings.MEMORY_PROFILING_TOP_N]:
+            logger.info(f"[memory] {label}: {stat}")
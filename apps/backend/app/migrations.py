@@ -0,0 +1,313 @@
+import logging
+
+from collections import Counter
+from typing import Callable, List, Tuple
+
+from sqlalchemy import bindparam, delete, insert, inspect, select, text, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.dialects.postgresql import JSON, JSONB
+
+from .models import Base, Resume, ProcessedResume, Job, ProcessedJob, CorpusTerm, CorpusStats
+from .models.types import JSONType
+from .services.lexical_scorer import tokenize
+from .services.resume_service import content_hash
+from .services.serializers import (
+    decode_field,
+    RESUME_OBJECT_FIELDS,
+    RESUME_LIST_FIELDS,
+    JOB_OBJECT_FIELDS,
+    JOB_LIST_FIELDS,
+)
+
+logger = logging.getLogger(__name__)
+
+_BATCH_SIZE = 500
+
+
+def _add_resume_hashes(conn: Connection) -> None:
+    """
+    Adds the upload deduplication hashes to ``resumes`` and backfills the
+    content hash of existing rows (the raw file bytes were never kept).
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("resumes")}
+    for name in ("file_hash", "content_hash"):
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE resumes ADD COLUMN {name} VARCHAR"))
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_resumes_{name} ON resumes ({name})"))
+
+    rows = conn.execute(
+        select(Resume.id, Resume.content).where(Resume.content_hash.is_(None))
+    ).all()
+    stmt = (
+        update(Resume.__table__)
+        .where(Resume.__table__.c.id == bindparam("row_id"))
+        .values(content_hash=bindparam("hash"))
+    )
+    for start in range(0, len(rows), _BATCH_SIZE):
+        conn.execute(
+            stmt,
+            [
+                {"row_id": row_id, "hash": content_hash(content)}
+                for row_id, content in rows[start : start + _BATCH_SIZE]
+            ],
+        )
+
+
+def _rebuild_lexical_corpus(conn: Connection) -> None:
+    """
+    Recomputes the BM25 corpus statistics from every stored resume and job,
+    including rows stored before the statistics were maintained.
+    """
+    frequencies: Counter = Counter()
+    document_count = total_length = 0
+    # Read in keyset batches rather than through a server-side cursor: on
+    # PostgreSQL an open cursor blocks later DDL on the table in this transaction
+    for table in (Resume, Job):
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                select(table.id, table.content)
+                .where(table.id > last_id)
+                .order_by(table.id)
+                .limit(_BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            for _, content in rows:
+                tokens = tokenize(content)
+                frequencies.update(set(tokens))
+                document_count += 1
+                total_length += len(tokens)
+
+    conn.execute(delete(CorpusTerm))
+    conn.execute(delete(CorpusStats))
+    rows = [{"term": t, "document_frequency": n} for t, n in frequencies.items()]
+    for start in range(0, len(rows), _BATCH_SIZE):
+        conn.execute(insert(CorpusTerm), rows[start : start + _BATCH_SIZE])
+    conn.execute(
+        insert(CorpusStats).values(
+            id=1, document_count=document_count, total_length=total_length
+        )
+    )
+
+
+def _add_resume_processing_status(conn: Connection) -> None:
+    """
+    Adds the structured extraction status to ``resumes``. Existing rows are
+    marked processed or failed depending on whether extraction stored data.
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("resumes")}
+    if "processing_status" not in columns:
+        conn.execute(text("ALTER TABLE resumes ADD COLUMN processing_status VARCHAR"))
+    if "processing_error" not in columns:
+        conn.execute(text("ALTER TABLE resumes ADD COLUMN processing_error TEXT"))
+
+    resumes = Resume.__table__
+    processed = select(ProcessedResume.resume_id).where(
+        ProcessedResume.resume_id == resumes.c.resume_id
+    )
+    conn.execute(
+        update(resumes)
+        .where(resumes.c.processing_status.is_(None), processed.exists())
+        .values(processing_status="processed")
+    )
+    conn.execute(
+        update(resumes)
+        .where(resumes.c.processing_status.is_(None))
+        .values(processing_status="failed")
+    )
+
+
+def _native_processed_json(conn: Connection) -> None:
+    """
+    Rewrites processed resume/job JSON columns stored as JSON-encoded strings
+    (list fields additionally wrapped as ``{"<field>": [...]}``) as native
+    JSON values.
+    """
+    for model, key, object_fields, list_fields in (
+        (ProcessedResume, "resume_id", RESUME_OBJECT_FIELDS, RESUME_LIST_FIELDS),
+        (ProcessedJob, "job_id", JOB_OBJECT_FIELDS, JOB_LIST_FIELDS),
+    ):
+        table = model.__table__
+        fields = {name: None for name in object_fields}
+        fields.update({name: name for name in list_fields})
+        stmt = (
+            update(table)
+            .where(table.c[key] == bindparam("row_key"))
+            .values({name: bindparam(f"new_{name}") for name in fields})
+        )
+
+        rows = []
+        result = conn.execute(select(table.c[key], *(table.c[name] for name in fields)))
+        for row in result.mappings():
+            values = {
+                f"new_{name}": decode_field(row[name], wrapper)
+                for name, wrapper in fields.items()
+            }
+            if any(values[f"new_{name}"] != row[name] for name in fields):
+                rows.append({"row_key": row[key], **values})
+        for start in range(0, len(rows), _BATCH_SIZE):
+            conn.execute(stmt, rows[start : start + _BATCH_SIZE])
+        logger.info(f"Converted {len(rows)} {table.name} row(s) to native JSON")
+
+
+def _merge_duplicate_jobs(conn: Connection) -> None:
+    """
+    Adds the job deduplication columns and backfills content hashes. Jobs
+    without processed data of their own are pointed at the oldest job with
+    the same text that has some. Existing processed rows are all kept: their
+    origin (LLM or fallback extraction) is not known here, so none of them
+    may replace another.
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("jobs")}
+    for name in ("content_hash", "canonical_job_id"):
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE jobs ADD COLUMN {name} VARCHAR"))
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_jobs_{name} ON jobs ({name})"))
+
+    jobs = Job.__table__
+    rows = conn.execute(select(jobs.c.id, jobs.c.content).where(jobs.c.content_hash.is_(None))).all()
+    stmt = update(jobs).where(jobs.c.id == bindparam("row_id")).values(content_hash=bindparam("hash"))
+    for start in range(0, len(rows), _BATCH_SIZE):
+        conn.execute(
+            stmt,
+            [
+                {"row_id": row_id, "hash": content_hash(content)}
+                for row_id, content in rows[start : start + _BATCH_SIZE]
+            ],
+        )
+
+    processed_ids = set(conn.execute(select(ProcessedJob.job_id)).scalars())
+    candidates = conn.execute(
+        select(jobs.c.job_id, jobs.c.content_hash)
+        .where(jobs.c.canonical_job_id.is_(None))
+        .order_by(jobs.c.created_at, jobs.c.id)
+    ).all()
+    owners: dict = {}
+    for job_id, text_hash in candidates:
+        if job_id in processed_ids:
+            owners.setdefault(text_hash, job_id)
+    duplicates = [
+        {"row_job_id": job_id, "owner": owners[text_hash]}
+        for job_id, text_hash in candidates
+        if text_hash in owners and job_id not in processed_ids
+    ]
+
+    for start in range(0, len(duplicates), _BATCH_SIZE):
+        batch = duplicates[start : start + _BATCH_SIZE]
+        conn.execute(
+            update(jobs)
+            .where(jobs.c.job_id == bindparam("row_job_id"))
+            .values(canonical_job_id=bindparam("owner")),
+            batch,
+        )
+    logger.info(f"Pointed {len(duplicates)} duplicate job(s) at a shared ProcessedJob")
+
+
+def _add_listing_indexes(conn: Connection) -> None:
+    """
+    Adds the ``(created_at, id)`` indexes the list endpoints page through.
+    """
+    for table in ("resumes", "jobs"):
+        conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_created_at_id "
+                f"ON {table} (created_at, id)"
+            )
+        )
+
+
+def _postgres_jsonb(conn: Connection) -> None:
+    """
+    Converts JSON columns of PostgreSQL databases created before the models
+    used JSONB. Noop on other backends, where the column type is unchanged.
+    """
+    if conn.dialect.name != "postgresql":
+        return
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        types = {column["name"]: column["type"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            current = types.get(column.name)
+            if (
+                column.type is JSONType
+                and isinstance(current, JSON)
+                and not isinstance(current, JSONB)
+            ):
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {table.name} ALTER COLUMN {column.name} "
+                        f"TYPE JSONB USING {column.name}::jsonb"
+                    )
+                )
+
+
+def _add_job_extraction_status(conn: Connection) -> None:
+    """
+    Adds ``processed_jobs.extraction_status``. It stays empty for existing
+    rows, whose origin is unknown, so they are no longer shared with new
+    duplicates.
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("processed_jobs")}
+    if "extraction_status" not in columns:
+        conn.execute(text("ALTER TABLE processed_jobs ADD COLUMN extraction_status VARCHAR"))
+
+
+def _add_resume_edited_at(conn: Connection) -> None:
+    """
+    Adds ``processed_resumes.edited_at``. Existing rows may have been edited
+    by hand and there is no telling which, so they are all marked edited
+    (at their last processing time) and no longer reused for duplicate uploads.
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("processed_resumes")}
+    if "edited_at" in columns:
+        return
+    column_type = ProcessedResume.__table__.c.edited_at.type.compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE processed_resumes ADD COLUMN edited_at {column_type}"))
+    conn.execute(text("UPDATE processed_resumes SET edited_at = processed_at"))
+
+
+# Applied in order, once per database. Steps must also be safe on a fresh
+# database, where ``create_all`` already created the tables in their new shape.
+MIGRATIONS: List[Tuple[str, Callable[[Connection], None]]] = [
+    ("0001_resume_hashes", _add_resume_hashes),
+    ("0002_rebuild_lexical_corpus", _rebuild_lexical_corpus),
+    ("0003_resume_processing_status", _add_resume_processing_status),
+    ("0004_native_processed_json", _native_processed_json),
+    ("0005_job_dedup", _merge_duplicate_jobs),
+    ("0006_listing_indexes", _add_listing_indexes),
+    ("0007_postgres_jsonb", _postgres_jsonb),
+    ("0008_job_extraction_status", _add_job_extraction_status),
+    ("0009_resume_edited_at", _add_resume_edited_at),
+]
+
+
+def run_migrations(conn: Connection) -> None:
+    """
+    Applies pending migrations and records them in ``schema_migrations``.
+
+    ``Base.metadata.create_all`` only creates missing tables; this brings
+    existing tables and data up to date. Meant to run in the same transaction
+    as ``create_all`` at startup, via ``conn.run_sync(run_migrations)``.
+    """
+    conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version VARCHAR PRIMARY KEY, "
+            "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+    )
+    applied = set(conn.execute(text("SELECT version FROM schema_migrations")).scalars())
+    for version, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        logger.info(f"Applying database migration {version}")
+        migrate(conn)
+        conn.execute(
+            text(
+                "INSERT INTO schema_migrations (version) VALUES (:version) "
+                "ON CONFLICT (version) DO NOTHING"
+            ),
+            {"version": version},
+        )
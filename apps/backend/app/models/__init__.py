@@ -2,6 +2,9 @@ from .base import Base
 from .resume import ProcessedResume, Resume
 from .user import User
 from .job import ProcessedJob, Job
+from .task import Task
+from .improvement import ImprovementResult
+from .lexical import CorpusTerm, CorpusStats
 from .association import job_resume_association
 
 __all__ = [
@@ -11,5 +14,9 @@ __all__ = [
     "ProcessedJob",
     "User",
     "Job",
+    "Task",
+    "ImprovementResult",
+    "CorpusTerm",
+    "CorpusStats",
     "job_resume_association",
 ]
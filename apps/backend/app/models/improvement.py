@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, DateTime, text
+
+from .base import Base
+from .types import JSONType
+
+
+class ImprovementResult(Base):
+    __tablename__ = "improvement_results"
+
+    # sha256 over resume/job content hashes, prompt versions and model ids
+    cache_key = Column(String, primary_key=True)
+    resume_id = Column(String, nullable=False, index=True)
+    job_id = Column(String, nullable=False, index=True)
+    execution = Column(JSONType, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        nullable=False,
+        index=True,
+    )
@@ -1,8 +1,8 @@
-from sqlalchemy.types import JSON
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, text
+from sqlalchemy import Column, Index, String, Text, Integer, ForeignKey, DateTime, text
 
 from .base import Base
+from .types import JSONType
 from .association import job_resume_association
 
 
@@ -16,16 +16,19 @@ class ProcessedJob(Base):
         index=True,
     )
     job_title = Column(String, nullable=False)
-    company_profile = Column(Text, nullable=True)
-    location = Column(String, nullable=True)
+    company_profile = Column(JSONType, nullable=True)
+    location = Column(JSONType, nullable=True)
     date_posted = Column(String, nullable=True)
     employment_type = Column(String, nullable=True)
     job_summary = Column(Text, nullable=False)
-    key_responsibilities = Column(JSON, nullable=True)
-    qualifications = Column(JSON, nullable=True)
-    compensation_and_benfits = Column(JSON, nullable=True)
-    application_info = Column(JSON, nullable=True)
-    extracted_keywords = Column(JSON, nullable=True)
+    key_responsibilities = Column(JSONType, nullable=True)
+    qualifications = Column(JSONType, nullable=True)
+    compensation_and_benfits = Column(JSONType, nullable=True)
+    application_info = Column(JSONType, nullable=True)
+    extracted_keywords = Column(JSONType, nullable=True)
+    # "processed" (LLM extraction) or "fallback" (keywords extracted from the
+    # text); only LLM extractions are shared with duplicate jobs
+    extraction_status = Column(String, nullable=True)
     processed_at = Column(
         DateTime(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),
@@ -48,11 +51,17 @@ class ProcessedJob(Base):
 
 class Job(Base):
     __tablename__ = "jobs"
+    # keyset pagination order of the list endpoints
+    __table_args__ = (Index("ix_jobs_created_at_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(String, unique=True, nullable=False)
     resume_id = Column(String, ForeignKey("resumes.resume_id"), nullable=False)
     content = Column(Text, nullable=False)
+    # sha256 of the whitespace-normalized text; jobs with the same text share
+    # the ProcessedJob of their canonical job instead of owning one
+    content_hash = Column(String, nullable=True, index=True)
+    canonical_job_id = Column(String, nullable=True, index=True)
     created_at = Column(
         DateTime(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),
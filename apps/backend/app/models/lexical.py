@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Integer
+
+from .base import Base
+
+
+class CorpusTerm(Base):
+    __tablename__ = "corpus_terms"
+
+    term = Column(String, primary_key=True)
+    # number of stored resumes/jobs containing the term at least once
+    document_frequency = Column(Integer, nullable=False, default=0)
+
+
+class CorpusStats(Base):
+    __tablename__ = "corpus_stats"
+
+    # single row (id = 1) holding corpus-wide totals for BM25
+    id = Column(Integer, primary_key=True)
+    document_count = Column(Integer, nullable=False, default=0)
+    total_length = Column(Integer, nullable=False, default=0)
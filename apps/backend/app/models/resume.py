@@ -1,8 +1,8 @@
-from sqlalchemy.types import JSON
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, DateTime, text
+from sqlalchemy import Column, Index, String, Integer, ForeignKey, Text, DateTime, text
 
 from .base import Base
+from .types import JSONType
 from .association import job_resume_association
 
 
@@ -15,20 +15,23 @@ class ProcessedResume(Base):
         primary_key=True,
         index=True,
     )
-    personal_data = Column(JSON, nullable=False)
-    experiences = Column(JSON, nullable=True)
-    projects = Column(JSON, nullable=True)
-    skills = Column(JSON, nullable=True)
-    research_work = Column(JSON, nullable=True)
-    achievements = Column(JSON, nullable=True)
-    education = Column(JSON, nullable=True)
-    extracted_keywords = Column(JSON, nullable=True)
+    personal_data = Column(JSONType, nullable=False)
+    experiences = Column(JSONType, nullable=True)
+    projects = Column(JSONType, nullable=True)
+    skills = Column(JSONType, nullable=True)
+    research_work = Column(JSONType, nullable=True)
+    achievements = Column(JSONType, nullable=True)
+    education = Column(JSONType, nullable=True)
+    extracted_keywords = Column(JSONType, nullable=True)
     processed_at = Column(
         DateTime(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),
         nullable=False,
         index=True,
     )
+    # set when the data is edited by hand; only unedited extractions are
+    # reused for duplicate uploads
+    edited_at = Column(DateTime(timezone=True), nullable=True)
 
     # owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     # owner = relationship("User", back_populates="processed_resumes")
@@ -43,11 +46,19 @@ class ProcessedResume(Base):
 
 class Resume(Base):
     __tablename__ = "resumes"
+    # keyset pagination order of the list endpoints
+    __table_args__ = (Index("ix_resumes_created_at_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     resume_id = Column(String, unique=True, nullable=False)
     content = Column(Text, nullable=False)
     content_type = Column(String, nullable=False)
+    # sha256 of the uploaded bytes and of the whitespace-normalized text, for upload deduplication
+    file_hash = Column(String, nullable=True, index=True)
+    content_hash = Column(String, nullable=True, index=True)
+    # structured extraction state: pending | processing | processed | failed
+    processing_status = Column(String, nullable=True)
+    processing_error = Column(Text, nullable=True)
     created_at = Column(
         DateTime(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),
@@ -0,0 +1,7 @@
+from sqlalchemy.types import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# JSON documents: JSONB on PostgreSQL (binary, indexable), plain JSON elsewhere.
+# Both read and write the same Python values, so models and queries are
+# unchanged across backends.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
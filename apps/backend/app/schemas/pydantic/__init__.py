@@ -1,4 +1,5 @@
 from .job import JobUploadRequest
+from .batch import ResumeBatchRequest, JobBatchRequest
 from .structured_job import StructuredJobModel
 from .resume_preview import ResumePreviewerModel
 from .structured_resume import StructuredResumeModel
@@ -7,6 +8,8 @@ from .resume_analysis import ResumeAnalysisModel
 
 __all__ = [
     "JobUploadRequest",
+    "ResumeBatchRequest",
+    "JobBatchRequest",
     "ResumePreviewerModel",
     "StructuredResumeModel",
     "StructuredJobModel",
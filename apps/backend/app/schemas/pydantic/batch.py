@@ -0,0 +1,22 @@
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
+
+MAX_BATCH_IDS = 500
+
+
+class ResumeBatchRequest(BaseModel):
+    resume_ids: List[str] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_IDS, description="IDs of the resumes to fetch"
+    )
+    fields: Optional[
+        List[Literal["raw_resume", "processing_status", "processing_error", "processed_resume"]]
+    ] = Field(None, description="Fields to return for each resume; all of them by default")
+
+
+class JobBatchRequest(BaseModel):
+    job_ids: List[str] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_IDS, description="IDs of the jobs to fetch"
+    )
+    fields: Optional[List[Literal["raw_job", "processed_job"]]] = Field(
+        None, description="Fields to return for each job; all of them by default"
+    )
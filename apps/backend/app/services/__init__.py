@@ -1,6 +1,11 @@
 from .job_service import JobService
 from .resume_service import ResumeService
 from .score_improvement_service import ScoreImprovementService
+from .task_queue import TaskQueue, task_queue
+from .document_converter import DocumentConverter, document_converter
+from .bulk_ingestion import BulkResumeIngestion
+from .job_ingestion import JobIngestion
+from .listing import RecordLister
 from .exceptions import (
     ResumeNotFoundError,
     ResumeParsingError,
@@ -9,11 +14,21 @@ from .exceptions import (
     JobParsingError,
     ResumeKeywordExtractionError,
     JobKeywordExtractionError,
+    PipelineStageTimeoutError,
+    TaskNotFoundError,
+    DocumentConversionTimeoutError,
+    InvalidListQueryError,
 )
 
 __all__ = [
     "JobService",
     "ResumeService",
+    "BulkResumeIngestion",
+    "JobIngestion",
+    "RecordLister",
+    "DocumentConverter",
+    "DocumentConversionTimeoutError",
+    "InvalidListQueryError",
     "JobParsingError",
     "JobNotFoundError",
     "ResumeParsingError",
@@ -21,5 +36,10 @@ __all__ = [
     "ResumeValidationError",
     "ResumeKeywordExtractionError",
     "JobKeywordExtractionError",
+    "PipelineStageTimeoutError",
     "ScoreImprovementService",
+    "TaskNotFoundError",
+    "TaskQueue",
+    "task_queue",
+    "document_converter",
 ]
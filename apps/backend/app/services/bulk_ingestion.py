@@ -0,0 +1,188 @@
+import os
+import shutil
+import logging
+import zipfile
+import tempfile
+
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import settings, AsyncSessionLocal
+from .pipeline import bounded_map
+from .resume_service import ResumeService
+
+logger = logging.getLogger(__name__)
+
+MAX_DOCUMENT_SIZE = 2 * 1024 * 1024
+
+# Uploads are copied to temporary files that stay in memory up to this size
+SPOOL_MAX_MEMORY = 1024 * 1024
+
+ZIP_CONTENT_TYPES = ("application/zip", "application/x-zip-compressed")
+
+CONTENT_TYPES_BY_EXTENSION = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+@dataclass
+class BulkDocument:
+    """
+    One resume of a bulk upload. ``read`` loads its bytes on demand, so
+    archive entries are only decompressed once a pipeline slot picks them up.
+    """
+
+    filename: str
+    content_type: Optional[str]
+    read: Callable[[], bytes]
+
+
+class BulkResumeIngestion:
+    """
+    Ingests many resumes (plain PDF/DOCX files and/or zip archives of them).
+
+    Every document goes through conversion, storage and structured
+    extraction via ``ResumeService``. Up to ``concurrency`` documents are in
+    flight at once, each with its own database session, and results are
+    reported per document as they complete.
+
+    ``collect`` copies the uploads into temporary files owned by the
+    ingestion, because the request's upload files may already be closed when
+    a streaming response runs ``ingest``. They are removed once ``ingest``
+    finishes, or by ``close`` if it never runs.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        concurrency: int = settings.BULK_UPLOAD_CONCURRENCY,
+        max_documents: int = settings.BULK_UPLOAD_MAX_FILES,
+    ) -> None:
+        self._session_factory = session_factory
+        self._concurrency = concurrency
+        self._max_documents = max_documents
+        self._spooled: List[BinaryIO] = []
+
+    def collect(self, uploads: List[Tuple[str, Optional[str], BinaryIO]]) -> List[BulkDocument]:
+        """
+        Lists the documents contained in the uploaded ``(filename, content_type, file)``
+        triples, expanding zip archives from their central directory.
+
+        Raises:
+            ValueError: If an archive cannot be read or there are too many documents
+        """
+        documents: List[BulkDocument] = []
+        try:
+            for filename, content_type, file in uploads:
+                if content_type in ZIP_CONTENT_TYPES or filename.lower().endswith(".zip"):
+                    documents.extend(self._archive_documents(filename, self._spool(file)))
+                else:
+                    # One byte over the limit is enough to reject the file later
+                    spooled = self._spool(file, MAX_DOCUMENT_SIZE + 1)
+                    documents.append(
+                        BulkDocument(
+                            filename=filename,
+                            content_type=content_type,
+                            read=lambda spooled=spooled: spooled.read(MAX_DOCUMENT_SIZE + 1),
+                        )
+                    )
+                if len(documents) > self._max_documents:
+                    raise ValueError(
+                        f"Bulk upload contains more than {self._max_documents} documents."
+                    )
+        except BaseException:
+            self.close()
+            raise
+        return documents
+
+    def _spool(self, file: BinaryIO, limit: Optional[int] = None) -> BinaryIO:
+        spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+        self._spooled.append(spooled)
+        if limit is None:
+            shutil.copyfileobj(file, spooled)
+        else:
+            spooled.write(file.read(limit))
+        spooled.seek(0)
+        return spooled
+
+    def close(self) -> None:
+        """
+        Removes the temporary copies of the uploads.
+        """
+        for spooled in self._spooled:
+            spooled.close()
+        self._spooled.clear()
+
+    @staticmethod
+    def _archive_documents(filename: str, file: BinaryIO) -> Iterator[BulkDocument]:
+        try:
+            archive = zipfile.ZipFile(file)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"{filename} is not a valid zip archive.") from e
+
+        for info in archive.infolist():
+            name = info.filename
+            basename = os.path.basename(name)
+            if info.is_dir() or name.startswith("__MACOSX/") or basename.startswith("."):
+                continue
+            extension = os.path.splitext(basename)[1].lower()
+
+            def read(info: zipfile.ZipInfo = info) -> bytes:
+                if info.file_size > MAX_DOCUMENT_SIZE:
+                    raise ValueError("File size exceeds maximum allowed size of 2.0MB.")
+                # The declared size can lie, so never decompress more than the limit allows
+                with archive.open(info) as entry:
+                    return entry.read(MAX_DOCUMENT_SIZE + 1)
+
+            yield BulkDocument(
+                filename=f"{filename}/{name}",
+                content_type=CONTENT_TYPES_BY_EXTENSION.get(extension),
+                read=read,
+            )
+
+    async def _ingest_one(self, document: BulkDocument) -> str:
+        if document.content_type not in CONTENT_TYPES_BY_EXTENSION.values():
+            raise ValueError("Invalid file type. Only PDF and DOCX files are allowed.")
+        file_bytes = document.read()
+        if not file_bytes:
+            raise ValueError("Empty file. Please upload a valid file.")
+        if len(file_bytes) > MAX_DOCUMENT_SIZE:
+            raise ValueError("File size exceeds maximum allowed size of 2.0MB.")
+
+        async with self._session_factory() as db:
+            return await ResumeService(db).convert_and_store_resume(
+                file_bytes=file_bytes,
+                file_type=document.content_type,
+                filename=document.filename,
+                content_type="md",
+            )
+
+    async def ingest(
+        self, documents: List[BulkDocument]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Processes the documents and yields one result per document in
+        completion order, then removes the temporary copies of the uploads.
+        """
+        try:
+            async for document, resume_id, error in bounded_map(
+                self._ingest_one, documents, self._concurrency
+            ):
+                if error is None:
+                    yield {
+                        "filename": document.filename,
+                        "status": "processed",
+                        "resume_id": resume_id,
+                    }
+                else:
+                    logger.warning(f"Bulk upload of {document.filename} failed: {error}")
+                    yield {
+                        "filename": document.filename,
+                        "status": "failed",
+                        "error": str(error),
+                    }
+        finally:
+            self.close()
@@ -0,0 +1,255 @@
+import io
+import os
+import asyncio
+import logging
+import tempfile
+import multiprocessing
+
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core import settings
+from .exceptions import DocumentConversionTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# One MarkItDown instance per worker process, created once when the worker starts
+_markitdown = None
+
+
+def _init_worker() -> None:
+    global _markitdown
+    from markitdown import MarkItDown
+
+    _markitdown = MarkItDown(enable_plugins=False)
+
+
+def _worker_main(conn: Connection) -> None:
+    """
+    Runs in a worker process: executes the calls received on ``conn`` one
+    at a time and sends back their outcome, until it receives None.
+    """
+    _init_worker()
+    while True:
+        call = conn.recv()
+        if call is None:
+            return
+        func, args = call
+        try:
+            conn.send((True, func(*args)))
+        except Exception as e:
+            # Exceptions are not always picklable, so only their type and message cross the process boundary
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+def _convert_from_path(file_bytes: bytes, extension: str) -> str:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as temp_file:
+        temp_file.write(file_bytes)
+        temp_path = temp_file.name
+
+    try:
+        return _markitdown.convert(temp_path).text_content
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _convert(file_bytes: bytes, extension: str, mimetype: Optional[str] = None) -> str:
+    from markitdown import StreamInfo, UnsupportedFormatException
+
+    try:
+        return _markitdown.convert_stream(
+            io.BytesIO(file_bytes),
+            stream_info=StreamInfo(extension=extension or None, mimetype=mimetype),
+        ).text_content
+    except UnsupportedFormatException:
+        # No converter accepted the in-memory stream; some only work from a file on disk
+        return _convert_from_path(file_bytes, extension)
+
+
+class _Worker:
+    """
+    A worker process and the parent's end of the pipe it is driven through.
+    """
+
+    def __init__(self) -> None:
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.get_context("spawn").Process(
+            target=_worker_main, args=(child_conn,), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def call(self, func: Callable[..., Any], args: tuple) -> tuple:
+        """
+        Blocks until the worker has run ``func(*args)``; returns ``(ok, result)``.
+        """
+        self.conn.send((func, args))
+        return self.conn.recv()
+
+    def kill(self) -> None:
+        # The pipe is left to be closed once nothing reads from it anymore
+        self.process.kill()
+        # Reap the process without blocking the event loop
+        asyncio.get_running_loop().run_in_executor(None, self.process.join)
+
+
+class DocumentConverter:
+    """
+    Converts uploaded documents to markdown in dedicated worker processes.
+
+    PDF/DOCX parsing is CPU-bound and would otherwise block the event loop
+    (and every open SSE stream) for the duration of a conversion. There is
+    one worker process per slot, started eagerly, keeping its MarkItDown
+    instance between files and running one conversion at a time. At most
+    ``workers`` conversions run at once; further requests wait for an idle
+    worker and are reported as ``queued`` by ``stats``.
+
+    Since each conversion owns its worker, one exceeding ``timeout`` seconds,
+    or whose caller is cancelled (e.g. a disconnected client), is stopped by
+    killing just that worker, which is then replaced. Other conversions are
+    not affected.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.CONVERTER_WORKERS,
+        timeout: float = settings.CONVERTER_TIMEOUT_SECONDS,
+    ) -> None:
+        self.workers = workers
+        self.timeout = timeout
+        # Idle workers; None wakes up callers waiting when the converter stops
+        self._idle: Optional[asyncio.Queue] = None
+        self._busy: List[_Worker] = []
+        self._running = 0
+        self._queued = 0
+
+    def start(self) -> None:
+        """
+        Starts the worker processes, if not already running.
+        """
+        if self._idle is not None:
+            return
+        self._idle = asyncio.Queue()
+        for _ in range(self.workers):
+            self._idle.put_nowait(_Worker())
+        logger.info(f"Document converter started with {self.workers} worker process(es)")
+
+    async def stop(self) -> None:
+        """
+        Shuts the worker processes down. Conversions that have not started are
+        dropped; running ones are given ``timeout`` seconds to finish.
+        """
+        idle, self._idle = self._idle, None
+        if idle is None:
+            return
+        workers = list(self._busy)
+        while not idle.empty():
+            worker = idle.get_nowait()
+            if worker is not None:
+                workers.append(worker)
+        idle.put_nowait(None)
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            await asyncio.to_thread(worker.process.join, self.timeout)
+            if worker.process.is_alive():
+                worker.kill()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "running": self._running,
+            "queued": self._queued,
+        }
+
+    async def _acquire(self) -> _Worker:
+        idle = self._idle
+        self._queued += 1
+        try:
+            worker = await idle.get()
+        finally:
+            self._queued -= 1
+        if worker is None:
+            idle.put_nowait(None)
+            raise RuntimeError("Document converter is stopped.")
+        if not worker.process.is_alive():
+            # Died while idle (e.g. killed by the OS): use a fresh one instead
+            worker = _Worker()
+        self._busy.append(worker)
+        return worker
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        self._busy.remove(worker)
+        if self._idle is None:
+            # Stopped meanwhile; healthy workers were already told to exit
+            if not healthy:
+                worker.kill()
+            return
+        if not healthy:
+            worker.kill()
+            worker = _Worker()
+        self._idle.put_nowait(worker)
+
+    async def _run(
+        self, func: Callable[..., Any], *args: Any, filename: Optional[str] = None
+    ) -> Any:
+        """
+        Runs ``func(*args)`` in an idle worker process and returns its result.
+        """
+        self.start()
+        worker = await self._acquire()
+        self._running += 1
+        healthy = False
+        try:
+            try:
+                ok, result = await asyncio.wait_for(
+                    asyncio.to_thread(worker.call, func, args), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Conversion of {filename or 'document'} timed out after {self.timeout}s; "
+                    f"restarting its worker"
+                )
+                raise DocumentConversionTimeoutError(
+                    filename=filename, timeout=self.timeout
+                ) from None
+            except (EOFError, OSError):
+                raise RuntimeError("Document conversion worker exited unexpectedly.") from None
+            healthy = True
+        finally:
+            self._running -= 1
+            # A worker left mid-call (timeout, cancellation, crash) is killed and replaced
+            self._release(worker, healthy)
+        if not ok:
+            raise RuntimeError(result)
+        return result
+
+    async def convert(
+        self,
+        file_bytes: bytes,
+        extension: str,
+        filename: Optional[str] = None,
+        mimetype: Optional[str] = None,
+    ) -> str:
+        """
+        Converts a document to markdown text.
+
+        The bytes are handed to MarkItDown as an in-memory stream with the
+        extension and MIME type as format hints; a temporary file is only
+        written when no converter accepts the stream. Cancelling the caller
+        stops the conversion, whether it is still waiting or already running.
+
+        Raises:
+            DocumentConversionTimeoutError: If the conversion exceeds the timeout
+            RuntimeError: If the converter fails, carrying the original error type and message
+        """
+        return await self._run(
+            _convert, file_bytes, extension, mimetype, filename=filename
+        )
+
+
+document_converter = DocumentConverter()
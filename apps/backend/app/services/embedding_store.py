@@ -0,0 +1,242 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+
+from functools import lru_cache
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+from app.core import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_DTYPES = {
+    "float32": np.float32,
+    "float16": np.float16,
+    "int8": np.int8,
+}
+
+_INITIAL_CAPACITY = 1024
+
+
+class EmbeddingStore:
+    """
+    Compact, memory-mapped store of embedding vectors keyed by string id.
+
+    Layout for a store at ``path``:
+
+    * ``path.meta.json`` - dimension and storage dtype, written once
+    * ``path.data``      - ``capacity x dim`` matrix in the storage dtype (memmap)
+    * ``path.scales``    - one float32 scale per row (``int8`` mode only)
+    * ``path.ids``       - append-only id log; line ``n`` is the id of row ``n``
+
+    Vectors are stored as float32, float16 (half the size) or int8 with a
+    symmetric per-row scale (a quarter of the size). Rows are read straight
+    from the mapped pages: ``float32`` reads are zero-copy views, the other
+    modes dequantize the single row requested. Because the data lives in the
+    OS page cache, every uvicorn worker mapping the same files shares one copy.
+    Writers in different processes are serialized with an advisory file lock
+    (single-process locking only where ``fcntl`` is unavailable).
+    """
+
+    def __init__(self, path: str, dtype: str = "float32"):
+        if dtype not in _DTYPES:
+            raise ValueError(f"Unsupported embedding store dtype '{dtype}'. Use one of: {', '.join(_DTYPES)}")
+        self.path = path
+        self.dtype = dtype
+        self.dim: Optional[int] = None
+        self._np_dtype = np.dtype(_DTYPES[dtype])
+        self._rows: Dict[str, int] = {}
+        self._ids_offset = 0
+        self._data: Optional[np.memmap] = None
+        self._scales: Optional[np.memmap] = None
+        self._thread_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._load_meta()
+
+    # ──────────────────────────────────────────────────────────────────────
+    # file handling
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _file(self, suffix: str) -> str:
+        return f"{self.path}.{suffix}"
+
+    def _load_meta(self) -> None:
+        if not os.path.exists(self._file("meta.json")):
+            return
+        with open(self._file("meta.json")) as f:
+            meta = json.load(f)
+        if meta["dtype"] != self.dtype:
+            raise ValueError(
+                f"Embedding store at {self.path} uses dtype '{meta['dtype']}', not '{self.dtype}'"
+            )
+        self.dim = meta["dim"]
+
+    def _write_meta(self, dim: int) -> None:
+        tmp = self._file("meta.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"dim": dim, "dtype": self.dtype}, f)
+        os.replace(tmp, self._file("meta.json"))
+        self.dim = dim
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self._file("lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _capacity(self) -> int:
+        if self._data is None:
+            return 0
+        return self._data.shape[0]
+
+    def _map(self) -> None:
+        """(Re)maps the data files at their current size."""
+        row_bytes = self.dim * self._np_dtype.itemsize
+        size = os.path.getsize(self._file("data")) if os.path.exists(self._file("data")) else 0
+        capacity = size // row_bytes
+        if capacity == 0:
+            self._data = self._scales = None
+            return
+        self._data = np.memmap(self._file("data"), dtype=self._np_dtype, mode="r+", shape=(capacity, self.dim))
+        if self.dtype == "int8":
+            self._scales = np.memmap(self._file("scales"), dtype=np.float32, mode="r+", shape=(capacity,))
+
+    def _grow(self, min_capacity: int) -> None:
+        capacity = max(self._capacity() * 2, _INITIAL_CAPACITY)
+        while capacity < min_capacity:
+            capacity *= 2
+        self._data = self._scales = None
+        for suffix, itemsize, width in (
+            ("data", self._np_dtype.itemsize, self.dim),
+            ("scales", 4, 1),
+        ):
+            if suffix == "scales" and self.dtype != "int8":
+                continue
+            with open(self._file(suffix), "ab") as f:
+                f.truncate(capacity * itemsize * width)
+        self._map()
+
+    def _refresh(self) -> None:
+        """Picks up rows appended by other processes since the last call."""
+        ids_file = self._file("ids")
+        if not os.path.exists(ids_file):
+            return
+        if self.dim is None:
+            self._load_meta()
+        if os.path.getsize(ids_file) <= self._ids_offset:
+            return
+        with open(ids_file, "rb") as f:
+            f.seek(self._ids_offset)
+            chunk = f.read()
+        # Ignore a trailing partial line that another writer is still appending
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        for line in complete.decode("utf-8").splitlines():
+            self._rows[line] = len(self._rows)
+        self._ids_offset += len(complete)
+        if len(self._rows) > self._capacity():
+            self._map()
+
+    # ──────────────────────────────────────────────────────────────────────
+    # public API
+    # ──────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        self._refresh()
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        self._refresh()
+        return key in self._rows
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Returns the vector stored under ``key`` as a read-only array, or None.
+        """
+        self._refresh()
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        vector = self._data[row]
+        if self.dtype == "float32":
+            vector = vector.view(np.ndarray)
+            vector.flags.writeable = False
+            return vector
+        if self.dtype == "float16":
+            return vector.astype(np.float32)
+        return vector.astype(np.float32) * self._scales[row]
+
+    def put(self, key: str, vector: Sequence[float]) -> None:
+        """
+        Stores ``vector`` under ``key``. Existing keys are left untouched.
+        """
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        with self._write_lock():
+            self._refresh()
+            if key in self._rows:
+                return
+            if self.dim is None:
+                self._write_meta(vector.shape[0])
+            if vector.shape[0] != self.dim:
+                logger.warning(
+                    f"Not storing embedding of dimension {vector.shape[0]} in store of dimension {self.dim}"
+                )
+                return
+
+            row = len(self._rows)
+            if row >= self._capacity():
+                self._grow(row + 1)
+
+            if self.dtype == "int8":
+                peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+                scale = peak / 127.0 if peak else 1.0
+                self._data[row] = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+                self._scales[row] = scale
+            else:
+                self._data[row] = vector.astype(self._np_dtype)
+
+            # The id is appended last so readers never see a row before its data
+            line = f"{key}\n".encode("utf-8")
+            with open(self._file("ids"), "ab") as f:
+                f.write(line)
+            self._rows[key] = row
+            self._ids_offset += len(line)
+
+    def flush(self) -> None:
+        if self._data is not None:
+            self._data.flush()
+        if self._scales is not None:
+            self._scales.flush()
+
+    @staticmethod
+    def make_key(text: str, model: Optional[str] = None) -> str:
+        model = model or f"{settings.EMBEDDING_PROVIDER}:{settings.EMBEDDING_MODEL}"
+        return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_embedding_store() -> Optional[EmbeddingStore]:
+    """
+    Returns the process-wide store configured by EMBEDDING_STORE_PATH, or None if disabled.
+    """
+    if not settings.EMBEDDING_STORE_PATH:
+        return None
+    return EmbeddingStore(settings.EMBEDDING_STORE_PATH, dtype=settings.EMBEDDING_STORE_DTYPE)
@@ -108,3 +108,66 @@ class JobKeywordExtractionError(Exception):
             message = "Job keyword extraction failed. Cannot improve resume without job requirements."
         super().__init__(message)
         self.job_id = job_id
+
+
+class PipelineStageTimeoutError(Exception):
+    """
+    Exception raised when a pipeline stage does not finish within its timeout.
+    """
+
+    def __init__(
+        self,
+        stage: Optional[str] = None,
+        timeout: Optional[float] = None,
+        message: Optional[str] = None,
+    ):
+        if stage and not message:
+            message = f"Pipeline stage '{stage}' timed out after {timeout} seconds."
+        elif not message:
+            message = "Pipeline stage timed out."
+        super().__init__(message)
+        self.stage = stage
+        self.timeout = timeout
+
+
+class TaskNotFoundError(Exception):
+    """
+    Exception raised when a background task is not found in the database.
+    """
+
+    def __init__(self, task_id: Optional[str] = None, message: Optional[str] = None):
+        if task_id and not message:
+            message = f"Task with ID {task_id} not found."
+        elif not message:
+            message = "Task not found."
+        super().__init__(message)
+        self.task_id = task_id
+
+
+class DocumentConversionTimeoutError(Exception):
+    """
+    Exception raised when converting an uploaded document takes too long.
+    """
+
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        timeout: Optional[float] = None,
+        message: Optional[str] = None,
+    ):
+        if filename and not message:
+            message = f"Conversion of {filename} did not finish within {timeout} seconds."
+        elif not message:
+            message = "Document conversion timed out."
+        super().__init__(message)
+        self.filename = filename
+        self.timeout = timeout
+
+
+class InvalidListQueryError(Exception):
+    """
+    Exception raised when a list request has a malformed cursor or unknown fields.
+    """
+
+    def __init__(self, message: Optional[str] = None):
+        super().__init__(message or "Invalid list query.")
@@ -0,0 +1,148 @@
+import json
+import logging
+
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, AsyncIterable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import settings, AsyncSessionLocal
+from .job_service import JobService
+from .pipeline import bounded_map
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobRecord:
+    """
+    One line of an NDJSON job feed: the posting, or why it could not be read.
+    """
+
+    line: int
+    record_id: Any = None
+    resume_id: Optional[str] = None
+    job_description: Optional[str] = None
+    error: Optional[str] = None
+
+
+class JobIngestion:
+    """
+    Ingests a stream of job postings in NDJSON format.
+
+    Each line is a JSON object with a ``job_description`` and the
+    ``resume_id`` it belongs to (or a default for the whole feed); an
+    optional ``id`` is echoed back in the result. Lines are parsed as the
+    body arrives, and at most ``concurrency`` postings are extracted and
+    stored at once, each through ``JobService`` with its own session. The
+    body is not read further while every slot is busy, so memory stays
+    constant whatever the size of the feed.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        concurrency: int = settings.JOB_INGEST_CONCURRENCY,
+        max_line_bytes: int = settings.JOB_INGEST_MAX_LINE_BYTES,
+    ) -> None:
+        self._session_factory = session_factory
+        self._concurrency = concurrency
+        self._max_line_bytes = max_line_bytes
+
+    async def read_records(
+        self, chunks: AsyncIterable[bytes], default_resume_id: Optional[str] = None
+    ) -> AsyncGenerator[JobRecord, None]:
+        """
+        Splits a byte stream into lines and parses them, skipping blank lines.
+        A line longer than ``max_line_bytes`` is reported and skipped without
+        being buffered.
+        """
+        buffer = bytearray()
+        line_number = 0
+        oversized = False
+        async for chunk in chunks:
+            start = 0
+            while True:
+                end = chunk.find(b"\n", start)
+                if end == -1:
+                    if not oversized:
+                        buffer += chunk[start:]
+                        if len(buffer) > self._max_line_bytes:
+                            oversized = True
+                            buffer.clear()
+                    break
+                line_number += 1
+                if oversized:
+                    oversized = False
+                    yield JobRecord(line=line_number, error="Line exceeds the maximum allowed size.")
+                else:
+                    buffer += chunk[start:end]
+                    if len(buffer) > self._max_line_bytes:
+                        yield JobRecord(line=line_number, error="Line exceeds the maximum allowed size.")
+                    elif buffer.strip():
+                        yield self._parse(line_number, bytes(buffer), default_resume_id)
+                buffer.clear()
+                start = end + 1
+
+        if oversized:
+            yield JobRecord(line=line_number + 1, error="Line exceeds the maximum allowed size.")
+        elif buffer.strip():
+            yield self._parse(line_number + 1, bytes(buffer), default_resume_id)
+
+    @staticmethod
+    def _parse(line: int, raw: bytes, default_resume_id: Optional[str]) -> JobRecord:
+        try:
+            data = json.loads(raw)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            return JobRecord(line=line, error=f"Invalid JSON: {e}")
+        if not isinstance(data, dict):
+            return JobRecord(line=line, error="Each line must be a JSON object.")
+
+        record = JobRecord(
+            line=line,
+            record_id=data.get("id"),
+            resume_id=data.get("resume_id") or default_resume_id,
+            job_description=data.get("job_description"),
+        )
+        if not isinstance(record.job_description, str) or not record.job_description.strip():
+            record.error = "job_description must be a non-empty string."
+        elif not record.resume_id:
+            record.error = "resume_id is required."
+        else:
+            record.resume_id = str(record.resume_id)
+        return record
+
+    async def _ingest_one(self, record: JobRecord) -> Dict[str, Any]:
+        if record.error:
+            raise ValueError(record.error)
+        async with self._session_factory() as db:
+            results = await JobService(db).create_and_store_jobs(
+                {"resume_id": record.resume_id, "job_descriptions": [record.job_description]}
+            )
+        return results[0]
+
+    async def ingest(
+        self, chunks: AsyncIterable[bytes], default_resume_id: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Processes the feed and yields one result per posting in completion order.
+        """
+        async for record, result, error in bounded_map(
+            self._ingest_one,
+            self.read_records(chunks, default_resume_id),
+            self._concurrency,
+        ):
+            outcome: Dict[str, Any] = {"line": record.line}
+            if record.record_id is not None:
+                outcome["id"] = record.record_id
+            if error is None:
+                outcome["status"] = result["status"]
+                if result.get("job_id"):
+                    outcome["job_id"] = result["job_id"]
+                if result.get("error"):
+                    outcome["error"] = result["error"]
+            else:
+                if not record.error:
+                    logger.warning(f"Ingestion of job feed line {record.line} failed: {error}")
+                outcome.update(status="failed", error=str(error))
+            yield outcome
@@ -3,20 +3,31 @@ import json
 import logging
 import re
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from pydantic import ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import settings, release_connection
 from app.agent import AgentManager
 from app.prompt import prompt_factory
 from app.schemas.json import json_schema_factory
 from app.models import Job, Resume, ProcessedJob
 from app.schemas.pydantic import StructuredJobModel
+from .loader import RecordLoader
+from .pipeline import bounded_map
+from .keyword_extractor import extract_keywords
+from .skill_matcher import resolve_keywords
+from .serializers import processed_job_values, processed_job_to_dict
+from .lexical_scorer import LexicalIndex
+from .resume_service import content_hash
 from .exceptions import JobNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Top-level fields of a job as returned by the read endpoints
+JOB_RECORD_FIELDS = ("raw_job", "processed_job")
+
 
 class JobService:
     def __init__(self, db: AsyncSession):
@@ -64,92 +75,13 @@ class JobService:
         """
         Extract keywords from job description using dynamic text analysis.
         All keywords are extracted from the actual text - NO hardcoded keywords.
-        
-        Uses multiple extraction strategies:
-        1. Capitalized terms (likely proper nouns, technologies)
-        2. Quoted terms (explicitly important)
-        3. Noun phrases from requirements/qualifications sections
-        4. Terms following key indicators (experience with, knowledge of, etc.)
+        See ``keyword_extractor.extract_keywords`` for the strategies used.
         """
         if not text or len(text.strip()) < 10:
             logger.warning("Text too short for keyword extraction")
             return []
-        
-        keywords = set()
-        
-        # Strategy 1: Extract capitalized words/phrases (2+ chars)
-        # These are often technologies, frameworks, companies, acronyms
-        capitalized_pattern = r'\b[A-Z][A-Za-z0-9]*(?:[.\-/][A-Za-z0-9]+)*\b'
-        capitalized_matches = re.findall(capitalized_pattern, text)
-        for match in capitalized_matches:
-            if len(match) >= 2 and match not in ['The', 'A', 'An', 'In', 'On', 'At', 'To', 'For', 'And', 'Or', 'But', 'If', 'Our', 'We', 'You', 'Your', 'This', 'That', 'These', 'Those']:
-                keywords.add(match)
-        
-        # Strategy 2: Extract quoted terms
-        quoted_pattern = r'["\']([^"\']+)["\']'
-        quoted_matches = re.findall(quoted_pattern, text)
-        for match in quoted_matches:
-            if 2 <= len(match) <= 50:
-                keywords.add(match.strip())
-        
-        # Strategy 3: Extract terms after key phrases (experience with, knowledge of, etc.)
-        key_phrases = [
-            r'experience (?:with|in|using)\s+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n|and|or|\bfor\b)',
-            r'knowledge of\s+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n|and|or)',
-            r'proficiency in\s+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n|and|or)',
-            r'familiar(?:ity)? with\s+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n|and|or)',
-            r'skills?(?:\s+in)?[:\s]+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n{2})',
-            r'(?:requires?|required)[:\s]+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n{2})',
-        ]
-        
-        for pattern in key_phrases:
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                phrase = match.group(1).strip()
-                # Split by common separators
-                items = re.split(r'\s*[,;/]\s*|\s+and\s+|\s+or\s+', phrase)
-                for item in items:
-                    item = item.strip()
-                    if 2 <= len(item) <= 50:
-                        keywords.add(item)
-        
-        # Strategy 4: Extract degree mentions with context
-        degree_pattern = r"(Bachelor'?s?|Master'?s?|PhD|Doctorate|BSc|MSc|BA|MA|B\.S\.|M\.S\.)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+?)(?:\.|,|or|\n)"
-        degree_matches = re.finditer(degree_pattern, text, re.IGNORECASE)
-        for match in degree_matches:
-            degree_type = match.group(1).strip()
-            field = match.group(2).strip() if match.group(2) else ''
-            if degree_type:
-                keywords.add(degree_type)
-            if field and len(field) > 2:
-                keywords.add(field.strip())
-        
-        # Strategy 5: Extract year requirements
-        year_pattern = r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)?'
-        year_matches = re.finditer(year_pattern, text, re.IGNORECASE)
-        for match in year_matches:
-            keywords.add(f"{match.group(1)}+ years")
-        
-        # Strategy 6: Extract hyphenated technical terms
-        hyphenated_pattern = r'\b[A-Za-z]+-[A-Za-z]+(?:-[A-Za-z]+)*\b'
-        hyphenated_matches = re.findall(hyphenated_pattern, text)
-        for match in hyphenated_matches:
-            if len(match) >= 5:
-                keywords.add(match)
-        
-        # Clean and filter keywords
-        filtered_keywords = set()
-        for keyword in keywords:
-            # Remove very short or very long keywords
-            if 2 <= len(keyword) <= 50:
-                # Remove pure numbers
-                if not keyword.isdigit():
-                    # Remove common words that aren't useful
-                    if keyword.lower() not in ['will', 'can', 'may', 'must', 'should', 'would', 'could', 'shall', 'need', 'able', 'have', 'has', 'had', 'get', 'got', 'make', 'made']:
-                        filtered_keywords.add(keyword.strip())
-        
-        # Convert to sorted list and limit
-        result = sorted(list(filtered_keywords))[:100]  # Increase limit to 100
+
+        result = extract_keywords(text)
         logger.info(f"Dynamic keyword extraction found {len(result)} keywords from text")
         if result:
             logger.debug(f"Sample keywords: {result[:10]}")
@@ -159,6 +91,25 @@ class JobService:
         """
         Stores job data in the database and returns a list of job IDs.
         """
+        results = await self.create_and_store_jobs(job_data)
+        return [result["job_id"] for result in results if result["status"] != "failed"]
+
+    async def create_and_store_jobs(self, job_data: dict) -> List[Dict[str, Any]]:
+        """
+        Stores every job description of ``job_data`` and reports the outcome per JD.
+
+        Structured extraction runs for up to JOB_EXTRACTION_CONCURRENCY JDs at a
+        time; all jobs are then inserted together in a single commit. With
+        JOB_DEDUP_MODE ``share``, a JD whose normalized text matches an earlier
+        job (stored before, or earlier in the same request) is not extracted
+        again: its job points at that job via ``canonical_job_id`` and shares
+        its ProcessedJob. Only LLM extractions are shared; a duplicate of a JD
+        that fell back gets its own copy of the fallback data. Results are in request order, with ``status``
+        ``processed`` (LLM extraction), ``fallback`` (keywords extracted from
+        the text), ``shared`` (processed data of a duplicate) or ``failed``
+        (not stored, see ``error``, and ``error_type``: ``validation`` when the
+        extracted data was invalid, ``processing`` otherwise).
+        """
         resume_id = str(job_data.get("resume_id"))
 
         if not await self._is_resume_available(resume_id):
@@ -166,24 +117,115 @@ class JobService:
                 f"resume corresponding to resume_id: {resume_id} not found"
             )
 
-        job_ids = []
-        for job_description in job_data.get("job_descriptions", []):
-            job_id = str(uuid.uuid4())
-            job = Job(
-                job_id=job_id,
-                resume_id=str(resume_id),
-                content=job_description,
-            )
-            self.db.add(job)
+        job_descriptions = [
+            (str(uuid.uuid4()), job_description)
+            for job_description in job_data.get("job_descriptions", [])
+        ]
+        hashes = {job_id: content_hash(text) for job_id, text in job_descriptions}
 
-            await self._extract_and_store_structured_job(
-                job_id=job_id, job_description_text=job_description
+        # Job owning the processed data of each JD: itself, or an earlier duplicate
+        dedup = settings.JOB_DEDUP_MODE == "share"
+        owners = await self._find_processed_jobs(hashes.values()) if dedup else {}
+        owner_of: Dict[str, str] = {}
+        to_extract = []
+        for job_id, job_description in job_descriptions:
+            owner = owners.get(hashes[job_id]) if dedup else None
+            if owner is None:
+                owner = owners[hashes[job_id]] = job_id
+                to_extract.append((job_id, job_description))
+            owner_of[job_id] = owner
+
+        # No connection is held during extraction; jobs are stored afterwards
+        await release_connection(self.db)
+        extracted: Dict[str, Any] = {}
+        async for (job_id, _), outcome, error in bounded_map(
+            lambda item: self._build_processed_job(*item),
+            to_extract,
+            settings.JOB_EXTRACTION_CONCURRENCY,
+        ):
+            extracted[job_id] = error or outcome
+
+        results = []
+        stored_descriptions = []
+        for index, (job_id, job_description) in enumerate(job_descriptions):
+            owner = owner_of[job_id]
+            outcome = extracted.get(owner)
+            if isinstance(outcome, Exception):
+                logger.error(f"Processing of job description {index} failed: {outcome}")
+                results.append(
+                    {
+                        "index": index,
+                        "job_id": None,
+                        "status": "failed",
+                        "error": str(outcome),
+                        "error_type": (
+                            "validation" if isinstance(outcome, ValidationError) else "processing"
+                        ),
+                    }
+                )
+                continue
+            if owner == job_id:
+                processed_job, status = outcome
+            elif outcome is not None and outcome[1] == "fallback":
+                # Fallback data is never shared: the duplicate gets its own copy
+                processed_job = self._copy_processed_job(outcome[0], job_id)
+                status = "fallback"
+                owner = job_id
+            else:
+                logger.info(f"Job description {index} duplicates job {owner}; sharing its processed data")
+                processed_job, status = None, "shared"
+            self.db.add(
+                Job(
+                    job_id=job_id,
+                    resume_id=resume_id,
+                    content=job_description,
+                    content_hash=hashes[job_id],
+                    canonical_job_id=owner if owner != job_id else None,
+                )
             )
+            if processed_job is not None:
+                self.db.add(processed_job)
+            stored_descriptions.append(job_description)
             logger.info(f"Job ID: {job_id}")
-            job_ids.append(job_id)
+            results.append({"index": index, "job_id": job_id, "status": status})
 
+        await LexicalIndex(self.db).add_documents(stored_descriptions)
         await self.db.commit()
-        return job_ids
+        return results
+
+    async def _find_processed_jobs(self, hashes: Iterable[str]) -> Dict[str, str]:
+        """
+        Maps content hashes to the oldest stored job with that hash owning a
+        ProcessedJob from the LLM. Fallback extractions are not shared, so a
+        duplicate of such a job gets the LLM extraction retried.
+        """
+        rows = await self.db.execute(
+            select(Job.content_hash, Job.job_id)
+            .join(ProcessedJob, ProcessedJob.job_id == Job.job_id)
+            .where(
+                Job.content_hash.in_(set(hashes)),
+                ProcessedJob.extraction_status == "processed",
+            )
+            .order_by(Job.created_at, Job.id)
+        )
+        owners: Dict[str, str] = {}
+        for text_hash, job_id in rows:
+            owners.setdefault(text_hash, job_id)
+        return owners
+
+    @staticmethod
+    def _copy_processed_job(processed_job: ProcessedJob, job_id: str) -> ProcessedJob:
+        """
+        Returns a (not yet added) copy of ``processed_job`` owned by ``job_id``.
+        """
+        return ProcessedJob(
+            job_id=job_id,
+            **{
+                column.key: getattr(processed_job, column.key)
+                for column in ProcessedJob.__table__.columns
+                if column.key not in ("job_id", "processed_at")
+            },
+        )
 
     async def _is_resume_available(self, resume_id: str) -> bool:
         """
@@ -193,17 +235,20 @@ class JobService:
         result = await self.db.scalar(query)
         return result is not None
 
-    async def _extract_and_store_structured_job(
-        self, job_id, job_description_text: str
-    ):
+    async def _build_processed_job(
+        self, job_id: str, job_description_text: str
+    ) -> Tuple[ProcessedJob, str]:
         """
-        extract and store structured job data in the database
+        extract structured job data and build its (not yet added) ProcessedJob,
+        along with whether it came from the LLM or the fallback extraction
         """
         structured_job = await self._extract_structured_json(job_description_text)
         if not structured_job:
             logger.error(f"Structured job extraction failed for job_id: {job_id}")
             # 使用动态文本分析提取关键词
-            fallback_keywords = self._extract_fallback_keywords(job_description_text)
+            fallback_keywords = resolve_keywords(
+                job_description_text, None
+            ) or self._extract_fallback_keywords(job_description_text)
             
             if not fallback_keywords:
                 logger.error(f"Dynamic keyword extraction found no keywords for job_id: {job_id}")
@@ -217,20 +262,20 @@ class JobService:
                 job_id=job_id,
                 job_title=dynamic_title,
                 job_summary=job_description_text[:500] + "..." if len(job_description_text) > 500 else job_description_text,
-                extracted_keywords=json.dumps({"extracted_keywords": fallback_keywords})
+                extracted_keywords=fallback_keywords or None,
+                extraction_status="fallback",
             )
-            self.db.add(processed_job)
-            await self.db.flush()
-            await self.db.commit()
             
             if fallback_keywords:
                 logger.info(f"Created fallback ProcessedJob with {len(fallback_keywords)} extracted keywords for job_id: {job_id}")
             else:
                 logger.warning(f"Created ProcessedJob with NO keywords for job_id: {job_id} - resume improvement may fail")
-            return job_id
+            return processed_job, "fallback"
 
         # 检查并确保关键词不为空
-        extracted_keywords = structured_job.get("extracted_keywords", [])
+        extracted_keywords = resolve_keywords(
+            job_description_text, structured_job.get("extracted_keywords")
+        )
         if not extracted_keywords or len(extracted_keywords) == 0:
             logger.warning(f"AI parsing succeeded but no keywords extracted for job_id: {job_id}, using dynamic extraction")
             extracted_keywords = self._extract_fallback_keywords(job_description_text)
@@ -242,42 +287,13 @@ class JobService:
         
         processed_job = ProcessedJob(
             job_id=job_id,
-            job_title=structured_job.get("job_title"),
-            company_profile=json.dumps(structured_job.get("company_profile"))
-            if structured_job.get("company_profile")
-            else None,
-            location=json.dumps(structured_job.get("location"))
-            if structured_job.get("location")
-            else None,
-            date_posted=structured_job.get("date_posted"),
-            employment_type=structured_job.get("employment_type"),
-            job_summary=structured_job.get("job_summary"),
-            key_responsibilities=json.dumps(
-                {"key_responsibilities": structured_job.get("key_responsibilities", [])}
-            )
-            if structured_job.get("key_responsibilities")
-            else None,
-            qualifications=json.dumps(structured_job.get("qualifications", []))
-            if structured_job.get("qualifications")
-            else None,
-            compensation_and_benfits=json.dumps(
-                structured_job.get("compensation_and_benfits", [])
-            )
-            if structured_job.get("compensation_and_benfits")
-            else None,
-            application_info=json.dumps(structured_job.get("application_info", []))
-            if structured_job.get("application_info")
-            else None,
-            extracted_keywords=json.dumps(
-                {"extracted_keywords": extracted_keywords}
+            **processed_job_values(
+                {**structured_job, "extracted_keywords": extracted_keywords}
             ),
+            extraction_status="processed",
         )
 
-        self.db.add(processed_job)
-        await self.db.flush()
-        await self.db.commit()
-
-        return job_id
+        return processed_job, "processed"
 
     async def _extract_structured_json(
         self, job_description_text: str
@@ -328,42 +344,53 @@ class JobService:
         Raises:
             JobNotFoundError: If the job is not found
         """
-        job_query = select(Job).where(Job.job_id == job_id)
-        job_result = await self.db.execute(job_query)
-        job = job_result.scalars().first()
-
-        if not job:
+        record = await RecordLoader(self.db).job(job_id)
+        if not record:
             raise JobNotFoundError(job_id=job_id)
+        return self._combine(*record)
+
+    async def get_jobs_with_processed_data(
+        self, job_ids: List[str], fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetches many jobs at once, in the shape of ``get_job_with_processed_data``.
 
-        processed_query = select(ProcessedJob).where(ProcessedJob.job_id == job_id)
-        processed_result = await self.db.execute(processed_query)
-        processed_job = processed_result.scalars().first()
+        Args:
+            job_ids: The IDs of the jobs to retrieve
+            fields: The top-level fields to return besides ``job_id``
+                (``JOB_RECORD_FIELDS``); all of them by default
+
+        Returns:
+            ``{"items": {job_id: data}, "missing": [job_id, ...]}``
+        """
+        fields = fields or list(JOB_RECORD_FIELDS)
+        job_ids = list(dict.fromkeys(job_ids))
+        records = await RecordLoader(self.db).jobs(job_ids, processed="processed_job" in fields)
+        return {
+            "items": {
+                job_id: self._combine(*records[job_id], fields=fields)
+                for job_id in job_ids
+                if job_id in records
+            },
+            "missing": [job_id for job_id in job_ids if job_id not in records],
+        }
 
-        combined_data = {
-            "job_id": job.job_id,
-            "raw_job": {
+    @staticmethod
+    def _combine(
+        job: Job,
+        processed_job: Optional[ProcessedJob],
+        fields: Iterable[str] = JOB_RECORD_FIELDS,
+    ) -> Dict[str, Any]:
+        combined_data: Dict[str, Any] = {"job_id": job.job_id}
+        if "raw_job" in fields:
+            combined_data["raw_job"] = {
                 "id": job.id,
                 "resume_id": job.resume_id,
                 "content": job.content,
                 "created_at": job.created_at.isoformat() if job.created_at else None,
-            },
-            "processed_job": None
-        }
-
-        if processed_job:
-            combined_data["processed_job"] = {
-                "job_title": processed_job.job_title,
-                "company_profile": json.loads(processed_job.company_profile) if processed_job.company_profile else None,
-                "location": json.loads(processed_job.location) if processed_job.location else None,
-                "date_posted": processed_job.date_posted,
-                "employment_type": processed_job.employment_type,
-                "job_summary": processed_job.job_summary,
-                "key_responsibilities": json.loads(processed_job.key_responsibilities).get("key_responsibilities", []) if processed_job.key_responsibilities else None,
-                "qualifications": json.loads(processed_job.qualifications).get("qualifications", []) if processed_job.qualifications else None,
-                "compensation_and_benfits": json.loads(processed_job.compensation_and_benfits).get("compensation_and_benfits", []) if processed_job.compensation_and_benfits else None,
-                "application_info": json.loads(processed_job.application_info).get("application_info", []) if processed_job.application_info else None,
-                "extracted_keywords": json.loads(processed_job.extracted_keywords).get("extracted_keywords", []) if processed_job.extracted_keywords else None,
-                "processed_at": processed_job.processed_at.isoformat() if processed_job.processed_at else None,
             }
-
+        if "processed_job" in fields:
+            combined_data["processed_job"] = (
+                processed_job_to_dict(processed_job) if processed_job else None
+            )
         return combined_data
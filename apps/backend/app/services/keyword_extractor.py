@@ -0,0 +1,116 @@
+import re
+
+from typing import List
+
+_PHRASE_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Strategies whose matches start with a fixed word: (trigger, pattern). A pass
+# is skipped outright when its trigger does not occur in the text.
+_KEY_PHRASES = (
+    (
+        "experience",
+        re.compile(
+            r"experience (?:with|in|using)\s+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n|and|or|\bfor\b)",
+            _PHRASE_FLAGS,
+        ),
+    ),
+    (
+        "knowledge",
+        re.compile(r"knowledge of\s+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n|and|or)", _PHRASE_FLAGS),
+    ),
+    (
+        "proficiency",
+        re.compile(r"proficiency in\s+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n|and|or)", _PHRASE_FLAGS),
+    ),
+    (
+        "familiar",
+        re.compile(
+            r"familiar(?:ity)? with\s+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n|and|or)", _PHRASE_FLAGS
+        ),
+    ),
+    (
+        "skill",
+        re.compile(r"skills?(?:\s+in)?[:\s]+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n{2})", _PHRASE_FLAGS),
+    ),
+    (
+        "require",
+        re.compile(
+            r"(?:requires?|required)[:\s]+([A-Za-z0-9\s,/\-\.]+?)(?:\.|,|\n{2})", _PHRASE_FLAGS
+        ),
+    ),
+)
+_QUOTED = re.compile(r"""["']([^"']+)["']""")
+_DEGREE = re.compile(
+    r"(Bachelor'?s?|Master'?s?|PhD|Doctorate|BSc|MSc|BA|MA|B\.S\.|M\.S\.)\s*(?:degree)?\s*(?:in)?\s*([A-Za-z\s]+?)(?:\.|,|or|\n)",
+    re.IGNORECASE,
+)
+_YEARS = re.compile(r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)?", re.IGNORECASE)
+_CAPITALIZED = re.compile(r"\b[A-Z][A-Za-z0-9]*(?:[.\-/][A-Za-z0-9]+)*\b")
+_HYPHENATED = re.compile(r"\b[A-Za-z]+-[A-Za-z]+(?:-[A-Za-z]+)*\b")
+_ITEM_SEPARATORS = re.compile(r"\s*[,;/]\s*|\s+and\s+|\s+or\s+")
+
+_CAPITALIZED_STOPWORDS = frozenset(
+    {
+        "The", "A", "An", "In", "On", "At", "To", "For", "And", "Or", "But",
+        "If", "Our", "We", "You", "Your", "This", "That", "These", "Those",
+    }
+)
+_STOPWORDS = frozenset(
+    {
+        "will", "can", "may", "must", "should", "would", "could", "shall",
+        "need", "able", "have", "has", "had", "get", "got", "make", "made",
+    }
+)
+
+MAX_KEYWORDS = 100
+
+
+def extract_keywords(text: str) -> List[str]:
+    """
+    Extracts keywords from a job description using text analysis only.
+
+    Collects capitalized terms (technologies, frameworks, acronyms), quoted
+    terms, items listed after phrases such as "experience with" or
+    "knowledge of", degrees and their field, year requirements and
+    hyphenated terms. Returns at most ``MAX_KEYWORDS`` keywords, sorted.
+    """
+    keywords = {
+        match
+        for match in _CAPITALIZED.findall(text)
+        if len(match) >= 2 and match not in _CAPITALIZED_STOPWORDS
+    }
+
+    if '"' in text or "'" in text:
+        keywords.update(
+            match.strip() for match in _QUOTED.findall(text) if 2 <= len(match) <= 50
+        )
+
+    folded = text.casefold()
+    for trigger, pattern in _KEY_PHRASES:
+        if trigger not in folded:
+            continue
+        for phrase in pattern.findall(text):
+            for item in _ITEM_SEPARATORS.split(phrase.strip()):
+                item = item.strip()
+                if 2 <= len(item) <= 50:
+                    keywords.add(item)
+
+    for degree_type, field in _DEGREE.findall(text):
+        keywords.add(degree_type.strip())
+        field = field.strip()
+        if len(field) > 2:
+            keywords.add(field)
+
+    keywords.update(f"{years}+ years" for years in _YEARS.findall(text))
+
+    if "-" in text:
+        keywords.update(match for match in _HYPHENATED.findall(text) if len(match) >= 5)
+
+    filtered = {
+        keyword.strip()
+        for keyword in keywords
+        if 2 <= len(keyword) <= 50
+        and not keyword.isdigit()
+        and keyword.lower() not in _STOPWORDS
+    }
+    return sorted(filtered)[:MAX_KEYWORDS]
@@ -0,0 +1,214 @@
+import re
+import math
+import heapq
+import logging
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CorpusTerm, CorpusStats
+
+logger = logging.getLogger(__name__)
+
+# Keeps technical tokens such as "c++", "c#", "node.js" and "ci/cd" intact
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset(
+    (
+        "a an and are as at be by for from has have in is it its of on or that the "
+        "this to was were will with we you your our they their i me my"
+    ).split()
+)
+
+# BM25 parameters (Robertson/Sparck Jones defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_UPSERT_CHUNK = 500
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercases and splits text into terms, dropping stopwords.
+    """
+    if not text:
+        return []
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+@dataclass
+class CorpusSnapshot:
+    """
+    The corpus statistics needed to score a set of query terms.
+    """
+
+    document_count: int = 0
+    average_length: float = 0.0
+    document_frequencies: Dict[str, int] = field(default_factory=dict)
+
+    def idf(self, term: str) -> float:
+        df = self.document_frequencies.get(term, 0)
+        n = self.document_count
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+
+class LexicalIndex:
+    """
+    Corpus-level document frequency table, maintained incrementally as
+    resumes and jobs are stored.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _insert(self):
+        dialect = self.db.get_bind().dialect.name
+        return postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+    async def add_documents(self, texts: Iterable[str]) -> None:
+        """
+        Adds documents to the corpus statistics. The caller is responsible for committing.
+        """
+        frequencies: Counter = Counter()
+        document_count = total_length = 0
+        for text in texts:
+            tokens = tokenize(text)
+            frequencies.update(set(tokens))
+            document_count += 1
+            total_length += len(tokens)
+
+        if not document_count:
+            return
+
+        # Concurrent transactions lock rows in the same order, terms by name
+        # and the single totals row last, so they queue instead of deadlocking
+        insert = self._insert()
+        rows = [
+            {"term": t, "document_frequency": frequencies[t]} for t in sorted(frequencies)
+        ]
+        for start in range(0, len(rows), _UPSERT_CHUNK):
+            stmt = insert(CorpusTerm).values(rows[start : start + _UPSERT_CHUNK])
+            await self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[CorpusTerm.term],
+                    set_={
+                        "document_frequency": CorpusTerm.document_frequency
+                        + stmt.excluded.document_frequency
+                    },
+                )
+            )
+
+        stmt = insert(CorpusStats).values(
+            id=1, document_count=document_count, total_length=total_length
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[CorpusStats.id],
+                set_={
+                    "document_count": CorpusStats.document_count
+                    + stmt.excluded.document_count,
+                    "total_length": CorpusStats.total_length + stmt.excluded.total_length,
+                },
+            )
+        )
+
+    async def add_document(self, text: str) -> None:
+        await self.add_documents([text])
+
+    async def snapshot(self, terms: Iterable[str]) -> CorpusSnapshot:
+        """
+        Loads the corpus totals and the document frequencies of the given terms.
+        """
+        terms = list(set(terms))
+        stats = await self.db.scalar(select(CorpusStats).where(CorpusStats.id == 1))
+        frequencies: Dict[str, int] = {}
+        if terms:
+            result = await self.db.execute(
+                select(CorpusTerm.term, CorpusTerm.document_frequency).where(
+                    CorpusTerm.term.in_(terms)
+                )
+            )
+            frequencies = dict(result.all())
+
+        if not stats or not stats.document_count:
+            return CorpusSnapshot(document_frequencies=frequencies)
+        return CorpusSnapshot(
+            document_count=stats.document_count,
+            average_length=stats.total_length / stats.document_count,
+            document_frequencies=frequencies,
+        )
+
+
+class LexicalScorer:
+    """
+    Cheap keyword-based match scoring between job keywords and resume text.
+
+    * ``bm25`` - Okapi BM25 of the keyword terms against the resume, using the
+      corpus IDF table; ``bm25_normalized`` divides it by its upper bound so it
+      falls in [0, 1]
+    * ``keyword_coverage`` - share of the job keywords whose terms all occur in
+      the resume
+    """
+
+    @staticmethod
+    def query_terms(keywords: Sequence[str]) -> List[str]:
+        return list(dict.fromkeys(t for kw in keywords for t in tokenize(kw)))
+
+    @staticmethod
+    def score(keywords: Sequence[str], text: str, corpus: CorpusSnapshot) -> Dict:
+        tokens = tokenize(text)
+        term_counts = Counter(tokens)
+        doc_length = len(tokens)
+        average_length = corpus.average_length or float(doc_length) or 1.0
+        length_norm = 1.0 - BM25_B + BM25_B * doc_length / average_length
+
+        bm25 = upper_bound = 0.0
+        for term in LexicalScorer.query_terms(keywords):
+            idf = corpus.idf(term)
+            upper_bound += idf * (BM25_K1 + 1.0)
+            tf = term_counts.get(term, 0)
+            if tf:
+                bm25 += idf * tf * (BM25_K1 + 1.0) / (tf + BM25_K1 * length_norm)
+
+        matched, missing = [], []
+        for keyword in keywords:
+            keyword_terms = tokenize(keyword)
+            if keyword_terms and all(t in term_counts for t in keyword_terms):
+                matched.append(keyword)
+            else:
+                missing.append(keyword)
+
+        return {
+            "bm25": bm25,
+            "bm25_normalized": bm25 / upper_bound if upper_bound else 0.0,
+            "keyword_coverage": len(matched) / len(keywords) if keywords else 0.0,
+            "matched_keywords": matched,
+            "missing_keywords": missing,
+        }
+
+    @staticmethod
+    def rank(
+        keywords: Sequence[str],
+        documents: Iterable[Tuple[str, str]],
+        corpus: CorpusSnapshot,
+        limit: int,
+        min_coverage: float = 0.0,
+    ) -> List[Tuple[str, Dict]]:
+        """
+        Scores ``(document_id, text)`` pairs and returns the ``limit`` best by
+        BM25, skipping documents whose keyword coverage is below ``min_coverage``.
+        """
+        scored = (
+            (document_id, LexicalScorer.score(keywords, text, corpus))
+            for document_id, text in documents
+        )
+        return heapq.nlargest(
+            limit,
+            (item for item in scored if item[1]["keyword_coverage"] >= min_coverage),
+            key=lambda item: item[1]["bm25"],
+        )
@@ -0,0 +1,239 @@
+import json
+import base64
+import binascii
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import DateTime, and_, literal, or_, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Resume, ProcessedResume, Job, ProcessedJob
+from .loader import _PROCESSED_JOB_ID
+from .serializers import processed_resume_to_dict, processed_job_to_dict
+from .exceptions import InvalidListQueryError
+
+# SQLite stores the CURRENT_TIMESTAMP server default as "YYYY-MM-DD HH:MM:SS"
+# text, so datetimes compared with ``created_at`` must be bound in the same
+# format (SQLAlchemy would add microseconds and break the text comparison).
+_BOUND_DATETIME = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
+RESUME_FIELDS = (
+    "resume_id",
+    "content_type",
+    "processing_status",
+    "processing_error",
+    "created_at",
+    "content",
+    "processed_resume",
+)
+DEFAULT_RESUME_FIELDS = (
+    "resume_id",
+    "content_type",
+    "processing_status",
+    "processing_error",
+    "created_at",
+)
+JOB_FIELDS = (
+    "job_id",
+    "resume_id",
+    "canonical_job_id",
+    "created_at",
+    "content",
+    "processed_job",
+)
+DEFAULT_JOB_FIELDS = ("job_id", "resume_id", "canonical_job_id", "created_at")
+
+
+def _bound(value: datetime):
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return literal(value, _BOUND_DATETIME)
+
+
+def encode_cursor(order: str, created_at: datetime, row_id: int) -> str:
+    payload = json.dumps([order, created_at.isoformat(), row_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order: str) -> tuple:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_order, created_at, row_id = json.loads(payload)
+        created_at = datetime.fromisoformat(created_at)
+        if not isinstance(row_id, int):
+            raise ValueError
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidListQueryError("Malformed cursor.")
+    if cursor_order != order:
+        raise InvalidListQueryError(f"Cursor was issued for order '{cursor_order}'.")
+    return created_at, row_id
+
+
+def _select_fields(
+    fields: Optional[Sequence[str]], allowed: Sequence[str], default: Sequence[str]
+) -> List[str]:
+    if not fields:
+        return list(default)
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise InvalidListQueryError(
+            f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}."
+        )
+    return list(dict.fromkeys(fields))
+
+
+class RecordLister:
+    """
+    Lists resumes and jobs page by page, newest first by default.
+
+    Pagination is keyset-based on ``(created_at, id)``: a page is fetched by
+    seeking past the last row of the previous page through the matching
+    index, so every page costs the same however deep it is, and rows added
+    meanwhile never shift or repeat entries. The cursor returned with a page
+    is opaque to clients. Only the requested fields are selected; the raw
+    ``content`` and the processed data are left out unless asked for.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def resumes(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        order: str = "desc",
+        fields: Optional[Sequence[str]] = None,
+        processing_status: Optional[str] = None,
+        content_type: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        fields = _select_fields(fields, RESUME_FIELDS, DEFAULT_RESUME_FIELDS)
+        conditions = []
+        if processing_status:
+            conditions.append(Resume.processing_status == processing_status)
+        if content_type:
+            conditions.append(Resume.content_type == content_type)
+        return await self._page(
+            Resume,
+            ProcessedResume if "processed_resume" in fields else None,
+            ProcessedResume.resume_id == Resume.resume_id,
+            fields,
+            conditions,
+            limit,
+            cursor,
+            order,
+            created_after,
+            created_before,
+        )
+
+    async def jobs(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        order: str = "desc",
+        fields: Optional[Sequence[str]] = None,
+        resume_id: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        fields = _select_fields(fields, JOB_FIELDS, DEFAULT_JOB_FIELDS)
+        conditions = []
+        if resume_id:
+            conditions.append(Job.resume_id == resume_id)
+        return await self._page(
+            Job,
+            ProcessedJob if "processed_job" in fields else None,
+            ProcessedJob.job_id == _PROCESSED_JOB_ID,
+            fields,
+            conditions,
+            limit,
+            cursor,
+            order,
+            created_after,
+            created_before,
+        )
+
+    async def _page(
+        self,
+        model,
+        processed_model,
+        processed_join,
+        fields: List[str],
+        conditions: list,
+        limit: int,
+        cursor: Optional[str],
+        order: str,
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+    ) -> Dict[str, Any]:
+        if order not in ("asc", "desc"):
+            raise InvalidListQueryError(f"Unknown order '{order}'.")
+        columns = [
+            getattr(model, field)
+            for field in fields
+            if field not in ("created_at", "processed_resume", "processed_job")
+        ]
+        entities = [model.id, model.created_at, *columns]
+        if processed_model is not None:
+            entities.append(processed_model)
+        stmt = select(*entities)
+        if processed_model is not None:
+            stmt = stmt.outerjoin(processed_model, processed_join)
+
+        if created_after:
+            conditions.append(model.created_at >= _bound(created_after))
+        if created_before:
+            conditions.append(model.created_at < _bound(created_before))
+        if cursor:
+            created_at, row_id = decode_cursor(cursor, order)
+            created_at = _bound(created_at)
+            if order == "desc":
+                conditions.append(
+                    or_(
+                        model.created_at < created_at,
+                        and_(model.created_at == created_at, model.id < row_id),
+                    )
+                )
+            else:
+                conditions.append(
+                    or_(
+                        model.created_at > created_at,
+                        and_(model.created_at == created_at, model.id > row_id),
+                    )
+                )
+        if order == "desc":
+            stmt = stmt.order_by(model.created_at.desc(), model.id.desc())
+        else:
+            stmt = stmt.order_by(model.created_at.asc(), model.id.asc())
+
+        # One extra row tells whether there is a next page
+        rows = (await self.db.execute(stmt.where(*conditions).limit(limit + 1))).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(order, rows[-1].created_at, rows[-1].id)
+
+        items = []
+        for row in rows:
+            item = {}
+            for field in fields:
+                if field == "created_at":
+                    item[field] = row.created_at.isoformat() if row.created_at else None
+                elif field == "processed_resume":
+                    processed = row.ProcessedResume
+                    item[field] = processed_resume_to_dict(processed) if processed else None
+                elif field == "processed_job":
+                    processed = row.ProcessedJob
+                    item[field] = processed_job_to_dict(processed) if processed else None
+                else:
+                    item[field] = getattr(row, field)
+            items.append(item)
+        return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,103 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Resume, ProcessedResume, Job, ProcessedJob
+
+# Keeps ``IN (...)`` lists below SQLite's bound parameter limit
+_BATCH_SIZE = 500
+
+ResumeRecord = Tuple[Resume, Optional[ProcessedResume]]
+JobRecord = Tuple[Job, Optional[ProcessedJob]]
+
+# Duplicate jobs read the processed data of their canonical job
+_PROCESSED_JOB_ID = func.coalesce(Job.canonical_job_id, Job.job_id)
+
+
+def _chunks(ids: Iterable[str]) -> Iterable[List[str]]:
+    unique = list(dict.fromkeys(ids))
+    for start in range(0, len(unique), _BATCH_SIZE):
+        yield unique[start : start + _BATCH_SIZE]
+
+
+class RecordLoader:
+    """
+    Loads raw resumes/jobs together with their processed rows.
+
+    Every lookup is a single ``LEFT OUTER JOIN`` query instead of one query
+    for the raw row and another for the processed one. A missing processed
+    row is returned as ``None``; a missing raw row leaves the id out of the
+    result (or returns ``None`` for single lookups). Turning either case into
+    a not-found/parsing error is left to the caller.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def resume(self, resume_id: str) -> Optional[ResumeRecord]:
+        return (await self.resumes([resume_id])).get(resume_id)
+
+    async def job(self, job_id: str) -> Optional[JobRecord]:
+        return (await self.jobs([job_id])).get(job_id)
+
+    async def resumes(
+        self, resume_ids: Iterable[str], processed: bool = True
+    ) -> Dict[str, ResumeRecord]:
+        """
+        Loads many resumes in batches of ids, keyed by ``resume_id``. With
+        ``processed=False`` the processed rows are not joined (always ``None``).
+        """
+        records: Dict[str, ResumeRecord] = {}
+        for chunk in _chunks(resume_ids):
+            if processed:
+                stmt = select(Resume, ProcessedResume).outerjoin(
+                    ProcessedResume, ProcessedResume.resume_id == Resume.resume_id
+                )
+            else:
+                stmt = select(Resume, null())
+            result = await self.db.execute(stmt.where(Resume.resume_id.in_(chunk)))
+            for resume, processed_resume in result.all():
+                records[resume.resume_id] = (resume, processed_resume)
+        return records
+
+    async def jobs(self, job_ids: Iterable[str], processed: bool = True) -> Dict[str, JobRecord]:
+        """
+        Loads many jobs in batches of ids, keyed by ``job_id``. With
+        ``processed=False`` the processed rows are not joined (always ``None``).
+        """
+        records: Dict[str, JobRecord] = {}
+        for chunk in _chunks(job_ids):
+            if processed:
+                stmt = select(Job, ProcessedJob).outerjoin(
+                    ProcessedJob, ProcessedJob.job_id == _PROCESSED_JOB_ID
+                )
+            else:
+                stmt = select(Job, null())
+            result = await self.db.execute(stmt.where(Job.job_id.in_(chunk)))
+            for job, processed_job in result.all():
+                records[job.job_id] = (job, processed_job)
+        return records
+
+    async def resume_and_job(
+        self, resume_id: str, job_id: str
+    ) -> Tuple[Optional[ResumeRecord], Optional[JobRecord]]:
+        """
+        Loads a resume and a job, with their processed rows, in one query.
+        """
+        # Outer-joining both sides onto a one-row anchor always yields exactly
+        # one row, even when the resume or the job does not exist.
+        anchor = select(literal(1).label("anchor")).subquery()
+        result = await self.db.execute(
+            select(Resume, ProcessedResume, Job, ProcessedJob)
+            .select_from(anchor)
+            .outerjoin(Resume, Resume.resume_id == resume_id)
+            .outerjoin(ProcessedResume, ProcessedResume.resume_id == Resume.resume_id)
+            .outerjoin(Job, Job.job_id == job_id)
+            .outerjoin(ProcessedJob, ProcessedJob.job_id == _PROCESSED_JOB_ID)
+        )
+        resume, processed_resume, job, processed_job = result.one()
+        return (
+            (resume, processed_resume) if resume is not None else None,
+            (job, processed_job) if job is not None else None,
+        )
@@ -0,0 +1,269 @@
+import time
+import asyncio
+import logging
+
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .exceptions import PipelineStageTimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    A single unit of work in a ``StageGraph``.
+
+    ``func`` is awaited with one keyword argument per entry in ``depends_on``,
+    each bound to the result of the stage of that name.
+    """
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+
+
+@dataclass
+class StageEvent:
+    """
+    Progress notification emitted by ``StageGraph.stream``.
+    """
+
+    status: str  # "started" | "completed"
+    stage: str
+    result: Any = None
+    elapsed: Optional[float] = None
+
+
+@dataclass
+class StageGraph:
+    """
+    Declarative executor for a DAG of async stages.
+
+    Every stage starts as soon as all of its dependencies have completed, so
+    independent stages run concurrently. Each stage may carry its own timeout
+    and its wall-clock duration is recorded in ``timings``. The first failing
+    stage cancels everything still in flight and its exception is re-raised.
+    """
+
+    stages: Iterable[Stage]
+    name: str = "pipeline"
+    timings: Dict[str, float] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        self.stages = list(self.stages)
+        self._by_name: Dict[str, Stage] = {}
+        for stage in self.stages:
+            if stage.name in self._by_name:
+                raise ValueError(f"Duplicate stage name '{stage.name}' in {self.name}")
+            self._by_name[stage.name] = stage
+
+        for stage in self.stages:
+            unknown = [dep for dep in stage.depends_on if dep not in self._by_name]
+            if unknown:
+                raise ValueError(
+                    f"Stage '{stage.name}' depends on unknown stage(s): {', '.join(unknown)}"
+                )
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        visiting, visited = set(), set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected in {self.name} at stage '{name}'")
+            visiting.add(name)
+            for dep in self._by_name[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for stage in self.stages:
+            visit(stage.name)
+
+    async def _run_stage(self, stage: Stage, kwargs: Dict[str, Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            if stage.timeout is None:
+                return await stage.func(**kwargs)
+            return await asyncio.wait_for(stage.func(**kwargs), timeout=stage.timeout)
+        except asyncio.TimeoutError as e:
+            raise PipelineStageTimeoutError(stage=stage.name, timeout=stage.timeout) from e
+        finally:
+            self.timings[stage.name] = time.perf_counter() - started
+
+    async def stream(self) -> AsyncGenerator[StageEvent, None]:
+        """
+        Execute the graph, yielding a ``StageEvent`` whenever a stage starts or completes.
+        """
+        self.timings.clear()
+        results: Dict[str, Any] = {}
+        pending: Dict[str, Stage] = dict(self._by_name)
+        running: Dict[asyncio.Task, str] = {}
+
+        try:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    if all(dep in results for dep in stage.depends_on):
+                        del pending[name]
+                        kwargs = {dep: results[dep] for dep in stage.depends_on}
+                        running[asyncio.create_task(self._run_stage(stage, kwargs))] = name
+                        yield StageEvent(status="started", stage=name)
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    results[name] = task.result()
+                    yield StageEvent(
+                        status="completed",
+                        stage=name,
+                        result=results[name],
+                        elapsed=self.timings.get(name),
+                    )
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            self._log_timings()
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Execute the graph to completion and return the results keyed by stage name.
+        """
+        results: Dict[str, Any] = {}
+        async for event in self.stream():
+            if event.status == "completed":
+                results[event.stage] = event.result
+        return results
+
+    def _log_timings(self) -> None:
+        if not self.timings:
+            return
+        summary = ", ".join(f"{name}={seconds:.3f}s" for name, seconds in self.timings.items())
+        logger.info(f"{self.name} stage timings: {summary}")
+
+
+async def bounded_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    concurrency: int,
+) -> AsyncGenerator[Tuple[T, Optional[R], Optional[Exception]], None]:
+    """
+    Awaits ``func(item)`` for every item with at most ``concurrency`` calls in
+    flight, yielding ``(item, result, error)`` in completion order.
+
+    Items are drawn from ``items`` only when a slot frees up, so a large input
+    is never materialized up front. ``items`` may be an async iterable, such
+    as a request body being parsed, which then is not read ahead of the free
+    slots (backpressure). A failing item is reported through ``error`` and
+    does not affect the others; errors raised by ``items`` itself propagate.
+    Closing the generator cancels the calls still in flight.
+    """
+    if isinstance(items, AsyncIterable):
+        results = _bounded_map_async(func, items, concurrency)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+        return
+
+    source: Iterator[T] = iter(items)
+    running: Dict[asyncio.Task, T] = {}
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(running) < concurrency:
+                try:
+                    item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                running[asyncio.create_task(func(item))] = item
+
+            if not running:
+                return
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = running.pop(task)
+                error = task.exception()
+                yield item, None if error else task.result(), error
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+async def _bounded_map_async(
+    func: Callable[[T], Awaitable[R]],
+    items: AsyncIterable[T],
+    concurrency: int,
+) -> AsyncGenerator[Tuple[T, Optional[R], Optional[Exception]], None]:
+    # The next item is awaited alongside the running calls, so results keep
+    # flowing while the source is slow to produce.
+    source: AsyncIterator[T] = items.__aiter__()
+    running: Dict[asyncio.Task, T] = {}
+    pending_item: Optional[asyncio.Task] = None
+    exhausted = False
+
+    try:
+        while True:
+            if not exhausted and pending_item is None and len(running) < concurrency:
+                pending_item = asyncio.ensure_future(source.__anext__())
+
+            waiting = set(running)
+            if pending_item is not None:
+                waiting.add(pending_item)
+            if not waiting:
+                return
+
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if pending_item in done:
+                done.discard(pending_item)
+                try:
+                    item = pending_item.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    running[asyncio.create_task(func(item))] = item
+                finally:
+                    pending_item = None
+            for task in done:
+                item = running.pop(task)
+                error = task.exception()
+                yield item, None if error else task.result(), error
+    finally:
+        if pending_item is not None:
+            pending_item.cancel()
+            await asyncio.gather(pending_item, return_exceptions=True)
+        if hasattr(source, "aclose"):
+            await source.aclose()
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
@@ -0,0 +1,114 @@
+import json
+import hashlib
+import logging
+
+from typing import Dict, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import settings
+from app.prompt import prompt_factory
+from app.schemas.json import json_schema_factory
+from app.models import ImprovementResult
+
+logger = logging.getLogger(__name__)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Changes to any prompt or schema used by the improvement pipeline yield a new
+# version and therefore never serve results produced by the old wording.
+PROMPT_VERSION = _sha256(
+    json.dumps(
+        {
+            "resume_improvement": prompt_factory.get("resume_improvement"),
+            "structured_resume": prompt_factory.get("structured_resume"),
+            "resume_analysis": prompt_factory.get("resume_analysis"),
+            "resume_preview": json_schema_factory.get("resume_preview"),
+        },
+        sort_keys=True,
+    )
+)
+
+
+class ImprovementResultStore:
+    """
+    Memoizes ``ScoreImprovementService`` executions keyed by content hashes.
+
+    The key covers everything the pipeline output depends on: the resume and
+    job text, their extracted keywords, the prompt versions, the model ids and
+    the retry budget. Entries are dropped explicitly via ``invalidate_resume``
+    whenever the processed resume data is edited.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _insert(self):
+        dialect = self.db.get_bind().dialect.name
+        return postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+    @staticmethod
+    def make_key(
+        resume_content: str,
+        resume_keywords: str,
+        job_content: str,
+        job_keywords: str,
+        max_retries: int,
+    ) -> str:
+        return _sha256(
+            json.dumps(
+                [
+                    _sha256(resume_content),
+                    _sha256(resume_keywords),
+                    _sha256(job_content),
+                    _sha256(job_keywords),
+                    PROMPT_VERSION,
+                    settings.LLM_PROVIDER,
+                    settings.LL_MODEL,
+                    settings.EMBEDDING_PROVIDER,
+                    settings.EMBEDDING_MODEL,
+                    max_retries,
+                ]
+            )
+        )
+
+    async def get(self, cache_key: str) -> Optional[Dict]:
+        execution = await self.db.scalar(
+            select(ImprovementResult.execution).where(
+                ImprovementResult.cache_key == cache_key
+            )
+        )
+        if execution is not None:
+            logger.info(f"Improvement result cache hit: {cache_key}")
+        return execution
+
+    async def put(
+        self, cache_key: str, resume_id: str, job_id: str, execution: Dict
+    ) -> None:
+        # A single upsert, so concurrent runs for the same key never collide
+        stmt = self._insert()(ImprovementResult).values(
+            cache_key=cache_key,
+            resume_id=resume_id,
+            job_id=job_id,
+            execution=execution,
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ImprovementResult.cache_key],
+                set_={"execution": stmt.excluded.execution},
+            )
+        )
+        await self.db.commit()
+
+    async def invalidate_resume(self, resume_id: str) -> None:
+        """
+        Drops every memoized result computed for the given resume.
+        The caller is responsible for committing.
+        """
+        await self.db.execute(
+            delete(ImprovementResult).where(ImprovementResult.resume_id == resume_id)
+        )
@@ -0,0 +1,348 @@
+import re
+import logging
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Top-level keys of the structured_resume schema and the headings that introduce them
+SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "Experiences": (
+        "experience",
+        "work experience",
+        "professional experience",
+        "employment",
+        "employment history",
+        "work history",
+        "career history",
+    ),
+    "Education": ("education", "academic background", "education and training"),
+    "Projects": ("projects", "personal projects", "side projects", "selected projects", "key projects"),
+    "Skills": ("skills", "technical skills", "core skills", "core competencies", "technologies", "tech stack", "skills and tools"),
+    "Research Work": ("research", "research work", "research experience", "publications"),
+    "Achievements": ("achievements", "awards", "honors", "honours", "accomplishments", "awards and honors"),
+    "Summary": ("summary", "profile", "professional summary", "about", "about me", "objective"),
+    "Other": ("certifications", "languages", "interests", "hobbies", "references", "volunteering", "volunteer experience"),
+}
+
+# Sections whose absence from a well-structured resume means "empty" rather than "unknown"
+OPTIONAL_SECTIONS = ("Projects", "Research Work", "Achievements")
+
+_HEADING_LOOKUP = {alias: key for key, aliases in SECTION_ALIASES.items() for alias in aliases}
+
+MARKDOWN_HEADING = re.compile(r"^\s{0,3}#{1,6}\s+(.+?)\s*#*\s*$")
+BOLD_LINE = re.compile(r"^\s*(?:\*\*|__)(.+?)(?:\*\*|__)\s*:?\s*$")
+CAPS_HEADING = re.compile(r"^[A-Z][A-Z &/]+$")
+BULLET = re.compile(r"^\s*(?:[-*+•▪●◦]|\d+[.)])\s+")
+
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE = re.compile(r"(?<![\w/])\+?\(?\d[\d\s().-]{7,}\d(?![\w/])")
+LINKEDIN = re.compile(r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/in/[\w%-]+/?", re.IGNORECASE)
+URL = re.compile(r"(?:https?://)?(?:www\.)?[\w-]+(?:\.[\w-]+)*\.(?:com|io|dev|me|net|org|app|page|site)(?:/[\w./%-]*)?", re.IGNORECASE)
+LOCATION = re.compile(r"^[A-Z][A-Za-z .'-]+,\s*[A-Z][A-Za-z .'-]+$")
+CONTACT_SEPARATORS = re.compile(r"\s*(?:\||•|·|▪|\s{3,})\s*")
+
+_MONTHS = {
+    m: i
+    for i, names in enumerate(
+        (
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ),
+        start=1,
+    )
+    for m in names
+}
+_DATE = r"(?:[A-Za-z]{3,9}\.?\s+\d{4}|\d{1,2}/\d{4}|\d{4}-\d{2}|\d{4})"
+DATE_RANGE = re.compile(
+    rf"(?P<start>{_DATE})\s*(?:-|–|—|to)\s*(?P<end>{_DATE}|present|current|now|today)",
+    re.IGNORECASE,
+)
+TITLE_SEPARATORS = re.compile(r"\s*(?:,|\||\s+at\s+|\s+@\s+|\s+[-–—]\s+)\s*")
+
+_MAX_SKILL_WORDS = 5
+
+
+def normalize_date(value: str) -> Optional[str]:
+    """
+    Normalizes a resume date ("Jan 2020", "01/2020", "2020-01", "2020", "Present")
+    to the schema's YYYY-MM-DD / "Present" format, or returns None.
+    """
+    value = value.strip().rstrip(".").lower()
+    if value in ("present", "current", "now", "today"):
+        return "Present"
+    if re.fullmatch(r"\d{4}", value):
+        return f"{value}-01-01"
+    match = re.fullmatch(r"(\d{4})-(\d{2})", value)
+    if match and 1 <= int(match.group(2)) <= 12:
+        return f"{match.group(1)}-{match.group(2)}-01"
+    match = re.fullmatch(r"(\d{1,2})/(\d{4})", value)
+    if match and 1 <= int(match.group(1)) <= 12:
+        return f"{match.group(2)}-{int(match.group(1)):02d}-01"
+    match = re.fullmatch(r"([a-z]{3,9})\.?\s+(\d{4})", value)
+    if match and match.group(1) in _MONTHS:
+        return f"{match.group(2)}-{_MONTHS[match.group(1)]:02d}-01"
+    return None
+
+
+def parse_date_range(line: str) -> Optional[Tuple[str, str, re.Match]]:
+    match = DATE_RANGE.search(line)
+    if not match:
+        return None
+    start, end = normalize_date(match.group("start")), normalize_date(match.group("end"))
+    if not start or not end:
+        return None
+    return start, end, match
+
+
+def _clean(line: str) -> str:
+    return re.sub(r"[*_`#]", "", line).strip()
+
+
+def _heading_text(line: str) -> Optional[str]:
+    """
+    Returns the text of a heading line (markdown heading, bold-only line or
+    short ALL-CAPS line), or None.
+    """
+    match = MARKDOWN_HEADING.match(line) or BOLD_LINE.match(line)
+    if match:
+        return _clean(match.group(1))
+    stripped = line.strip().rstrip(":")
+    if CAPS_HEADING.match(stripped) and len(stripped.split()) <= 4:
+        return stripped
+    return None
+
+
+def _section_key(heading: str) -> Optional[str]:
+    normalized = re.sub(r"[^a-z& ]", "", heading.lower()).replace("&", "and").strip()
+    normalized = re.sub(r"\s+", " ", normalized)
+    return _HEADING_LOOKUP.get(normalized)
+
+
+@dataclass
+class ParsedResume:
+    """
+    Result of ``MarkdownResumeParser.parse``.
+
+    ``fields`` holds the top-level schema keys the parser filled confidently.
+    ``header`` is the text before the first recognized section and
+    ``sections`` the raw text of each recognized section.
+    """
+
+    fields: Dict[str, Any] = field(default_factory=dict)
+    header: str = ""
+    sections: Dict[str, str] = field(default_factory=dict)
+
+    def text_for(self, keys: Sequence[str], full_text: str) -> str:
+        """
+        The part of the resume an LLM needs to fill ``keys``: the header and the
+        matching sections, or the full text if any key has no section of its own.
+        """
+        parts = []
+        for key in keys:
+            if key == "Personal Data":
+                parts.append(self.header)
+            elif key in self.sections:
+                parts.append(self.sections[key])
+            else:
+                return full_text
+        return "\n\n".join(part for part in parts if part.strip())
+
+
+class MarkdownResumeParser:
+    """
+    Deterministic extraction of structured resume fields from MarkItDown output.
+
+    Recognizes section headings (markdown, bold or ALL-CAPS), contact details
+    in the header (name, email, phone, LinkedIn, portfolio, "City, Country"),
+    skill lists, achievement bullets and experience entries laid out as a
+    title line, a date range and bullet points. A field is only reported when
+    every line of its section was understood; anything else is left for the
+    LLM. Optional sections that are clearly absent are reported as empty.
+    """
+
+    def parse(self, text: str) -> ParsedResume:
+        header, sections = self._split_sections(text)
+        parsed = ParsedResume(
+            header="\n".join(header).strip(),
+            sections={key: "\n".join(lines).strip() for key, lines in sections.items()},
+        )
+
+        personal_data = self._personal_data(header)
+        if personal_data:
+            parsed.fields["Personal Data"] = personal_data
+
+        if "Skills" in sections:
+            skills = self._skills(sections["Skills"])
+            if skills:
+                parsed.fields["Skills"] = skills
+                parsed.fields["Extracted Keywords"] = list(
+                    dict.fromkeys(skill["skillName"] for skill in skills)
+                )
+
+        if "Achievements" in sections:
+            achievements = self._bullets(sections["Achievements"])
+            if achievements:
+                parsed.fields["Achievements"] = achievements
+
+        if "Experiences" in sections:
+            experiences = self._experiences(sections["Experiences"])
+            if experiences:
+                parsed.fields["Experiences"] = experiences
+
+        # Only trust the absence of a section when the document is clearly sectioned
+        if len(sections) >= 2:
+            for key in OPTIONAL_SECTIONS:
+                if key not in sections:
+                    parsed.fields.setdefault(key, [])
+
+        return parsed
+
+    @staticmethod
+    def _split_sections(text: str) -> Tuple[List[str], Dict[str, List[str]]]:
+        header: List[str] = []
+        sections: Dict[str, List[str]] = {}
+        current: Optional[List[str]] = header
+        for line in text.splitlines():
+            heading = _heading_text(line)
+            key = _section_key(heading) if heading else None
+            if key:
+                current = sections.setdefault(key, [])
+                continue
+            current.append(line)
+        return header, sections
+
+    @staticmethod
+    def _personal_data(header: List[str]) -> Optional[Dict[str, Any]]:
+        lines = [_clean(line) for line in header if line.strip()]
+        if not lines:
+            return None
+        text = "\n".join(lines)
+        email = EMAIL.search(text)
+        if not email:
+            return None
+
+        name_line = CONTACT_SEPARATORS.split(lines[0])[0]
+        words = name_line.split()
+        if not 2 <= len(words) <= 4 or any(not w[:1].isupper() or any(c.isdigit() or c == "@" for c in w) for w in words):
+            return None
+
+        linkedin = LINKEDIN.search(text)
+        remainder = LINKEDIN.sub(" ", EMAIL.sub(" ", text))
+        portfolio = URL.search(remainder)
+        phone = PHONE.search(remainder)
+
+        city = country = None
+        for line in lines[1:]:
+            for part in CONTACT_SEPARATORS.split(line):
+                if LOCATION.match(part) and not EMAIL.search(part):
+                    city, country = (s.strip() for s in part.split(",", 1))
+                    break
+            if city:
+                break
+
+        words = [w.capitalize() if w.isupper() and len(w) > 1 else w for w in words]
+        return {
+            "firstName": words[0],
+            "lastName": " ".join(words[1:]),
+            "email": email.group(0),
+            "phone": phone.group(0).strip() if phone else None,
+            "linkedin": linkedin.group(0) if linkedin else None,
+            "portfolio": portfolio.group(0) if portfolio else None,
+            "location": {"city": city, "country": country},
+        }
+
+    @staticmethod
+    def _skills(lines: List[str]) -> Optional[List[Dict[str, str]]]:
+        skills: List[Dict[str, str]] = []
+        for line in lines:
+            line = _clean(BULLET.sub("", line))
+            # "Languages: Go, Python; Tools: Docker" holds one group per ';'
+            groups = line.split(";") if line.count(":") > 1 else [line]
+            for group in groups:
+                category = "Skills"
+                if ":" in group:
+                    category, group = (part.strip() for part in group.split(":", 1))
+                for item in re.split(r"\s*[,;|•·]\s*", group):
+                    item = item.strip().rstrip(".")
+                    if not item:
+                        continue
+                    if len(item.split()) > _MAX_SKILL_WORDS:
+                        # Prose rather than a list; let the LLM interpret it
+                        return None
+                    skills.append({"category": category or "Skills", "skillName": item})
+        return skills or None
+
+    @staticmethod
+    def _bullets(lines: List[str]) -> Optional[List[str]]:
+        items = [_clean(BULLET.sub("", line)) for line in lines if line.strip()]
+        return [item for item in items if item] or None
+
+    @staticmethod
+    def _experiences(lines: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parses entries of the form::
+
+            ### Title, Company            (heading, bold or plain line)
+            Jan 2020 - Present             (or on the title line itself)
+            - what was done
+            - ...
+
+        Returns None as soon as a line does not fit that layout.
+        """
+        entries: List[Dict[str, Any]] = []
+        entry: Optional[Dict[str, Any]] = None
+        for raw in lines:
+            if not raw.strip():
+                continue
+            line = _clean(raw)
+            if BULLET.match(raw):
+                if entry is None or entry["startDate"] is None:
+                    return None
+                entry["description"].append(_clean(BULLET.sub("", raw)))
+                continue
+
+            dates = parse_date_range(line)
+            if entry is not None and entry["startDate"] is None:
+                if not dates or line[: dates[2].start()].strip(" ,|-–—()"):
+                    return None
+                entry["startDate"], entry["endDate"] = dates[0], dates[1]
+                location = line[dates[2].end():].strip(" ,|-–—()")
+                entry["location"] = location or None
+                continue
+
+            if entry is not None and not entry["description"]:
+                return None
+            title_line = line
+            start = end = None
+            if dates:
+                title_line = (line[: dates[2].start()] + line[dates[2].end():]).strip(" ,|-–—()")
+                start, end = dates[0], dates[1]
+            parts = [p for p in TITLE_SEPARATORS.split(title_line, maxsplit=1) if p]
+            if not parts:
+                return None
+            entry = {
+                "jobTitle": parts[0],
+                "company": parts[1] if len(parts) > 1 else None,
+                "location": None,
+                "startDate": start,
+                "endDate": end,
+                "description": [],
+                "technologiesUsed": [],
+            }
+            entries.append(entry)
+
+        if not entries or any(e["startDate"] is None or not e["description"] for e in entries):
+            return None
+        return entries
@@ -1,30 +1,83 @@
-import os
 import uuid
 import json
-import tempfile
+import asyncio
+import hashlib
 import logging
 from datetime import datetime
 
-from markitdown import MarkItDown
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from pydantic import ValidationError
-from typing import Dict, Optional
+from pydantic import TypeAdapter, ValidationError
+from typing import Any, Dict, Iterable, List, Optional
 
+from app.core import settings, release_connection
 from app.models import Resume, ProcessedResume
 from app.agent import AgentManager
+from app.agent.exceptions import StrategyError
 from app.prompt import prompt_factory
 from app.schemas.json import json_schema_factory
 from app.schemas.pydantic import StructuredResumeModel
-from .exceptions import ResumeNotFoundError, ResumeValidationError
+from .result_store import ImprovementResultStore
+from .loader import RecordLoader
+from .serializers import (
+    RESUME_OBJECT_FIELDS,
+    RESUME_LIST_FIELDS,
+    processed_resume_values,
+    processed_resume_to_dict,
+)
+from .lexical_scorer import LexicalIndex
+from .resume_parser import MarkdownResumeParser
+from .skill_matcher import resolve_keywords
+from .document_converter import document_converter
+from .exceptions import (
+    ResumeNotFoundError,
+    ResumeValidationError,
+    DocumentConversionTimeoutError,
+)
 
 logger = logging.getLogger(__name__)
 
+# Columns copied from an existing ProcessedResume when a duplicate upload reuses it
+_PROCESSED_FIELDS = (
+    "personal_data",
+    "experiences",
+    "projects",
+    "skills",
+    "research_work",
+    "achievements",
+    "education",
+    "extracted_keywords",
+)
+
+# Top-level fields of a resume as returned by the read endpoints
+RESUME_RECORD_FIELDS = ("raw_resume", "processing_status", "processing_error", "processed_resume")
+
+# Validators for a single top-level section of StructuredResumeModel, keyed by schema key
+_SECTION_ADAPTERS = {
+    field.alias: TypeAdapter(field.annotation)
+    for field in StructuredResumeModel.model_fields.values()
+}
+
+
+def file_hash(file_bytes: bytes) -> str:
+    """
+    Hash of the uploaded file exactly as received.
+    """
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def content_hash(text_content: str) -> str:
+    """
+    Hash of the converted text with whitespace normalized, so the same resume
+    exported twice (different file metadata, same text) still matches.
+    """
+    return hashlib.sha256(" ".join(text_content.split()).encode("utf-8")).hexdigest()
+
 
 class ResumeService:
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.md = MarkItDown(enable_plugins=False)
         self.json_agent_manager = AgentManager()
         
         # Validate dependencies for DOCX processing
@@ -53,56 +106,188 @@ class ResumeService:
 
 
     async def convert_and_store_resume(
-        self, file_bytes: bytes, file_type: str, filename: str, content_type: str = "md"
+        self,
+        file_bytes: bytes,
+        file_type: str,
+        filename: str,
+        content_type: str = "md",
+        defer_extraction: bool = False,
     ):
         """
         Converts resume file (PDF/DOCX) to text using MarkItDown and stores it in the database.
 
+        Uploads are matched against earlier ones by the hash of the raw file and
+        of the converted text; resumes whose structured data was edited by hand
+        are not matched. Depending on RESUME_DEDUP_MODE, a match either
+        gets a new resume id with a copy of the existing structured data (no
+        LLM extraction), or the existing resume id is returned as-is.
+
+        With ``defer_extraction`` the resume is stored with processing status
+        ``pending`` and returned right after conversion; the caller is then
+        responsible for running ``extract_structured_resume`` later.
+
         Args:
             file_bytes: Raw bytes of the uploaded file
             file_type: MIME type of the file ("application/pdf" or "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
             filename: Original filename
             content_type: Output format ("md" for markdown or "html")
+            defer_extraction: Skip the structured extraction for now
 
         Returns:
-            None
+            The resume id
         """
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=self._get_file_extension(file_type)
-        ) as temp_file:
-            temp_file.write(file_bytes)
-            temp_path = temp_file.name
+        dedup_mode = settings.RESUME_DEDUP_MODE
+        raw_hash = file_hash(file_bytes)
+        duplicate = None
+        if dedup_mode != "off":
+            duplicate = await self._find_processed_duplicate(Resume.file_hash == raw_hash)
+
+        if duplicate is not None:
+            text_content = duplicate.content
+        else:
+            await release_connection(self.db)
+            text_content = await self._convert(file_bytes, file_type, filename)
+        text_hash = content_hash(text_content)
+        if dedup_mode != "off" and duplicate is None:
+            duplicate = await self._find_processed_duplicate(Resume.content_hash == text_hash)
+
+        if duplicate is not None:
+            logger.info(f"Upload of {filename} matches resume {duplicate.resume_id}")
+            if dedup_mode == "return_existing":
+                return duplicate.resume_id
+
+        resume_id = await self._store_resume_in_db(
+            text_content,
+            content_type,
+            file_hash=raw_hash,
+            content_hash=text_hash,
+            processing_status="pending",
+        )
 
-        try:
-            try:
-                result = self.md.convert(temp_path)
-                text_content = result.text_content
-            except Exception as e:
-                # Handle specific markitdown conversion errors
-                error_msg = str(e)
-                if "MissingDependencyException" in error_msg or "DocxConverter" in error_msg:
-                    raise Exception(
-                        "File conversion failed: markitdown is missing DOCX support. "
-                        "Please install with: pip install 'markitdown[all]==0.1.2' or contact system administrator."
-                    ) from e
-                elif "docx" in error_msg.lower():
-                    raise Exception(
-                        f"DOCX file processing failed: {error_msg}. "
-                        "Please ensure the file is a valid DOCX document."
-                    ) from e
-                else:
-                    raise Exception(f"File conversion failed: {error_msg}") from e
-            
-            resume_id = await self._store_resume_in_db(text_content, content_type)
+        if duplicate is not None:
+            await self._copy_processed_resume(duplicate.resume_id, resume_id)
+        elif not defer_extraction:
+            await self.extract_structured_resume(resume_id)
+
+        return resume_id
 
+    async def extract_structured_resume(self, resume_id: str) -> None:
+        """
+        Runs the structured extraction of a stored resume, tracking its
+        processing status. Does nothing if structured data already exists.
+
+        Raises:
+            ResumeNotFoundError: If the resume is not found
+            ResumeValidationError: If extraction fails; the status is then ``failed``
+        """
+        record = await RecordLoader(self.db).resume(resume_id)
+        if not record:
+            raise ResumeNotFoundError(resume_id=resume_id)
+
+        resume, processed = record
+        if processed:
+            await self._set_processing_status(resume_id, "processed")
+            return
+
+        resume_text = resume.content
+        await self._set_processing_status(resume_id, "processing")
+        try:
             await self._extract_and_store_structured_resume(
-                resume_id=resume_id, resume_text=text_content
+                resume_id=resume_id, resume_text=resume_text
             )
+        except Exception as e:
+            await self.db.rollback()
+            await self._set_processing_status(resume_id, "failed", error=str(e))
+            raise
+        await self._set_processing_status(resume_id, "processed")
 
-            return resume_id
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+    async def mark_processing_failed(self, resume_id: str, error: str) -> None:
+        """
+        Records that the structured extraction of a stored resume will not run,
+        e.g. because it could not be queued.
+        """
+        await self._set_processing_status(resume_id, "failed", error=error)
+
+    async def get_processing_status(self, resume_id: str) -> Optional[str]:
+        return (
+            await self.db.execute(
+                select(Resume.processing_status).where(Resume.resume_id == resume_id)
+            )
+        ).scalar()
+
+    async def _set_processing_status(
+        self, resume_id: str, status: str, error: Optional[str] = None
+    ) -> None:
+        await self.db.execute(
+            update(Resume)
+            .where(Resume.resume_id == resume_id)
+            .values(processing_status=status, processing_error=error)
+        )
+        await self.db.commit()
+
+    async def _convert(self, file_bytes: bytes, file_type: str, filename: str) -> str:
+        """
+        Converts the uploaded file to markdown text in the document converter pool.
+        """
+        try:
+            return await document_converter.convert(
+                file_bytes,
+                self._get_file_extension(file_type),
+                filename=filename,
+                mimetype=file_type,
+            )
+        except DocumentConversionTimeoutError:
+            raise
+        except Exception as e:
+            # Handle specific markitdown conversion errors
+            error_msg = str(e)
+            if "MissingDependencyException" in error_msg or "DocxConverter" in error_msg:
+                raise Exception(
+                    "File conversion failed: markitdown is missing DOCX support. "
+                    "Please install with: pip install 'markitdown[all]==0.1.2' or contact system administrator."
+                ) from e
+            elif "docx" in error_msg.lower():
+                raise Exception(
+                    f"DOCX file processing failed: {error_msg}. "
+                    "Please ensure the file is a valid DOCX document."
+                ) from e
+            else:
+                raise Exception(f"File conversion failed: {error_msg}") from e
+
+    async def _find_processed_duplicate(self, condition) -> Optional[Resume]:
+        """
+        Returns the oldest resume matching ``condition`` whose structured data
+        was extracted successfully and never edited by hand, or None.
+        """
+        result = await self.db.execute(
+            select(Resume)
+            .join(ProcessedResume, ProcessedResume.resume_id == Resume.resume_id)
+            .where(condition, ProcessedResume.edited_at.is_(None))
+            .order_by(Resume.created_at, Resume.id)
+            .limit(1)
+        )
+        return result.scalars().first()
+
+    async def _copy_processed_resume(self, source_resume_id: str, resume_id: str) -> None:
+        """
+        Stores a copy of another resume's structured data for ``resume_id``,
+        skipping the LLM extraction. Rows are copied rather than shared so later
+        edits to one resume do not affect the other.
+        """
+        source = (
+            await self.db.execute(
+                select(ProcessedResume).where(
+                    ProcessedResume.resume_id == source_resume_id
+                )
+            )
+        ).scalars().first()
+        self.db.add(
+            ProcessedResume(
+                resume_id=resume_id,
+                **{name: getattr(source, name) for name in _PROCESSED_FIELDS},
+            )
+        )
+        await self._set_processing_status(resume_id, "processed")
 
     def _get_file_extension(self, file_type: str) -> str:
         """Returns the appropriate file extension based on MIME type"""
@@ -115,16 +300,29 @@ class ResumeService:
             return ".docx"
         return ""
 
-    async def _store_resume_in_db(self, text_content: str, content_type: str):
+    async def _store_resume_in_db(
+        self,
+        text_content: str,
+        content_type: str,
+        file_hash: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        processing_status: Optional[str] = None,
+    ):
         """
         Stores the parsed resume content in the database.
         """
         resume_id = str(uuid.uuid4())
         resume = Resume(
-            resume_id=resume_id, content=text_content, content_type=content_type
+            resume_id=resume_id,
+            content=text_content,
+            content_type=content_type,
+            file_hash=file_hash,
+            content_hash=content_hash,
+            processing_status=processing_status,
         )
 
         self.db.add(resume)
+        await LexicalIndex(self.db).add_document(text_content)
         await self.db.flush()
         await self.db.commit()
 
@@ -145,46 +343,11 @@ class ResumeService:
                     message="Failed to extract structured data from resume. Please ensure your resume contains all required sections.",
                 )
 
+            structured_resume["extracted_keywords"] = resolve_keywords(
+                resume_text, structured_resume.get("extracted_keywords")
+            )
             processed_resume = ProcessedResume(
-                resume_id=resume_id,
-                personal_data=json.dumps(structured_resume.get("personal_data", {}))
-                if structured_resume.get("personal_data")
-                else None,
-                experiences=json.dumps(
-                    {"experiences": structured_resume.get("experiences", [])}
-                )
-                if structured_resume.get("experiences")
-                else None,
-                projects=json.dumps({"projects": structured_resume.get("projects", [])})
-                if structured_resume.get("projects")
-                else None,
-                skills=json.dumps({"skills": structured_resume.get("skills", [])})
-                if structured_resume.get("skills")
-                else None,
-                research_work=json.dumps(
-                    {"research_work": structured_resume.get("research_work", [])}
-                )
-                if structured_resume.get("research_work")
-                else None,
-                achievements=json.dumps(
-                    {"achievements": structured_resume.get("achievements", [])}
-                )
-                if structured_resume.get("achievements")
-                else None,
-                education=json.dumps(
-                    {"education": structured_resume.get("education", [])}
-                )
-                if structured_resume.get("education")
-                else None,
-                extracted_keywords=json.dumps(
-                    {
-                        "extracted_keywords": structured_resume.get(
-                            "extracted_keywords", []
-                        )
-                    }
-                    if structured_resume.get("extracted_keywords")
-                    else None
-                ),
+                resume_id=resume_id, **processed_resume_values(structured_resume)
             )
 
             self.db.add(processed_resume)
@@ -205,14 +368,45 @@ class ResumeService:
         """
         Uses the AgentManager+JSONWrapper to ask the LLM to
         return the data in exact JSON schema we need.
+
+        In ``hybrid`` extraction mode the markdown is parsed deterministically
+        first, and the LLM is only asked for the fields the parser could not
+        fill, with a schema and resume excerpt reduced to those fields.
+        ``sectioned`` mode does the same, but asks for each missing section in
+        a separate, concurrent prompt (see ``_extract_sections``).
         """
-        prompt_template = prompt_factory.get("structured_resume")
-        prompt = prompt_template.format(
-            json.dumps(json_schema_factory.get("structured_resume"), indent=2),
-            resume_text,
-        )
-        logger.info(f"Structured Resume Prompt: {prompt}")
-        raw_output = await self.json_agent_manager.run(prompt=prompt)
+        schema = json_schema_factory.get("structured_resume")
+        resume_excerpt = resume_text
+        parsed_fields: Dict = {}
+        if settings.RESUME_EXTRACTION_MODE in ("hybrid", "sectioned"):
+            parsed = MarkdownResumeParser().parse(resume_text)
+            parsed_fields = parsed.fields
+            missing = [key for key in schema if key != "UUID" and key not in parsed_fields]
+            logger.info(
+                f"Resume parser filled {len(parsed_fields)} field(s); "
+                f"LLM needed for: {', '.join(missing) or 'none'}"
+            )
+            schema = {key: schema[key] for key in missing}
+            resume_excerpt = parsed.text_for(missing, resume_text)
+
+        raw_output: Dict = {}
+        if schema and settings.RESUME_EXTRACTION_MODE == "sectioned":
+            raw_output = await self._extract_sections(
+                {
+                    key: (sub_schema, parsed.text_for([key], resume_text) or resume_text)
+                    for key, sub_schema in schema.items()
+                }
+            )
+        elif schema:
+            prompt_template = prompt_factory.get("structured_resume")
+            prompt = prompt_template.format(
+                json.dumps(schema, indent=2),
+                resume_excerpt,
+            )
+            logger.info(f"Structured Resume Prompt: {prompt}")
+            raw_output = await self.json_agent_manager.run(prompt=prompt)
+        if parsed_fields:
+            raw_output = {**raw_output, **parsed_fields}
 
         try:
             structured_resume: StructuredResumeModel = (
@@ -234,6 +428,56 @@ class ResumeService:
             )
         return structured_resume.model_dump()
 
+    async def _extract_sections(self, sections: Dict[str, tuple]) -> Dict[str, Any]:
+        """
+        Extracts several resume sections concurrently, one LLM call per
+        ``{key: (sub_schema, excerpt)}`` entry, and returns ``{key: value}``.
+
+        Each section is validated on its own, so a malformed section is
+        retried (up to RESUME_SECTION_RETRIES times) without redoing the
+        sections that already succeeded.
+
+        Raises:
+            ResumeValidationError: If a section is still invalid after its retries
+        """
+        results = await asyncio.gather(
+            *(
+                self._extract_section(key, sub_schema, excerpt)
+                for key, (sub_schema, excerpt) in sections.items()
+            )
+        )
+        return dict(zip(sections, results))
+
+    async def _extract_section(self, key: str, sub_schema: Dict, excerpt: str) -> Any:
+        prompt = prompt_factory.get("structured_resume").format(
+            json.dumps({key: sub_schema}, indent=2),
+            excerpt,
+        )
+        adapter = _SECTION_ADAPTERS[key]
+        errors: List[str] = []
+        for attempt in range(settings.RESUME_SECTION_RETRIES + 1):
+            try:
+                raw_output = await self.json_agent_manager.run(prompt=prompt)
+                value = raw_output.get(key, raw_output) if isinstance(raw_output, dict) else raw_output
+                adapter.validate_python(value)
+                return value
+            except ValidationError as e:
+                errors = [
+                    f"{' -> '.join(str(loc) for loc in (key, *error['loc']))}: {error['msg']}"
+                    for error in e.errors()
+                ]
+            except StrategyError as e:
+                errors = [f"{key}: {e}"]
+            logger.info(
+                f"Section '{key}' extraction attempt {attempt + 1} failed: {'; '.join(errors)}"
+            )
+
+        user_friendly_message = "Resume validation failed. " + "; ".join(errors)
+        raise ResumeValidationError(
+            validation_error=user_friendly_message,
+            message=f"Resume structure validation failed: {user_friendly_message}",
+        )
+
     async def get_resume_with_processed_data(self, resume_id: str) -> Optional[Dict]:
         """
         Fetches both resume and processed resume data from the database and combines them.
@@ -247,71 +491,67 @@ class ResumeService:
         Raises:
             ResumeNotFoundError: If the resume is not found
         """
-        resume_query = select(Resume).where(Resume.resume_id == resume_id)
-        resume_result = await self.db.execute(resume_query)
-        resume = resume_result.scalars().first()
-
-        if not resume:
+        record = await RecordLoader(self.db).resume(resume_id)
+        if not record:
             raise ResumeNotFoundError(resume_id=resume_id)
+        return self._combine(*record)
+
+    async def get_resumes_with_processed_data(
+        self, resume_ids: List[str], fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetches many resumes at once, in the shape of ``get_resume_with_processed_data``.
 
-        processed_query = select(ProcessedResume).where(
-            ProcessedResume.resume_id == resume_id
+        Args:
+            resume_ids: The IDs of the resumes to retrieve
+            fields: The top-level fields to return besides ``resume_id``
+                (``RESUME_RECORD_FIELDS``); all of them by default
+
+        Returns:
+            ``{"items": {resume_id: data}, "missing": [resume_id, ...]}``
+        """
+        fields = fields or list(RESUME_RECORD_FIELDS)
+        resume_ids = list(dict.fromkeys(resume_ids))
+        # The processing status falls back on whether processed data exists
+        records = await RecordLoader(self.db).resumes(
+            resume_ids,
+            processed="processed_resume" in fields or "processing_status" in fields,
         )
-        processed_result = await self.db.execute(processed_query)
-        processed_resume = processed_result.scalars().first()
+        return {
+            "items": {
+                resume_id: self._combine(*records[resume_id], fields=fields)
+                for resume_id in resume_ids
+                if resume_id in records
+            },
+            "missing": [resume_id for resume_id in resume_ids if resume_id not in records],
+        }
 
-        combined_data = {
-            "resume_id": resume.resume_id,
-            "raw_resume": {
+    @staticmethod
+    def _combine(
+        resume: Resume,
+        processed_resume: Optional[ProcessedResume],
+        fields: Iterable[str] = RESUME_RECORD_FIELDS,
+    ) -> Dict[str, Any]:
+        combined_data: Dict[str, Any] = {"resume_id": resume.resume_id}
+        if "raw_resume" in fields:
+            combined_data["raw_resume"] = {
                 "id": resume.id,
                 "content": resume.content,
                 "content_type": resume.content_type,
                 "created_at": resume.created_at.isoformat()
                 if resume.created_at
                 else None,
-            },
-            "processed_resume": None,
-        }
-
-        if processed_resume:
-            combined_data["processed_resume"] = {
-                "personal_data": json.loads(processed_resume.personal_data)
-                if processed_resume.personal_data
-                else None,
-                "experiences": json.loads(processed_resume.experiences).get(
-                    "experiences", []
-                )
-                if processed_resume.experiences
-                else None,
-                "projects": json.loads(processed_resume.projects).get("projects", [])
-                if processed_resume.projects
-                else [],
-                "skills": json.loads(processed_resume.skills).get("skills", [])
-                if processed_resume.skills
-                else [],
-                "research_work": json.loads(processed_resume.research_work).get(
-                    "research_work", []
-                )
-                if processed_resume.research_work
-                else [],
-                "achievements": json.loads(processed_resume.achievements).get(
-                    "achievements", []
-                )
-                if processed_resume.achievements
-                else [],
-                "education": json.loads(processed_resume.education).get("education", [])
-                if processed_resume.education
-                else [],
-                "extracted_keywords": json.loads(
-                    processed_resume.extracted_keywords
-                ).get("extracted_keywords", [])
-                if processed_resume.extracted_keywords
-                else [],
-                "processed_at": processed_resume.processed_at.isoformat()
-                if processed_resume.processed_at
-                else None,
             }
-
+        if "processing_status" in fields:
+            combined_data["processing_status"] = resume.processing_status or (
+                "processed" if processed_resume else "failed"
+            )
+        if "processing_error" in fields:
+            combined_data["processing_error"] = resume.processing_error
+        if "processed_resume" in fields:
+            combined_data["processed_resume"] = (
+                processed_resume_to_dict(processed_resume) if processed_resume else None
+            )
         return combined_data
 
     async def update_processed_resume_data(self, resume_id: str, updated_data: dict) -> None:
@@ -325,50 +565,27 @@ class ResumeService:
         Raises:
             ResumeNotFoundError: If the resume is not found
         """
-        # Check if resume exists
-        resume_query = select(Resume).where(Resume.resume_id == resume_id)
-        resume_result = await self.db.execute(resume_query)
-        resume = resume_result.scalars().first()
+        # Load the resume together with its existing processed data
+        record = await RecordLoader(self.db).resume(resume_id)
         
-        if not resume:
+        if not record:
             raise ResumeNotFoundError(resume_id=resume_id)
         
-        # Get existing processed resume
-        processed_query = select(ProcessedResume).where(
-            ProcessedResume.resume_id == resume_id
-        )
-        processed_result = await self.db.execute(processed_query)
-        processed_resume = processed_result.scalars().first()
+        _, processed_resume = record
         
         if not processed_resume:
             raise ResumeNotFoundError(resume_id=resume_id, message="Processed resume data not found")
         
         # Update the processed resume data
-        if "personal_data" in updated_data:
-            processed_resume.personal_data = json.dumps(updated_data["personal_data"])
-        
-        if "experiences" in updated_data:
-            processed_resume.experiences = json.dumps({"experiences": updated_data["experiences"]})
-        
-        if "education" in updated_data:
-            processed_resume.education = json.dumps({"education": updated_data["education"]})
-        
-        if "projects" in updated_data:
-            processed_resume.projects = json.dumps({"projects": updated_data["projects"]})
+        for field in RESUME_OBJECT_FIELDS + RESUME_LIST_FIELDS:
+            if field in updated_data:
+                setattr(processed_resume, field, updated_data[field])
         
-        if "skills" in updated_data:
-            processed_resume.skills = json.dumps({"skills": updated_data["skills"]})
-        
-        if "research_work" in updated_data:
-            processed_resume.research_work = json.dumps({"research_work": updated_data["research_work"]})
-        
-        if "achievements" in updated_data:
-            processed_resume.achievements = json.dumps({"achievements": updated_data["achievements"]})
-        
-        if "extracted_keywords" in updated_data:
-            processed_resume.extracted_keywords = json.dumps({"extracted_keywords": updated_data["extracted_keywords"]})
-        
-        # Update the processed_at timestamp
+        # Update the processed_at timestamp; edited data is no longer reused for duplicate uploads
         processed_resume.processed_at = datetime.utcnow()
-        
+        processed_resume.edited_at = processed_resume.processed_at
+
+        # Memoized improvement results were computed from the old data
+        await ImprovementResultStore(self.db).invalidate_resume(resume_id)
+
         await self.db.commit()
\ No newline at end of file
@@ -1,5 +1,5 @@
-import gc
 import json
+import heapq
 import asyncio
 import logging
 import markdown
@@ -8,13 +8,21 @@ import numpy as np
 from sqlalchemy.future import select
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Optional, Tuple, AsyncGenerator
+from typing import Dict, List, Optional, Tuple, AsyncGenerator
 
+from app.core import settings, release_connection
 from app.prompt import prompt_factory
+from app.core.profiling import track_allocations
 from app.schemas.json import json_schema_factory
 from app.schemas.pydantic import ResumePreviewerModel, ResumeAnalysisModel
 from app.agent import EmbeddingManager, AgentManager
 from app.models import Resume, Job, ProcessedResume, ProcessedJob
+from .loader import RecordLoader
+from .serializers import extracted_keywords
+from .pipeline import Stage, StageGraph
+from .result_store import ImprovementResultStore
+from .embedding_store import EmbeddingStore, get_embedding_store
+from .lexical_scorer import LexicalIndex, LexicalScorer
 from .exceptions import (
     ResumeNotFoundError,
     JobNotFoundError,
@@ -35,12 +43,52 @@ class ScoreImprovementService:
     the scoring process.
     """
 
-    def __init__(self, db: AsyncSession, max_retries: int = 5):
+    # Per-stage timeouts in seconds for the pipeline; ``None`` means unbounded.
+    STAGE_TIMEOUTS: Dict[str, Optional[float]] = {
+        "resume_embedding": 120.0,
+        "job_keywords_embedding": 120.0,
+        "score": None,
+        "improve": None,
+        "preview": 600.0,
+        "analysis": 600.0,
+    }
+
+    # SSE status/message pairs emitted when the corresponding stage starts.
+    _STREAM_MESSAGES: Dict[str, Tuple[str, str]] = {
+        "resume_embedding": ("parsing", "Parsing resume content..."),
+        "score": ("scoring", "Calculating compatibility score..."),
+        "improve": ("improving", "Generating improvement suggestions..."),
+        "preview": ("generating_preview", "Creating resume preview..."),
+        "analysis": ("analyzing", "Generating detailed analysis..."),
+    }
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        max_retries: int = 5,
+        stage_timeouts: Optional[Dict[str, Optional[float]]] = None,
+    ):
         self.db = db
         self.max_retries = max_retries
+        self.stage_timeouts = {**self.STAGE_TIMEOUTS, **(stage_timeouts or {})}
         self.md_agent_manager = AgentManager(strategy="md")
         self.json_agent_manager = AgentManager()
         self.embedding_manager = EmbeddingManager()
+        self.embedding_store = get_embedding_store()
+        self.result_store = ImprovementResultStore(db)
+
+    async def _embed(self, text: str) -> np.ndarray:
+        """
+        Embeds stored resume/job text, reusing the shared embedding store when enabled.
+        """
+        if self.embedding_store is None:
+            return await self.embedding_manager.embed(text=text)
+        key = EmbeddingStore.make_key(text)
+        embedding = self.embedding_store.get(key)
+        if embedding is None:
+            embedding = await self.embedding_manager.embed(text=text)
+            self.embedding_store.put(key, embedding)
+        return embedding
 
     def _validate_resume_keywords(
         self, processed_resume: ProcessedResume, resume_id: str
@@ -49,15 +97,7 @@ class ScoreImprovementService:
         Validates that keyword extraction was successful for a resume.
         Raises ResumeKeywordExtractionError if keywords are missing or empty.
         """
-        if not processed_resume.extracted_keywords:
-            raise ResumeKeywordExtractionError(resume_id=resume_id)
-
-        try:
-            keywords_data = json.loads(processed_resume.extracted_keywords)
-            keywords = keywords_data.get("extracted_keywords", [])
-            if not keywords or len(keywords) == 0:
-                raise ResumeKeywordExtractionError(resume_id=resume_id)
-        except json.JSONDecodeError:
+        if not extracted_keywords(processed_resume):
             raise ResumeKeywordExtractionError(resume_id=resume_id)
 
     def _validate_job_keywords(self, processed_job: ProcessedJob, job_id: str) -> None:
@@ -65,34 +105,15 @@ class ScoreImprovementService:
         Validates that keyword extraction was successful for a job.
         Raises JobKeywordExtractionError if keywords are missing or empty.
         """
-        if not processed_job.extracted_keywords:
+        if not extracted_keywords(processed_job):
             raise JobKeywordExtractionError(job_id=job_id)
 
-        try:
-            keywords_data = json.loads(processed_job.extracted_keywords)
-            keywords = keywords_data.get("extracted_keywords", [])
-            if not keywords or len(keywords) == 0:
-                raise JobKeywordExtractionError(job_id=job_id)
-        except json.JSONDecodeError:
-            raise JobKeywordExtractionError(job_id=job_id)
-
-    async def _get_resume(
-        self, resume_id: str
-    ) -> Tuple[Resume | None, ProcessedResume | None]:
-        """
-        Fetches the resume from the database.
-        """
-        query = select(Resume).where(Resume.resume_id == resume_id)
-        result = await self.db.execute(query)
-        resume = result.scalars().first()
-
-        if not resume:
+    def _check_resume(
+        self, record: Optional[Tuple[Resume, Optional[ProcessedResume]]], resume_id: str
+    ) -> Tuple[Resume, ProcessedResume]:
+        if record is None:
             raise ResumeNotFoundError(resume_id=resume_id)
-
-        query = select(ProcessedResume).where(ProcessedResume.resume_id == resume_id)
-        result = await self.db.execute(query)
-        processed_resume = result.scalars().first()
-
+        resume, processed_resume = record
         if not processed_resume:
             raise ResumeParsingError(resume_id=resume_id)
 
@@ -100,21 +121,12 @@ class ScoreImprovementService:
 
         return resume, processed_resume
 
-    async def _get_job(self, job_id: str) -> Tuple[Job | None, ProcessedJob | None]:
-        """
-        Fetches the job from the database.
-        """
-        query = select(Job).where(Job.job_id == job_id)
-        result = await self.db.execute(query)
-        job = result.scalars().first()
-
-        if not job:
+    def _check_job(
+        self, record: Optional[Tuple[Job, Optional[ProcessedJob]]], job_id: str
+    ) -> Tuple[Job, ProcessedJob]:
+        if record is None:
             raise JobNotFoundError(job_id=job_id)
-
-        query = select(ProcessedJob).where(ProcessedJob.job_id == job_id)
-        result = await self.db.execute(query)
-        processed_job = result.scalars().first()
-
+        job, processed_job = record
         if not processed_job:
             raise JobParsingError(job_id=job_id)
 
@@ -122,6 +134,20 @@ class ScoreImprovementService:
 
         return job, processed_job
 
+    async def _get_resume(
+        self, resume_id: str
+    ) -> Tuple[Resume | None, ProcessedResume | None]:
+        """
+        Fetches the resume from the database.
+        """
+        return self._check_resume(await RecordLoader(self.db).resume(resume_id), resume_id)
+
+    async def _get_job(self, job_id: str) -> Tuple[Job | None, ProcessedJob | None]:
+        """
+        Fetches the job from the database.
+        """
+        return self._check_job(await RecordLoader(self.db).job(job_id), job_id)
+
     def calculate_cosine_similarity(
         self,
         extracted_job_keywords_embedding: np.ndarray,
@@ -263,156 +289,276 @@ class ScoreImprovementService:
                 "improvements": []
             }
 
-    async def run(self, resume_id: str, job_id: str) -> Dict:
-        """
-        Main method to run the scoring and improving process and return dict.
+    async def rank_resumes(
+        self,
+        job_id: str,
+        limit: int = 20,
+        min_coverage: float = settings.LEXICAL_GATE_MIN_COVERAGE,
+        rerank_top_k: int = settings.LEXICAL_RERANK_TOP_K,
+    ) -> List[Dict]:
         """
+        Ranks stored resumes against a job.
 
-        resume, processed_resume = await self._get_resume(resume_id)
-        job, processed_job = await self._get_job(job_id)
+        Every resume is first scored lexically (BM25 + keyword coverage), which
+        needs no model call. Resumes below ``min_coverage`` are dropped, and only
+        the ``rerank_top_k`` best are embedded and re-ordered by cosine similarity.
+        """
+        _, processed_job = await self._get_job(job_id)
+        job_keywords = extracted_keywords(processed_job)
+        corpus = await LexicalIndex(self.db).snapshot(
+            LexicalScorer.query_terms(job_keywords)
+        )
 
-        extracted_job_keywords = ", ".join(
-            json.loads(processed_job.extracted_keywords).get("extracted_keywords", [])
+        ranked: List[Tuple[str, Dict]] = []
+        rows = await self.db.stream(
+            select(Resume.resume_id, Resume.content).execution_options(yield_per=200)
         )
+        async for partition in rows.partitions():
+            ranked = heapq.nlargest(
+                limit,
+                ranked
+                + LexicalScorer.rank(job_keywords, partition, corpus, limit, min_coverage),
+                key=lambda item: item[1]["bm25"],
+            )
 
-        extracted_resume_keywords = ", ".join(
-            json.loads(processed_resume.extracted_keywords).get(
-                "extracted_keywords", []
+        candidates = ranked[:rerank_top_k]
+        cosine_scores: Dict[str, float] = {}
+        if candidates:
+            contents = dict(
+                (
+                    await self.db.execute(
+                        select(Resume.resume_id, Resume.content).where(
+                            Resume.resume_id.in_([rid for rid, _ in candidates])
+                        )
+                    )
+                ).all()
             )
-        )
+            await release_connection(self.db)
+            job_embedding, *resume_embeddings = await asyncio.gather(
+                self._embed(", ".join(job_keywords)),
+                *(self._embed(contents[rid]) for rid, _ in candidates),
+            )
+            for (rid, _), embedding in zip(candidates, resume_embeddings):
+                cosine_scores[rid] = self.calculate_cosine_similarity(job_embedding, embedding)
+
+        reranked = sorted(candidates, key=lambda item: cosine_scores[item[0]], reverse=True)
+        return [
+            {
+                "resume_id": rid,
+                "lexical_score": lexical,
+                "cosine_similarity": cosine_scores.get(rid),
+            }
+            for rid, lexical in reranked + ranked[rerank_top_k:]
+        ]
 
-        resume_embedding_task = asyncio.create_task(
-            self.embedding_manager.embed(resume.content)
-        )
-        job_kw_embedding_task = asyncio.create_task(
-            self.embedding_manager.embed(extracted_job_keywords)
-        )
-        resume_embedding, extracted_job_keywords_embedding = await asyncio.gather(
-            resume_embedding_task, job_kw_embedding_task
+    async def _load(self, resume_id: str, job_id: str) -> Dict:
+        """
+        Fetches the resume and job along with their extracted keywords.
+        """
+        resume_record, job_record = await RecordLoader(self.db).resume_and_job(
+            resume_id, job_id
         )
+        resume, processed_resume = self._check_resume(resume_record, resume_id)
+        job, processed_job = self._check_job(job_record, job_id)
+        job_keywords = extracted_keywords(processed_job)
+        return {
+            "resume": resume,
+            "job": job,
+            "job_keywords": job_keywords,
+            "corpus": await LexicalIndex(self.db).snapshot(
+                LexicalScorer.query_terms(job_keywords)
+            ),
+            "extracted_job_keywords": ", ".join(job_keywords),
+            "extracted_resume_keywords": ", ".join(
+                extracted_keywords(processed_resume)
+            ),
+        }
 
-        cosine_similarity_score = self.calculate_cosine_similarity(
-            extracted_job_keywords_embedding, resume_embedding
-        )
-        updated_resume, updated_score = await self.improve_score_with_llm(
-            resume=resume.content,
-            extracted_resume_keywords=extracted_resume_keywords,
-            job=job.content,
-            extracted_job_keywords=extracted_job_keywords,
-            previous_cosine_similarity_score=cosine_similarity_score,
-            extracted_job_keywords_embedding=extracted_job_keywords_embedding,
+    @staticmethod
+    def _lexical_score(load: Dict) -> Dict:
+        return LexicalScorer.score(
+            load["job_keywords"], load["resume"].content, load["corpus"]
         )
 
-        resume_preview = await self.get_resume_for_previewer(
-            updated_resume=updated_resume
+    def _cache_key(self, load: Dict) -> str:
+        return self.result_store.make_key(
+            resume_content=load["resume"].content,
+            resume_keywords=load["extracted_resume_keywords"],
+            job_content=load["job"].content,
+            job_keywords=load["extracted_job_keywords"],
+            max_retries=self.max_retries,
         )
 
-        logger.info(f"Resume Preview: {resume_preview}")
+    def _build_graph(self, load: Dict) -> StageGraph:
+        """
+        Declares the scoring/improvement pipeline as a graph of stages.
 
-        # Generate detailed analysis
-        analysis = await self.generate_analysis(
-            original_resume=resume.content,
-            improved_resume=updated_resume,
-            job_description=job.content,
-            original_score=cosine_similarity_score,
-            new_score=updated_score,
-        )
+        The embeddings run side by side, and the preview and analysis both only
+        depend on the improved resume, so they run concurrently as well.
+        """
+
+        async def lexical() -> Dict:
+            return self._lexical_score(load)
 
-        logger.info(f"Resume Analysis: {analysis}")
+        async def resume_embedding() -> np.ndarray:
+            return await self._embed(load["resume"].content)
 
-        execution = {
+        async def job_keywords_embedding() -> np.ndarray:
+            return await self._embed(load["extracted_job_keywords"])
+
+        async def score(
+            resume_embedding: np.ndarray, job_keywords_embedding: np.ndarray
+        ) -> float:
+            return self.calculate_cosine_similarity(
+                job_keywords_embedding, resume_embedding
+            )
+
+        async def improve(
+            job_keywords_embedding: np.ndarray, score: float
+        ) -> Tuple[str, float]:
+            return await self.improve_score_with_llm(
+                resume=load["resume"].content,
+                extracted_resume_keywords=load["extracted_resume_keywords"],
+                job=load["job"].content,
+                extracted_job_keywords=load["extracted_job_keywords"],
+                previous_cosine_similarity_score=score,
+                extracted_job_keywords_embedding=job_keywords_embedding,
+            )
+
+        async def preview(improve: Tuple[str, float]) -> Optional[Dict]:
+            updated_resume, _ = improve
+            return await self.get_resume_for_previewer(updated_resume=updated_resume)
+
+        async def analysis(score: float, improve: Tuple[str, float]) -> Dict:
+            updated_resume, updated_score = improve
+            return await self.generate_analysis(
+                original_resume=load["resume"].content,
+                improved_resume=updated_resume,
+                job_description=load["job"].content,
+                original_score=score,
+                new_score=updated_score,
+            )
+
+        stages = [
+            Stage("lexical", lexical),
+            Stage("resume_embedding", resume_embedding),
+            Stage("job_keywords_embedding", job_keywords_embedding),
+            Stage("score", score, ("resume_embedding", "job_keywords_embedding")),
+            Stage("improve", improve, ("job_keywords_embedding", "score")),
+            Stage("preview", preview, ("improve",)),
+            Stage("analysis", analysis, ("score", "improve")),
+        ]
+        return StageGraph(
+            stages=[
+                Stage(s.name, s.func, s.depends_on, self.stage_timeouts.get(s.name))
+                for s in stages
+            ],
+            name="score_improvement",
+        )
+
+    def _build_execution(self, resume_id: str, job_id: str, results: Dict) -> Dict:
+        """
+        Assembles the response payload from the pipeline results.
+        """
+        updated_resume, updated_score = results["improve"]
+        analysis = results["analysis"]
+        return {
             "resume_id": resume_id,
             "job_id": job_id,
-            "original_score": cosine_similarity_score,
+            "original_score": results["score"],
             "new_score": updated_score,
+            "lexical_score": results["lexical"],
             "updated_resume": markdown.markdown(text=updated_resume),
-            "resume_preview": resume_preview,
+            "resume_preview": results["preview"],
             "details": analysis.get("details", ""),
             "commentary": analysis.get("commentary", ""),
             "improvements": analysis.get("improvements", []),
         }
 
-        gc.collect()
-
-        return execution
-
-    async def run_and_stream(self, resume_id: str, job_id: str) -> AsyncGenerator:
+    async def run(self, resume_id: str, job_id: str, force: bool = False) -> Dict:
         """
         Main method to run the scoring and improving process and return dict.
-        """
-
-        yield f"data: {json.dumps({'status': 'starting', 'message': 'Analyzing resume and job description...'})}\n\n"
-        await asyncio.sleep(2)
-
-        resume, processed_resume = await self._get_resume(resume_id)
-        job, processed_job = await self._get_job(job_id)
 
-        yield f"data: {json.dumps({'status': 'parsing', 'message': 'Parsing resume content...'})}\n\n"
-        await asyncio.sleep(2)
+        A previously computed result for byte-identical inputs is returned
+        as-is unless ``force`` is set.
+        """
+        with track_allocations(f"improve resume={resume_id} job={job_id}"):
+            return await self._run(resume_id, job_id, force)
 
-        extracted_job_keywords = ", ".join(
-            json.loads(processed_job.extracted_keywords).get("extracted_keywords", [])
-        )
+    async def _run(self, resume_id: str, job_id: str, force: bool) -> Dict:
+        load = await self._load(resume_id, job_id)
+        cache_key = self._cache_key(load)
 
-        extracted_resume_keywords = ", ".join(
-            json.loads(processed_resume.extracted_keywords).get(
-                "extracted_keywords", []
-            )
-        )
+        if not force:
+            cached = await self.result_store.get(cache_key)
+            if cached is not None:
+                return {
+                    **cached,
+                    "resume_id": resume_id,
+                    "job_id": job_id,
+                    "lexical_score": self._lexical_score(load),
+                }
 
-        resume_embedding = await self.embedding_manager.embed(text=resume.content)
-        extracted_job_keywords_embedding = await self.embedding_manager.embed(
-            text=extracted_job_keywords
-        )
-
-        yield f"data: {json.dumps({'status': 'scoring', 'message': 'Calculating compatibility score...'})}\n\n"
-        await asyncio.sleep(3)
+        # The pipeline only calls model providers: don't hold a connection meanwhile
+        await release_connection(self.db)
+        results = await self._build_graph(load).run()
 
-        cosine_similarity_score = self.calculate_cosine_similarity(
-            extracted_job_keywords_embedding, resume_embedding
-        )
+        logger.info(f"Resume Preview: {results['preview']}")
+        logger.info(f"Resume Analysis: {results['analysis']}")
 
-        yield f"data: {json.dumps({'status': 'scored', 'score': cosine_similarity_score})}\n\n"
+        execution = self._build_execution(resume_id, job_id, results)
+        await self.result_store.put(cache_key, resume_id, job_id, execution)
 
-        yield f"data: {json.dumps({'status': 'improving', 'message': 'Generating improvement suggestions...'})}\n\n"
-        await asyncio.sleep(3)
+        return execution
 
-        updated_resume, updated_score = await self.improve_score_with_llm(
-            resume=resume.content,
-            extracted_resume_keywords=extracted_resume_keywords,
-            job=job.content,
-            extracted_job_keywords=extracted_job_keywords,
-            previous_cosine_similarity_score=cosine_similarity_score,
-            extracted_job_keywords_embedding=extracted_job_keywords_embedding,
-        )
+    async def run_and_stream(
+        self, resume_id: str, job_id: str, force: bool = False
+    ) -> AsyncGenerator:
+        """
+        Main method to run the scoring and improving process and stream progress as SSE.
+        """
+        with track_allocations(f"improve (stream) resume={resume_id} job={job_id}"):
+            async for event in self._run_and_stream(resume_id, job_id, force):
+                yield event
 
-        yield f"data: {json.dumps({'status': 'generating_preview', 'message': 'Creating resume preview...'})}\n\n"
-        
-        resume_preview = await self.get_resume_for_previewer(
-            updated_resume=updated_resume
-        )
-        
-        yield f"data: {json.dumps({'status': 'analyzing', 'message': 'Generating detailed analysis...'})}\n\n"
-        
-        # Generate detailed analysis
-        analysis = await self.generate_analysis(
-            original_resume=resume.content,
-            improved_resume=updated_resume,
-            job_description=job.content,
-            original_score=cosine_similarity_score,
-            new_score=updated_score,
-        )
+    async def _run_and_stream(
+        self, resume_id: str, job_id: str, force: bool
+    ) -> AsyncGenerator:
+        yield f"data: {json.dumps({'status': 'starting', 'message': 'Analyzing resume and job description...'})}\n\n"
 
-        final_result = {
-            "resume_id": resume_id,
-            "job_id": job_id,
-            "original_score": cosine_similarity_score,
-            "new_score": updated_score,
-            "updated_resume": markdown.markdown(text=updated_resume),
-            "resume_preview": resume_preview,
-            "details": analysis.get("details", ""),
-            "commentary": analysis.get("commentary", ""),
-            "improvements": analysis.get("improvements", []),
-        }
+        load = await self._load(resume_id, job_id)
+        cache_key = self._cache_key(load)
+
+        if not force:
+            cached = await self.result_store.get(cache_key)
+            if cached is not None:
+                final_result = {
+                    **cached,
+                    "resume_id": resume_id,
+                    "job_id": job_id,
+                    "lexical_score": self._lexical_score(load),
+                }
+                yield f"data: {json.dumps({'status': 'completed', 'result': final_result})}\n\n"
+                return
+
+        results: Dict = {}
+
+        await release_connection(self.db)
+        async for event in self._build_graph(load).stream():
+            if event.status == "started":
+                message = self._STREAM_MESSAGES.get(event.stage)
+                if message:
+                    status, text = message
+                    yield f"data: {json.dumps({'status': status, 'message': text})}\n\n"
+                continue
+
+            results[event.stage] = event.result
+            if event.stage == "lexical":
+                yield f"data: {json.dumps({'status': 'lexical_scored', 'lexical_score': event.result})}\n\n"
+            elif event.stage == "score":
+                yield f"data: {json.dumps({'status': 'scored', 'score': event.result})}\n\n"
+
+        final_result = self._build_execution(resume_id, job_id, results)
+        await self.result_store.put(cache_key, resume_id, job_id, final_result)
 
         yield f"data: {json.dumps({'status': 'completed', 'result': final_result})}\n\n"
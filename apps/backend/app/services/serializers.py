@@ -0,0 +1,106 @@
+import json
+
+from typing import Any, Dict, Optional
+
+from app.models import ProcessedResume, ProcessedJob
+
+# JSON columns of the processed tables. List fields are stored as plain JSON
+# arrays; older rows hold them as JSON-encoded strings of ``{"<field>": [...]}``.
+RESUME_OBJECT_FIELDS = ("personal_data",)
+RESUME_LIST_FIELDS = (
+    "experiences",
+    "projects",
+    "skills",
+    "research_work",
+    "achievements",
+    "education",
+    "extracted_keywords",
+)
+JOB_OBJECT_FIELDS = ("company_profile", "location")
+JOB_LIST_FIELDS = (
+    "key_responsibilities",
+    "qualifications",
+    "compensation_and_benfits",
+    "application_info",
+    "extracted_keywords",
+)
+
+
+def decode_field(value: Any, field: Optional[str] = None) -> Any:
+    """
+    Returns the native value of a processed JSON column.
+
+    Native values pass through untouched. Values in the legacy format are
+    decoded once more and, for list fields (``field`` given), unwrapped from
+    their ``{"<field>": [...]}`` envelope.
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return value
+    if field is not None and isinstance(value, dict) and set(value) == {field}:
+        value = value[field]
+    return value
+
+
+def extracted_keywords(processed: ProcessedResume | ProcessedJob) -> list:
+    keywords = decode_field(processed.extracted_keywords, "extracted_keywords")
+    return keywords if isinstance(keywords, list) else []
+
+
+def processed_resume_values(structured_resume: Dict) -> Dict[str, Any]:
+    """
+    Column values of a ``ProcessedResume`` for a validated structured resume.
+    Empty fields are stored as NULL.
+    """
+    return {
+        field: structured_resume.get(field) or None
+        for field in RESUME_OBJECT_FIELDS + RESUME_LIST_FIELDS
+    }
+
+
+def processed_job_values(structured_job: Dict) -> Dict[str, Any]:
+    """
+    Column values of a ``ProcessedJob`` for a validated structured job.
+    Empty fields are stored as NULL.
+    """
+    values = {
+        field: structured_job.get(field) or None
+        for field in JOB_OBJECT_FIELDS + JOB_LIST_FIELDS
+    }
+    for field in ("job_title", "date_posted", "employment_type", "job_summary"):
+        values[field] = structured_job.get(field)
+    return values
+
+
+def processed_resume_to_dict(processed_resume: ProcessedResume) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        field: decode_field(getattr(processed_resume, field))
+        for field in RESUME_OBJECT_FIELDS
+    }
+    for field in RESUME_LIST_FIELDS:
+        data[field] = decode_field(getattr(processed_resume, field), field) or []
+    data["processed_at"] = (
+        processed_resume.processed_at.isoformat()
+        if processed_resume.processed_at
+        else None
+    )
+    return data
+
+
+def processed_job_to_dict(processed_job: ProcessedJob) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "job_title": processed_job.job_title,
+        "company_profile": decode_field(processed_job.company_profile),
+        "location": decode_field(processed_job.location),
+        "date_posted": processed_job.date_posted,
+        "employment_type": processed_job.employment_type,
+        "job_summary": processed_job.job_summary,
+    }
+    for field in JOB_LIST_FIELDS:
+        data[field] = decode_field(getattr(processed_job, field), field) or None
+    data["processed_at"] = (
+        processed_job.processed_at.isoformat() if processed_job.processed_at else None
+    )
+    return data
@@ -0,0 +1,170 @@
+import os
+import json
+import logging
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "skill_taxonomy.json"
+)
+
+
+class SkillMatcher:
+    """
+    Finds the skills of a taxonomy mentioned in a text, in a single pass.
+
+    The taxonomy maps canonical skill names to aliases (``{"PostgreSQL":
+    ["postgres"]}``); the canonical name is always an alias of itself.
+    Aliases are compiled into an Aho-Corasick automaton, so matching costs
+    one transition per character of the text, however large the vocabulary.
+    Matching is case-insensitive and only accepts whole terms: an alias must
+    not be preceded or followed by a letter or digit. Where aliases overlap,
+    the leftmost, then longest, match wins ("Spring Boot" over "Spring").
+    """
+
+    def __init__(self, taxonomy: Dict[str, Sequence[str]]):
+        # Per automaton state: transitions, failure link and the aliases ending there
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, str]]] = [[]]
+        self.skills = list(taxonomy)
+
+        for canonical, aliases in taxonomy.items():
+            for alias in {canonical.lower(), *(alias.lower() for alias in aliases)}:
+                alias = alias.strip()
+                if alias:
+                    self._add(alias, canonical)
+        self._build_failure_links()
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillMatcher":
+        """
+        Loads a taxonomy file of the form ``{"skills": {canonical: [aliases]}}``.
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["skills"])
+
+    def _add(self, alias: str, canonical: str) -> None:
+        state = 0
+        for char in alias:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append((len(alias), canonical))
+
+    def _build_failure_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Aliases ending at the failure state also end here
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Returns the non-overlapping ``(start, end, canonical)`` matches in ``text``.
+        """
+        text = text.lower()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        candidates: List[Tuple[int, int, str]] = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            end = index + 1
+            if end < len(text) and text[end].isalnum():
+                continue
+            for length, canonical in outputs[state]:
+                start = end - length
+                if start == 0 or not text[start - 1].isalnum():
+                    candidates.append((start, end, canonical))
+
+        candidates.sort(key=lambda match: (match[0], -match[1]))
+        matches: List[Tuple[int, int, str]] = []
+        last_end = 0
+        for start, end, canonical in candidates:
+            if start >= last_end:
+                matches.append((start, end, canonical))
+                last_end = end
+        return matches
+
+    def extract(self, text: str) -> List[str]:
+        """
+        Returns the canonical skills mentioned in ``text``, in order of first mention.
+        """
+        return list(dict.fromkeys(canonical for _, _, canonical in self.find(text)))
+
+    def verify(self, keywords: Sequence[str], text: str) -> List[str]:
+        """
+        Keeps the keywords that are actually supported by ``text``.
+
+        A keyword naming a taxonomy skill (by canonical name or alias) is kept,
+        as its canonical name, if that skill is mentioned in the text. Other
+        keywords are kept if they literally occur in the text. Taxonomy skills
+        found in the text but missing from ``keywords`` are not added.
+        """
+        mentioned = set(self.extract(text))
+        lowered = text.lower()
+        verified: Dict[str, None] = {}
+        for keyword in keywords:
+            if not isinstance(keyword, str) or not keyword.strip():
+                continue
+            keyword = keyword.strip()
+            matches = self.find(keyword)
+            if len(matches) == 1 and matches[0][:2] == (0, len(keyword)):
+                if matches[0][2] in mentioned:
+                    verified[matches[0][2]] = None
+            elif keyword.lower() in lowered:
+                verified[keyword] = None
+        return list(verified)
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """
+    Returns the process-wide matcher for SKILL_TAXONOMY_PATH (or the bundled taxonomy).
+    """
+    path = settings.SKILL_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH
+    matcher = SkillMatcher.from_file(path)
+    logger.info(f"Loaded skill taxonomy with {len(matcher.skills)} skills from {path}")
+    return matcher
+
+
+def resolve_keywords(text: str, llm_keywords: Optional[Sequence[str]]) -> List[str]:
+    """
+    Applies KEYWORD_EXTRACTION_MODE to the keywords extracted by the LLM.
+
+    * ``llm``      - the LLM keywords, unchanged
+    * ``taxonomy`` - the taxonomy skills mentioned in ``text``; the LLM keywords are ignored
+    * ``verify``   - the LLM keywords supported by ``text``, or the taxonomy
+      skills if none of them is
+    """
+    mode = settings.KEYWORD_EXTRACTION_MODE
+    keywords = list(llm_keywords or [])
+    if mode == "llm":
+        return keywords
+    matcher = get_skill_matcher()
+    if mode == "verify":
+        verified = matcher.verify(keywords, text)
+        if len(verified) < len(keywords):
+            logger.info(f"Dropped {len(keywords) - len(verified)} keyword(s) not found in the text")
+        if verified:
+            return verified
+    return matcher.extract(text)
@@ -0,0 +1,312 @@
+import os
+import uuid
+import socket
+import asyncio
+import logging
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import settings, AsyncSessionLocal
+from app.models import Task
+from .exceptions import TaskNotFoundError
+from .resume_service import ResumeService
+from .score_improvement_service import ScoreImprovementService
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class TaskQueue:
+    """
+    Durable background task queue backed by the application database.
+
+    Tasks are rows in the ``tasks`` table, so they survive restarts. Workers
+    claim a task by atomically moving it to ``running`` with a time-limited
+    lease (compare-and-set on status and lease expiry), which lets several
+    uvicorn processes share one queue safely. A running task keeps renewing its
+    lease; if its worker dies, the lease expires and another worker picks the
+    task up again, up to ``max_attempts`` times.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        workers: int = settings.TASK_WORKERS,
+        lease_seconds: int = settings.TASK_LEASE_SECONDS,
+        poll_interval: float = settings.TASK_POLL_INTERVAL_SECONDS,
+        max_attempts: int = settings.TASK_MAX_ATTEMPTS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._workers = workers
+        self._lease = timedelta(seconds=lease_seconds)
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._handlers: Dict[str, TaskHandler] = {}
+        self._worker_tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def register(self, kind: str, handler: TaskHandler) -> None:
+        """
+        Registers the coroutine that executes tasks of the given kind.
+        """
+        self._handlers[kind] = handler
+
+    async def submit(self, kind: str, payload: Dict[str, Any]) -> str:
+        """
+        Persists a new task and returns its id without waiting for it to run.
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for task kind '{kind}'")
+
+        task_id = str(uuid.uuid4())
+        now = _utcnow()
+        async with self._session_factory() as db:
+            db.add(
+                Task(
+                    task_id=task_id,
+                    kind=kind,
+                    payload=payload,
+                    status="queued",
+                    attempts=0,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            await db.commit()
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return task_id
+
+    async def get(self, task_id: str) -> Dict[str, Any]:
+        """
+        Returns the current state of a task.
+
+        Raises:
+            TaskNotFoundError: If the task does not exist
+        """
+        async with self._session_factory() as db:
+            task = await db.scalar(select(Task).where(Task.task_id == task_id))
+            if not task:
+                raise TaskNotFoundError(task_id=task_id)
+            return self._serialize(task)
+
+    async def follow(self, task_id: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Yields the task state every time it changes, until it reaches a terminal status.
+        """
+        last_seen = None
+        while True:
+            snapshot = await self.get(task_id)
+            marker = (snapshot["status"], snapshot["attempts"])
+            if marker != last_seen:
+                last_seen = marker
+                yield snapshot
+            if snapshot["status"] in TERMINAL_STATUSES:
+                return
+            await asyncio.sleep(self._poll_interval)
+
+    async def start(self) -> None:
+        """
+        Starts the worker pool in the running event loop.
+        """
+        if self._worker_tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker_loop(n)) for n in range(self._workers)
+        ]
+        logger.info(f"Task queue {self.worker_id} started with {self._workers} worker(s)")
+
+    async def stop(self) -> None:
+        """
+        Stops the worker pool. Tasks still running keep their lease and are
+        picked up again by another worker once it expires.
+        """
+        for worker in self._worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._wakeup = None
+
+    async def _worker_loop(self, n: int) -> None:
+        while True:
+            try:
+                task = await self._claim_next()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Task worker {n} failed to lease a task: {e}")
+                task = None
+
+            if task is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._execute(task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The lease is left to expire, so another worker retries the task.
+                logger.error(f"Task worker {n} failed to run task {task['task_id']}: {e}")
+
+    async def _claim_next(self) -> Optional[Dict[str, Any]]:
+        """
+        Leases the oldest runnable task for this worker, or returns None.
+        """
+        now = _utcnow()
+        claimable = or_(
+            Task.status == "queued",
+            and_(Task.status == "running", Task.lease_expires_at < now),
+        )
+
+        async with self._session_factory() as db:
+            # Tasks whose workers keep dying are given up on instead of retried forever.
+            await db.execute(
+                update(Task)
+                .where(
+                    Task.status == "running",
+                    Task.lease_expires_at < now,
+                    Task.attempts >= self._max_attempts,
+                )
+                .values(
+                    status="failed",
+                    error=f"Task abandoned after {self._max_attempts} attempts.",
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    updated_at=now,
+                )
+            )
+            await db.commit()
+
+            candidates = (
+                await db.execute(
+                    select(Task.task_id)
+                    .where(claimable, Task.kind.in_(list(self._handlers)))
+                    .order_by(Task.created_at, Task.id)
+                    .limit(self._workers)
+                )
+            ).scalars().all()
+
+            for task_id in candidates:
+                claimed = await db.execute(
+                    update(Task)
+                    .where(Task.task_id == task_id, claimable)
+                    .values(
+                        status="running",
+                        lease_owner=self.worker_id,
+                        lease_expires_at=now + self._lease,
+                        attempts=Task.attempts + 1,
+                        updated_at=now,
+                    )
+                )
+                await db.commit()
+                if claimed.rowcount == 1:
+                    task = await db.scalar(select(Task).where(Task.task_id == task_id))
+                    return {"task_id": task.task_id, "kind": task.kind, "payload": task.payload}
+        return None
+
+    async def _execute(self, task: Dict[str, Any]) -> None:
+        task_id = task["task_id"]
+        heartbeat = asyncio.create_task(self._heartbeat(task_id))
+        try:
+            result = await self._handlers[task["kind"]](task["payload"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Task {task_id} ({task['kind']}) failed: {e}")
+            await self._finish(task_id, status="failed", error=str(e))
+        else:
+            await self._finish(task_id, status="succeeded", result=result)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, task_id: str) -> None:
+        interval = max(self._lease.total_seconds() / 3, self._poll_interval)
+        while True:
+            await asyncio.sleep(interval)
+            now = _utcnow()
+            try:
+                async with self._session_factory() as db:
+                    await db.execute(
+                        update(Task)
+                        .where(Task.task_id == task_id, Task.lease_owner == self.worker_id)
+                        .values(lease_expires_at=now + self._lease, updated_at=now)
+                    )
+                    await db.commit()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to renew the lease of task {task_id}: {e}")
+
+    async def _finish(
+        self,
+        task_id: str,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+    ) -> None:
+        async with self._session_factory() as db:
+            await db.execute(
+                update(Task)
+                .where(Task.task_id == task_id, Task.lease_owner == self.worker_id)
+                .values(
+                    status=status,
+                    result=result,
+                    error=error,
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    updated_at=_utcnow(),
+                )
+            )
+            await db.commit()
+
+    @staticmethod
+    def _serialize(task: Task) -> Dict[str, Any]:
+        return {
+            "task_id": task.task_id,
+            "kind": task.kind,
+            "status": task.status,
+            "attempts": task.attempts,
+            "result": task.result,
+            "error": task.error,
+            "created_at": task.created_at.isoformat() if task.created_at else None,
+            "updated_at": task.updated_at.isoformat() if task.updated_at else None,
+        }
+
+
+async def _run_improvement(payload: Dict[str, Any]) -> Dict:
+    async with AsyncSessionLocal() as db:
+        return await ScoreImprovementService(db=db).run(
+            resume_id=payload["resume_id"],
+            job_id=payload["job_id"],
+            force=payload.get("force", False),
+        )
+
+
+async def _run_resume_extraction(payload: Dict[str, Any]) -> Dict:
+    async with AsyncSessionLocal() as db:
+        await ResumeService(db).extract_structured_resume(payload["resume_id"])
+    return {"resume_id": payload["resume_id"], "processing_status": "processed"}
+
+
+task_queue = TaskQueue()
+task_queue.register("improve", _run_improvement)
+task_queue.register("extract_resume", _run_resume_extraction)
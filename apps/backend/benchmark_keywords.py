@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Fallback Keyword Extraction Benchmark
+
+This script times the text-only keyword extractor used for job descriptions
+when structured LLM extraction is unavailable, over a generated corpus of
+large job descriptions. No database or model provider is needed.
+
+Usage:
+    python benchmark_keywords.py [--documents 500] [--size-kb 20] [--max-ms-per-doc 50]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# No database is used, but importing app modules reads the database settings
+os.environ.setdefault("SYNC_DATABASE_URL", "sqlite://")
+os.environ.setdefault("ASYNC_DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("SESSION_SECRET_KEY", "benchmark")
+
+# Add the parent directory to the path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.keyword_extractor import extract_keywords
+
+
+TITLES = [
+    "Senior Backend Engineer",
+    "Staff Data Engineer",
+    "Full-Stack Developer",
+    "Machine Learning Engineer",
+    "Site Reliability Engineer",
+]
+
+SENTENCES = [
+    "You will design, build and operate services used by millions of customers.",
+    "Experience with Python, Django and PostgreSQL.",
+    "Experience in distributed systems for high-traffic e-commerce platforms.",
+    "Knowledge of AWS, Docker and Kubernetes.",
+    "Proficiency in Go or Rust is a plus.",
+    "Familiarity with CI/CD pipelines and infrastructure-as-code.",
+    "Skills: React, TypeScript, Node.js, GraphQL.",
+    "Required: 5+ years of professional experience.",
+    "Requires strong communication skills in English.",
+    "Bachelor's degree in Computer Science or a related field.",
+    "MSc in Data Science, Statistics or equivalent.",
+    "3 yrs exp with Terraform and Ansible is preferred.",
+    'We value "ownership" and a cross-functional, self-directed way of working.',
+    "Our team works closely with Product, Design and Security.",
+    "The role includes on-call rotations and incident reviews.",
+    "You will mentor engineers and help shape our technical roadmap.",
+    "Competitive salary, equity, remote-first culture and learning budget.",
+]
+
+
+def make_job_description(rng: random.Random, size: int) -> str:
+    parts = [rng.choice(TITLES), ""]
+    length = 0
+    while length < size:
+        paragraph = " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(3, 8)))
+        parts.append(paragraph)
+        parts.append("")
+        length += len(paragraph) + 2
+    return "\n".join(parts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--size-kb", type=float, default=20.0, help="Approximate size of each job description")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-ms-per-doc",
+        type=float,
+        default=None,
+        help="Exit non-zero if the mean time per document exceeds this",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [make_job_description(rng, int(args.size_kb * 1024)) for _ in range(args.documents)]
+    total_mb = sum(len(document) for document in corpus) / (1024 * 1024)
+
+    print("=" * 60)
+    print("Resume Matcher fallback keyword extraction benchmark")
+    print("=" * 60)
+    print(f"Documents: {args.documents}, ~{args.size_kb:g} KiB each ({total_mb:.1f} MiB total)")
+
+    # Warm up
+    for document in corpus[:10]:
+        extract_keywords(document)
+
+    timings = []
+    keyword_counts = []
+    started = time.perf_counter()
+    for document in corpus:
+        t0 = time.perf_counter()
+        keyword_counts.append(len(extract_keywords(document)))
+        timings.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+
+    timings.sort()
+    mean_ms = statistics.fmean(timings)
+    print()
+    print(f"Mean per document:    {mean_ms:8.2f} ms")
+    print(f"p50 per document:     {timings[len(timings) // 2]:8.2f} ms")
+    print(f"p95 per document:     {timings[int(len(timings) * 0.95) - 1]:8.2f} ms")
+    print(f"Throughput:           {args.documents / elapsed:8.1f} docs/s ({total_mb / elapsed:.1f} MiB/s)")
+    print(f"Keywords per doc:     {statistics.fmean(keyword_counts):8.1f}")
+    print()
+
+    if args.max_ms_per_doc is not None and mean_ms > args.max_ms_per_doc:
+        print(f"❌ Mean time per document exceeds {args.max_ms_per_doc} ms")
+        return 1
+    print("✓ Benchmark completed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
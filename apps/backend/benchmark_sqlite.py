@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+SQLite Tuning Benchmark
+
+This script measures insert and read throughput of the app's SQLite setup
+for each connection profile in SQLITE_PROFILES (``baseline`` is the setup
+before per-connection tuning), against throwaway database files. Inserts
+are committed one per transaction by concurrent writers, as uploads are;
+reads load resumes with their processed data through RecordLoader.
+
+Usage:
+    python benchmark_sqlite.py [--rows 2000] [--reads 5000] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+# Point the app at a throwaway database before any app module reads the settings
+_DB_DIR = tempfile.mkdtemp(prefix="resume-matcher-sqlite-bench-")
+os.environ["SYNC_DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'app.db')}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_DB_DIR, 'app.db')}"
+os.environ.setdefault("SESSION_SECRET_KEY", "benchmark")
+
+# Add the parent directory to the path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import SQLITE_PROFILES, configure_sqlite
+from app.models import Base, Resume, ProcessedResume
+from app.services.loader import RecordLoader
+
+
+RESUME = "# Jane Doe\n\n## Experience\nSenior Software Engineer, Acme Corp\n" * 40
+
+
+async def run_profile(profile: str, rows: int, reads: int, concurrency: int) -> dict:
+    path = os.path.join(_DB_DIR, f"{profile}.db")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    configure_sqlite(engine.sync_engine, SQLITE_PROFILES[profile])
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    resume_ids = [str(uuid.uuid4()) for _ in range(rows)]
+    queue = list(resume_ids)
+    errors = 0
+
+    async def writer() -> None:
+        nonlocal errors
+        async with session_factory() as db:
+            while queue:
+                resume_id = queue.pop()
+                db.add(Resume(resume_id=resume_id, content=RESUME, content_type="md"))
+                db.add(
+                    ProcessedResume(
+                        resume_id=resume_id,
+                        personal_data={"name": "Jane Doe"},
+                        skills=[{"category": "Languages", "skill_name": "Python"}],
+                        extracted_keywords=["Python", "FastAPI", "PostgreSQL"],
+                    )
+                )
+                try:
+                    await db.commit()
+                except OperationalError:
+                    errors += 1
+                    await db.rollback()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(writer() for _ in range(concurrency)))
+    insert_seconds = time.perf_counter() - started
+
+    rng = random.Random(0)
+    lookups = [rng.choice(resume_ids) for _ in range(reads)]
+
+    async def reader(ids: list) -> None:
+        async with session_factory() as db:
+            loader = RecordLoader(db)
+            for resume_id in ids:
+                await loader.resume(resume_id)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(reader(lookups[i::concurrency]) for i in range(concurrency)))
+    read_seconds = time.perf_counter() - started
+
+    await engine.dispose()
+    return {
+        "inserts_per_s": rows / insert_seconds,
+        "reads_per_s": reads / read_seconds,
+        "errors": errors,
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Resume Matcher SQLite tuning benchmark")
+    print("=" * 60)
+    print(f"Rows: {args.rows}, reads: {args.reads}, concurrency: {args.concurrency}")
+    print()
+    print(f"{'profile':<10} {'inserts/s':>12} {'reads/s':>12} {'lock errors':>12}")
+
+    try:
+        for profile in SQLITE_PROFILES:
+            result = await run_profile(profile, args.rows, args.reads, args.concurrency)
+            print(
+                f"{profile:<10} {result['inserts_per_s']:>12.1f} "
+                f"{result['reads_per_s']:>12.1f} {result['errors']:>12}"
+            )
+    finally:
+        shutil.rmtree(_DB_DIR, ignore_errors=True)
+
+    print()
+    print("✓ Benchmark completed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Memory Soak Test Script
+
+This script drives the resume improvement pipeline repeatedly against a
+throwaway SQLite database, with stub LLM and embedding providers, and reports
+how the process RSS evolves. Use it to check whether the pipeline leaks memory
+across requests.
+
+Usage:
+    python soak_test.py [--iterations 500] [--concurrency 8] [--max-growth-mb 50]
+
+Set MEMORY_PROFILING=true to also log tracemalloc allocation reports per request.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+# Point the app at a throwaway database before any app module reads the settings
+_DB_DIR = tempfile.mkdtemp(prefix="resume-matcher-soak-")
+_DB_PATH = os.path.join(_DB_DIR, "soak.db")
+os.environ["SYNC_DATABASE_URL"] = f"sqlite:///{_DB_PATH}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+os.environ.setdefault("SESSION_SECRET_KEY", "soak-test")
+
+# Add the parent directory to the path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core import settings, AsyncSessionLocal, async_engine
+from app.agent.manager import AgentManager, EmbeddingManager
+from app.agent.providers.base import Provider, EmbeddingProvider
+from app.models import Base, Resume, ProcessedResume, Job, ProcessedJob
+from app.services import ScoreImprovementService
+
+
+RESUME = """# Jane Doe
+jane.doe@example.com | +1 555 0100
+
+## Experience
+Senior Software Engineer, Acme Corp (2020 - Present)
+- Built Python and FastAPI services backed by PostgreSQL
+- Migrated deployments to Docker and Kubernetes
+
+## Skills
+Python, FastAPI, SQL, Docker, Kubernetes
+"""
+
+JOB = """Senior Backend Engineer
+
+Experience with Python, Django and PostgreSQL. Knowledge of AWS and Kubernetes.
+"""
+
+
+class StubProvider(Provider):
+    """Answers every prompt type of the pipeline without calling a model."""
+
+    async def __call__(self, prompt: str, **generation_args) -> str:
+        await asyncio.sleep(0)
+        if "resume editor" in prompt:
+            return RESUME + f"\n- Improved with keyword {random.randint(0, 10**6)}\n"
+        if "resume analyst" in prompt:
+            return json.dumps(
+                {
+                    "details": "Good match.",
+                    "commentary": "Strong backend profile.",
+                    "improvements": [{"suggestion": "Mention AWS."}],
+                }
+            )
+        return json.dumps(
+            {
+                "personalInfo": {"name": "Jane Doe", "email": "jane.doe@example.com", "phone": "+1 555 0100"},
+                "experience": [{"id": 1, "title": "Senior Software Engineer", "description": ["Built services"]}],
+                "education": [],
+                "skills": ["Python", "FastAPI"],
+            }
+        )
+
+
+class StubEmbeddingProvider(EmbeddingProvider):
+    """Returns a deterministic pseudo-random embedding per text."""
+
+    async def embed(self, text: str) -> list[float]:
+        rnd = random.Random(text)
+        return [rnd.random() for _ in range(1024)]
+
+
+async def _stub_provider(self, **kwargs):
+    return StubProvider()
+
+
+async def _stub_embedding_provider(self, **kwargs):
+    return StubEmbeddingProvider()
+
+
+def current_rss_mb() -> float:
+    """Current resident set size, falling back to the peak where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def seed() -> None:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        db.add(Resume(resume_id="soak-resume", content=RESUME, content_type="md"))
+        db.add(
+            ProcessedResume(
+                resume_id="soak-resume",
+                personal_data={"firstName": "Jane"},
+                extracted_keywords=["Python", "FastAPI"],
+            )
+        )
+        db.add(Job(job_id="soak-job", resume_id="soak-resume", content=JOB))
+        db.add(
+            ProcessedJob(
+                job_id="soak-job",
+                job_title="Senior Backend Engineer",
+                job_summary=JOB,
+                extracted_keywords=["Python", "AWS"],
+            )
+        )
+        await db.commit()
+
+
+async def run_once() -> None:
+    async with AsyncSessionLocal() as db:
+        await ScoreImprovementService(db=db).run("soak-resume", "soak-job", force=True)
+
+
+async def soak(iterations: int, concurrency: int, warmup: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+
+    async def guarded() -> None:
+        async with semaphore:
+            await run_once()
+
+    for _ in range(warmup):
+        await run_once()
+
+    batch = max(concurrency, 1)
+    for start in range(0, iterations, batch):
+        await asyncio.gather(*(guarded() for _ in range(min(batch, iterations - start))))
+        samples.append(current_rss_mb())
+    return samples
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--max-growth-mb",
+        type=float,
+        default=50.0,
+        help="Exit non-zero if RSS grows more than this after warmup",
+    )
+    args = parser.parse_args()
+
+    if settings.MEMORY_PROFILING:
+        profiling_logger = logging.getLogger("app.core.profiling")
+        profiling_logger.setLevel(logging.INFO)
+        profiling_logger.addHandler(logging.StreamHandler(sys.stderr))
+
+    AgentManager._get_provider = _stub_provider
+    EmbeddingManager._get_embedding_provider = _stub_embedding_provider
+
+    print("=" * 60)
+    print("Resume Matcher memory soak test")
+    print("=" * 60)
+    print(f"Database: {_DB_PATH}")
+    print(f"Iterations: {args.iterations}, concurrency: {args.concurrency}")
+
+    await seed()
+    baseline = current_rss_mb()
+    started = time.perf_counter()
+    samples = await soak(args.iterations, args.concurrency, args.warmup)
+    elapsed = time.perf_counter() - started
+    await async_engine.dispose()
+
+    after_warmup = samples[0] if samples else baseline
+    final = samples[-1] if samples else baseline
+    growth = final - after_warmup
+
+    print()
+    print(f"RSS before soak:      {baseline:8.1f} MiB")
+    print(f"RSS after 1st batch:  {after_warmup:8.1f} MiB")
+    print(f"RSS at end:           {final:8.1f} MiB")
+    print(f"Peak sampled RSS:     {max(samples, default=final):8.1f} MiB")
+    print(f"Growth after warmup:  {growth:+8.1f} MiB")
+    print(f"Throughput:           {args.iterations / elapsed:8.1f} runs/s")
+    print()
+
+    if growth > args.max_growth_mb:
+        print(f"❌ RSS grew by more than {args.max_growth_mb} MiB - possible leak")
+        return 1
+    print("✓ No significant RSS growth detected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,77 @@
+import os
+import sys
+import asyncio
+import tempfile
+
+import pytest
+
+# Point the app at a throwaway database before any app module reads the settings
+_DB_DIR = tempfile.mkdtemp(prefix="resume-matcher-tests-")
+os.environ["SYNC_DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+os.environ.setdefault("SESSION_SECRET_KEY", "test")
+
+# Add the backend directory to the path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.base import create_app
+from app.core import get_db_session
+from app.models import Base
+from app.migrations import run_migrations
+
+# A postgresql+asyncpg URL of a throwaway database; when set, the database
+# tests also run against PostgreSQL. Its public schema is recreated per test.
+POSTGRES_DSN = os.environ.get("TEST_POSTGRES_DSN")
+
+
+async def _prepare_database(url: str) -> None:
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                await conn.execute(text("DROP SCHEMA public CASCADE"))
+                await conn.execute(text("CREATE SCHEMA public"))
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(run_migrations)
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def database_url(request, tmp_path):
+    """
+    URL of an empty database with the app schema, created as at startup:
+    once on SQLite and once on PostgreSQL (skipped without TEST_POSTGRES_DSN).
+    """
+    if request.param == "sqlite":
+        url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    elif POSTGRES_DSN:
+        url = POSTGRES_DSN
+    else:
+        pytest.skip("TEST_POSTGRES_DSN is not set")
+    asyncio.run(_prepare_database(url))
+    return url
+
+
+@pytest.fixture
+def api_client(database_url):
+    """
+    Client of the app whose requests use the ``database_url`` database.
+    """
+
+    async def session():
+        engine = create_async_engine(database_url)
+        try:
+            async with async_sessionmaker(bind=engine, expire_on_commit=False)() as db:
+                yield db
+                await db.commit()
+        finally:
+            await engine.dispose()
+
+    app = create_app()
+    app.dependency_overrides[get_db_session] = session
+    return TestClient(app)
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Resume, ProcessedResume, Job, ProcessedJob
+from app.schemas.pydantic.batch import MAX_BATCH_IDS
+
+
+@pytest.fixture
+def client(api_client, database_url):
+    async def seed():
+        engine = create_async_engine(database_url)
+        async with async_sessionmaker(bind=engine)() as db:
+            db.add(Resume(resume_id="r1", content="# Jane", content_type="md"))
+            db.add(ProcessedResume(resume_id="r1", personal_data={"firstName": "Jane"}))
+            # Stored before processing statuses existed, and never processed
+            db.add(Resume(resume_id="r2", content="# John", content_type="md"))
+            db.add(Job(job_id="j1", resume_id="r1", content="Python"))
+            db.add(ProcessedJob(job_id="j1", job_title="Engineer", job_summary="Build."))
+            db.add(Job(job_id="j2", resume_id="r1", content="Python", canonical_job_id="j1"))
+            db.add(Job(job_id="j3", resume_id="r1", content="Go"))
+            await db.commit()
+        await engine.dispose()
+
+    asyncio.run(seed())
+    return api_client
+
+
+def _batch(client, kind: str, **payload):
+    response = client.post(f"/api/v1/{kind}/batch", json=payload)
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+def test_resume_batch_reports_missing_ids(client):
+    data = _batch(client, "resumes", resume_ids=["r1", "gone", "r2", "r1"])
+
+    assert list(data["items"]) == ["r1", "r2"]
+    assert data["missing"] == ["gone"]
+    r1 = data["items"]["r1"]
+    assert set(r1) == {
+        "resume_id",
+        "raw_resume",
+        "processing_status",
+        "processing_error",
+        "processed_resume",
+    }
+    assert r1["raw_resume"]["content"] == "# Jane"
+    assert r1["processed_resume"]["personal_data"] == {"firstName": "Jane"}
+    assert data["items"]["r2"]["processed_resume"] is None
+
+
+def test_resume_batch_returns_only_requested_fields(client):
+    data = _batch(client, "resumes", resume_ids=["r1", "r2"], fields=["processing_status"])
+
+    # The status of resumes without one falls back on whether processed data exists
+    assert data["items"] == {
+        "r1": {"resume_id": "r1", "processing_status": "processed"},
+        "r2": {"resume_id": "r2", "processing_status": "failed"},
+    }
+
+
+def test_job_batch_shares_processed_data_of_duplicates(client):
+    data = _batch(client, "jobs", job_ids=["j1", "j2", "j3", "gone"])
+
+    assert data["missing"] == ["gone"]
+    titles = {
+        job_id: item["processed_job"] and item["processed_job"]["job_title"]
+        for job_id, item in data["items"].items()
+    }
+    assert titles == {"j1": "Engineer", "j2": "Engineer", "j3": None}
+
+
+def test_job_batch_returns_only_requested_fields(client):
+    data = _batch(client, "jobs", job_ids=["j1"], fields=["raw_job"])
+
+    assert set(data["items"]["j1"]) == {"job_id", "raw_job"}
+    assert data["items"]["j1"]["raw_job"]["content"] == "Python"
+
+
+@pytest.mark.parametrize(
+    "kind, payload",
+    [
+        ("resumes", {"resume_ids": [f"r{n}" for n in range(MAX_BATCH_IDS + 1)]}),
+        ("resumes", {"resume_ids": []}),
+        ("resumes", {"resume_ids": ["r1"], "fields": ["password"]}),
+        ("jobs", {"job_ids": [f"j{n}" for n in range(MAX_BATCH_IDS + 1)]}),
+        ("jobs", {"job_ids": ["j1"], "fields": ["processed_resume"]}),
+    ],
+)
+def test_invalid_batches_are_rejected(client, kind, payload):
+    assert client.post(f"/api/v1/{kind}/batch", json=payload).status_code == 422
+
+
+def test_largest_batch_is_accepted(client):
+    data = _batch(client, "jobs", job_ids=[f"j{n}" for n in range(MAX_BATCH_IDS)], fields=["raw_job"])
+    assert list(data["items"]) == ["j1", "j2", "j3"]
+    assert len(data["missing"]) == MAX_BATCH_IDS - 3
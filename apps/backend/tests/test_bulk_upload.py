@@ -0,0 +1,81 @@
+import io
+import json
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.services.bulk_ingestion as bulk_ingestion
+from app.base import create_app
+
+
+class _StubResumeService:
+    """Stands in for conversion and extraction; only the upload handling is under test."""
+
+    def __init__(self, db):
+        pass
+
+    async def convert_and_store_resume(self, file_bytes, file_type, filename, content_type):
+        return f"{filename}:{file_bytes.decode()}"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(bulk_ingestion, "ResumeService", _StubResumeService)
+    return TestClient(create_app())
+
+
+def _uploads():
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("nested/three.pdf", b"%PDF three")
+        zf.writestr("four.docx", b"PK four")
+    return [
+        ("files", ("one.pdf", b"%PDF one", "application/pdf")),
+        ("files", ("two.pdf", b"%PDF two", "application/pdf")),
+        ("files", ("batch.zip", archive.getvalue(), "application/zip")),
+    ]
+
+
+EXPECTED = {
+    "one.pdf": "one.pdf:%PDF one",
+    "two.pdf": "two.pdf:%PDF two",
+    "batch.zip/nested/three.pdf": "batch.zip/nested/three.pdf:%PDF three",
+    "batch.zip/four.docx": "batch.zip/four.docx:PK four",
+}
+
+
+def test_bulk_upload_streams_every_document(client):
+    # The documents are read after the handler returned, once the form is closed
+    with client.stream(
+        "POST", "/api/v1/resumes/bulk-upload", params={"stream": "true"}, files=_uploads()
+    ) as response:
+        assert response.status_code == 200
+        events = [
+            json.loads(line[len("data: "):])
+            for line in response.iter_lines()
+            if line.startswith("data: ")
+        ]
+
+    results = [event for event in events if "filename" in event]
+    assert {result["filename"]: result.get("resume_id") for result in results} == EXPECTED
+    assert all(result["status"] == "processed" for result in results)
+    assert events[-1] == {"status": "completed", "total": 4, "succeeded": 4, "failed": 0}
+
+
+def test_bulk_upload_without_streaming(client):
+    response = client.post("/api/v1/resumes/bulk-upload", files=_uploads())
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["succeeded"] == 4
+    assert {result["filename"]: result["resume_id"] for result in data["results"]} == EXPECTED
+
+
+def test_bulk_upload_rejects_invalid_archive(client):
+    response = client.post(
+        "/api/v1/resumes/bulk-upload",
+        files=[("files", ("broken.zip", b"not a zip", "application/zip"))],
+    )
+
+    assert response.status_code == 400
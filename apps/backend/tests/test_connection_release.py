@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import random
+
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import monitor_checkouts
+from app.models import Resume, ProcessedResume, Job, ProcessedJob
+from app.services import job_service, resume_service, score_improvement_service
+from app.services.job_service import JobService
+from app.services.resume_service import ResumeService
+from app.services.score_improvement_service import ScoreImprovementService
+
+# Every provider call takes this long; a connection held across one of them
+# is checked out for longer than the warning threshold below
+PROVIDER_DELAY = 0.3
+WARN_AFTER = PROVIDER_DELAY / 2
+
+RESUME_MD = """# Jane Doe
+jane.doe@example.com
+
+## Experience
+### Senior Software Engineer, Acme Corp
+- Built FastAPI services on PostgreSQL
+
+## Skills
+Python, FastAPI, PostgreSQL, AWS
+"""
+JOB_MD = "Senior Backend Engineer\n\nPython, PostgreSQL and AWS experience."
+
+
+class _ProviderStub:
+    """
+    Answers like the LLM and embedding providers after PROVIDER_DELAY, noting
+    how many pooled connections were checked out while it was awaited.
+    """
+
+    engine = None
+    checked_out: list = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def _wait(self) -> None:
+        pool = type(self).engine.sync_engine.pool
+        type(self).checked_out.append(pool.checkedout())
+        await asyncio.sleep(PROVIDER_DELAY)
+        type(self).checked_out.append(pool.checkedout())
+
+    async def run(self, prompt: str, **kwargs):
+        await self._wait()
+        if "resume editor" in prompt:
+            return RESUME_MD + "\n- Shipped PostgreSQL and AWS migrations\n"
+        if "resume analyst" in prompt:
+            return {
+                "details": "d",
+                "commentary": "c",
+                "improvements": [{"suggestion": "s"}],
+            }
+        if "job posting" in prompt.lower():
+            return {
+                "jobTitle": "Senior Backend Engineer",
+                "companyProfile": {"companyName": "Acme"},
+                "location": {"remoteStatus": "Remote"},
+                "datePosted": "2025-01-01",
+                "employmentType": "Full-time",
+                "jobSummary": "Build services.",
+                "keyResponsibilities": ["Build services"],
+                "qualifications": {"required": ["Python"]},
+                "extractedKeywords": ["Python", "PostgreSQL", "AWS"],
+            }
+        return {
+            "personalInfo": {"name": "Jane Doe", "email": "jane.doe@example.com", "phone": "1"},
+            "experience": [],
+            "education": [],
+            "skills": ["Python"],
+        }
+
+    async def embed(self, text: str, **kwargs):
+        await self._wait()
+        rnd = random.Random(len(text))
+        return [rnd.random() for _ in range(16)]
+
+    async def convert(self, file_bytes: bytes, extension: str, **kwargs) -> str:
+        await self._wait()
+        return RESUME_MD
+
+
+@asynccontextmanager
+async def _sessions(url: str):
+    engine = create_async_engine(url)
+    monitor_checkouts(engine.sync_engine, WARN_AFTER)
+    _ProviderStub.engine = engine
+    try:
+        yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def database(database_url, monkeypatch, caplog):
+    _ProviderStub.checked_out = []
+    monkeypatch.setattr(resume_service, "document_converter", _ProviderStub())
+    monkeypatch.setattr(job_service, "AgentManager", _ProviderStub)
+    monkeypatch.setattr(score_improvement_service, "AgentManager", _ProviderStub)
+    monkeypatch.setattr(score_improvement_service, "EmbeddingManager", _ProviderStub)
+    caplog.set_level(logging.WARNING, logger="app.core.database")
+
+    async def seed():
+        async with _sessions(database_url) as session_factory, session_factory() as db:
+            db.add(Resume(resume_id="r1", content=RESUME_MD, content_type="md"))
+            db.add(
+                ProcessedResume(
+                    resume_id="r1",
+                    personal_data={"firstName": "Jane", "lastName": "Doe"},
+                    extracted_keywords=["Python", "FastAPI", "PostgreSQL"],
+                )
+            )
+            db.add(Job(job_id="j1", resume_id="r1", content=JOB_MD))
+            db.add(
+                ProcessedJob(
+                    job_id="j1",
+                    job_title="Senior Backend Engineer",
+                    job_summary="Build services.",
+                    extracted_keywords=["Python", "PostgreSQL", "AWS"],
+                    extraction_status="processed",
+                )
+            )
+            await db.commit()
+
+    asyncio.run(seed())
+    return database_url
+
+
+def _assert_no_connection_held(caplog) -> None:
+    assert _ProviderStub.checked_out, "the provider stub was never awaited"
+    assert set(_ProviderStub.checked_out) == {0}
+    assert "Database connection was checked out" not in caplog.text
+
+
+def test_resume_upload_releases_connection_during_conversion(database, caplog):
+    async def scenario():
+        async with _sessions(database) as session_factory, session_factory() as db:
+            return await ResumeService(db).convert_and_store_resume(
+                b"%PDF-1.4 new resume",
+                "application/pdf",
+                "resume.pdf",
+                defer_extraction=True,
+            )
+
+    assert asyncio.run(scenario())
+    _assert_no_connection_held(caplog)
+
+
+def test_job_upload_releases_connection_during_extraction(database, caplog):
+    async def scenario():
+        async with _sessions(database) as session_factory, session_factory() as db:
+            return await JobService(db).create_and_store_jobs(
+                {"resume_id": "r1", "job_descriptions": ["Data Engineer\n\nSpark and Airflow."]}
+            )
+
+    assert [result["status"] for result in asyncio.run(scenario())] == ["processed"]
+    _assert_no_connection_held(caplog)
+
+
+def test_improvement_releases_connection_during_provider_calls(database, caplog):
+    async def scenario():
+        async with _sessions(database) as session_factory, session_factory() as db:
+            return await ScoreImprovementService(db, max_retries=1).run("r1", "j1")
+
+    assert asyncio.run(scenario())["new_score"] is not None
+    _assert_no_connection_held(caplog)
+
+
+def test_streamed_improvement_releases_connection_during_provider_calls(
+    database, caplog
+):
+    async def scenario():
+        async with _sessions(database) as session_factory, session_factory() as db:
+            service = ScoreImprovementService(db, max_retries=1)
+            return [event async for event in service.run_and_stream("r1", "j1")]
+
+    events = asyncio.run(scenario())
+    assert '"status": "completed"' in events[-1]
+    _assert_no_connection_held(caplog)
@@ -0,0 +1,109 @@
+import os
+import time
+import asyncio
+
+import pytest
+
+from app.services.document_converter import DocumentConverter
+from app.services.exceptions import DocumentConversionTimeoutError
+
+pytest.importorskip("markitdown")
+
+
+def _sleep_and_getpid(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def _fail() -> None:
+    raise ValueError("unreadable document")
+
+
+async def _started(converter: DocumentConverter) -> DocumentConverter:
+    # Worker start-up (importing MarkItDown) is not what these tests time
+    await asyncio.gather(*(converter._run(_sleep_and_getpid, 0.5) for _ in range(converter.workers)))
+    return converter
+
+
+def _pids(converter: DocumentConverter) -> set:
+    return {worker.process.pid for worker in converter._idle._queue} | {
+        worker.process.pid for worker in converter._busy
+    }
+
+
+def test_convert_returns_markdown():
+    async def scenario():
+        converter = DocumentConverter(workers=1, timeout=60)
+        try:
+            return await converter.convert(
+                b"<html><body><h1>Jane Doe</h1><p>Python engineer</p></body></html>",
+                ".html",
+                mimetype="text/html",
+            )
+        finally:
+            await converter.stop()
+
+    markdown = asyncio.run(scenario())
+    assert "# Jane Doe" in markdown
+    assert "Python engineer" in markdown
+
+
+def test_converter_errors_carry_type_and_message():
+    async def scenario():
+        converter = DocumentConverter(workers=1, timeout=60)
+        try:
+            with pytest.raises(RuntimeError, match="ValueError: unreadable document"):
+                await converter._run(_fail)
+            # The worker survives a failed conversion
+            return await converter._run(_sleep_and_getpid, 0)
+        finally:
+            await converter.stop()
+
+    assert asyncio.run(scenario())
+
+
+def test_timeout_only_restarts_the_worker_of_that_conversion():
+    async def scenario():
+        converter = await _started(DocumentConverter(workers=2, timeout=60))
+        try:
+            converter.timeout = 1.5
+            slow = asyncio.create_task(converter._run(_sleep_and_getpid, 30))
+            await asyncio.sleep(1)
+            slow_pid = converter._busy[0].process.pid
+            # Still running when the slow conversion times out
+            other_pid = await converter._run(_sleep_and_getpid, 1)
+            with pytest.raises(DocumentConversionTimeoutError):
+                await slow
+            return slow_pid, other_pid, _pids(converter)
+        finally:
+            await converter.stop()
+
+    slow_pid, other_pid, pids = asyncio.run(scenario())
+    assert other_pid in pids
+    assert slow_pid not in pids
+    assert len(pids) == 2
+
+
+def test_cancelling_a_running_conversion_kills_its_worker():
+    async def scenario():
+        converter = await _started(DocumentConverter(workers=1, timeout=60))
+        try:
+            task = asyncio.create_task(converter._run(_sleep_and_getpid, 30))
+            await asyncio.sleep(0.2)
+            assert converter.stats()["running"] == 1
+            process = converter._busy[0].process
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await asyncio.to_thread(process.join, 5)
+            killed = not process.is_alive()
+            # A fresh worker takes over
+            pid = await converter._run(_sleep_and_getpid, 0)
+            return killed, process.pid, pid, converter.stats()
+        finally:
+            await converter.stop()
+
+    killed, old_pid, new_pid, stats = asyncio.run(scenario())
+    assert killed
+    assert new_pid != old_pid
+    assert stats == {"workers": 1, "running": 0, "queued": 0}
@@ -0,0 +1,150 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from app.services.embedding_store import EmbeddingStore, _INITIAL_CAPACITY
+
+DIM = 32
+
+
+def _vector(key: str) -> np.ndarray:
+    seed = sum(key.encode()) * 7919 + len(key)
+    return np.random.default_rng(seed).normal(size=DIM).astype(np.float32)
+
+
+@pytest.mark.parametrize(
+    "dtype, tolerance",
+    [
+        ("float32", 0.0),
+        ("float16", 2e-3),
+        # Half a quantization step of the row's symmetric scale
+        ("int8", 0.5 / 127),
+    ],
+)
+def test_vectors_round_trip_within_the_dtype_precision(tmp_path, dtype, tolerance):
+    store = EmbeddingStore(str(tmp_path / "store"), dtype=dtype)
+    vectors = {f"k{n}": _vector(f"k{n}") for n in range(10)}
+    vectors["zero"] = np.zeros(DIM, dtype=np.float32)
+    for key, vector in vectors.items():
+        store.put(key, vector)
+
+    for key, vector in vectors.items():
+        stored = store.get(key)
+        assert stored.dtype == np.float32
+        peak = float(np.max(np.abs(vector))) or 1.0
+        assert np.max(np.abs(stored - vector)) <= tolerance * peak + 1e-7
+    assert store.get("unknown") is None
+
+
+def test_float32_reads_are_read_only_views(tmp_path):
+    store = EmbeddingStore(str(tmp_path / "store"))
+    store.put("k", _vector("k"))
+
+    vector = store.get("k")
+    with pytest.raises(ValueError):
+        vector[0] = 1.0
+
+
+def test_existing_keys_and_other_dimensions_are_not_overwritten(tmp_path):
+    store = EmbeddingStore(str(tmp_path / "store"))
+    store.put("k", _vector("k"))
+    store.put("k", np.ones(DIM))
+    store.put("other", np.ones(DIM + 1))
+
+    np.testing.assert_array_equal(store.get("k"), _vector("k"))
+    assert "other" not in store
+    assert len(store) == 1
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+def test_reopened_store_reads_back_every_row(tmp_path, dtype):
+    path = str(tmp_path / "store")
+    store = EmbeddingStore(path, dtype=dtype)
+    # Enough rows to grow past the initial capacity
+    keys = [f"k{n}" for n in range(_INITIAL_CAPACITY + 10)]
+    for key in keys:
+        store.put(key, _vector(key))
+    store.flush()
+    expected = {key: store.get(key) for key in (keys[0], keys[-1])}
+
+    reopened = EmbeddingStore(path, dtype=dtype)
+    assert len(reopened) == len(keys)
+    assert reopened.dim == DIM
+    for key, vector in expected.items():
+        np.testing.assert_array_equal(reopened.get(key), vector)
+
+    with pytest.raises(ValueError, match="uses dtype"):
+        EmbeddingStore(path, dtype="float32" if dtype != "float32" else "int8")
+
+
+def test_unknown_dtype_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported"):
+        EmbeddingStore(str(tmp_path / "store"), dtype="bfloat16")
+
+
+def test_stores_on_the_same_files_see_each_others_rows(tmp_path):
+    path = str(tmp_path / "store")
+    first = EmbeddingStore(path, dtype="int8")
+    second = EmbeddingStore(path, dtype="int8")
+
+    first.put("a", _vector("a"))
+    # Rows appended by the other store are picked up, remapping the grown files
+    for n in range(_INITIAL_CAPACITY + 10):
+        second.put(f"b{n}", _vector(f"b{n}"))
+    first.put("c", _vector("c"))
+
+    assert len(first) == len(second) == _INITIAL_CAPACITY + 12
+    last = f"b{_INITIAL_CAPACITY + 9}"
+    np.testing.assert_allclose(first.get(last), _vector(last), atol=0.05)
+    np.testing.assert_allclose(second.get("c"), _vector("c"), atol=0.05)
+    assert first._rows == second._rows
+
+
+def test_partially_written_id_is_ignored_until_complete(tmp_path):
+    path = str(tmp_path / "store")
+    store = EmbeddingStore(path)
+    store.put("a", _vector("a"))
+    reader = EmbeddingStore(path)
+    assert len(reader) == 1
+
+    # Another writer has filled row 1 but not yet finished appending its id
+    store._data[1] = _vector("b")
+    with open(f"{path}.ids", "ab") as f:
+        f.write(b"b")
+    assert "b" not in reader
+
+    with open(f"{path}.ids", "ab") as f:
+        f.write(b"\n")
+    np.testing.assert_array_equal(reader.get("b"), _vector("b"))
+
+
+def _append(path: str, prefix: str, count: int) -> None:
+    store = EmbeddingStore(path, dtype="float16")
+    for n in range(count):
+        key = f"{prefix}{n}"
+        store.put(key, _vector(key))
+        # Every process also stores the shared keys; each must end up once
+        store.put(f"shared{n % 10}", _vector(f"shared{n % 10}"))
+    store.flush()
+
+
+def test_concurrent_processes_append_without_losing_or_mixing_rows(tmp_path):
+    path = str(tmp_path / "store")
+    context = multiprocessing.get_context("spawn")
+    writers = [
+        context.Process(target=_append, args=(path, prefix, 300)) for prefix in ("x", "y", "z")
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join(60)
+    assert [writer.exitcode for writer in writers] == [0, 0, 0]
+
+    store = EmbeddingStore(path, dtype="float16")
+    assert len(store) == 3 * 300 + 10
+    with open(f"{path}.ids") as f:
+        ids = f.read().splitlines()
+    assert len(ids) == len(set(ids))
+    for key in ids:
+        np.testing.assert_allclose(store.get(key), _vector(key), atol=5e-3)
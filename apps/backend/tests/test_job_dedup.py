@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Resume, Job, ProcessedJob
+from app.services import job_service
+
+JOB_DESCRIPTION = "Senior Python Engineer\n\nBuild APIs with Python, FastAPI and PostgreSQL."
+
+STRUCTURED_JOB = {
+    "jobTitle": "Senior Python Engineer",
+    "companyProfile": {"companyName": "Acme"},
+    "location": {"remoteStatus": "Remote"},
+    "datePosted": "2025-01-01",
+    "employmentType": "Full-time",
+    "jobSummary": "Build APIs.",
+    "keyResponsibilities": ["Build APIs"],
+    "qualifications": {"required": ["Python"]},
+    "extractedKeywords": ["Python", "FastAPI", "PostgreSQL"],
+}
+
+
+class _FlakyAgent:
+    """Fails the first extraction, then answers like the LLM."""
+
+    calls = 0
+
+    async def run(self, prompt: str) -> dict:
+        type(self).calls += 1
+        if type(self).calls == 1:
+            raise RuntimeError("provider unavailable")
+        return STRUCTURED_JOB
+
+
+def _upload(database_url, requests):
+    """
+    Stores each list of job descriptions in its own request and returns the
+    statuses per request, the stored jobs and their extraction statuses.
+    """
+
+    async def scenario():
+        engine = create_async_engine(database_url)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        async with session_factory() as db:
+            db.add(Resume(resume_id="r1", content="# Jane Doe", content_type="md"))
+            await db.commit()
+
+        statuses = []
+        for job_descriptions in requests:
+            async with session_factory() as db:
+                results = await job_service.JobService(db).create_and_store_jobs(
+                    {"resume_id": "r1", "job_descriptions": job_descriptions}
+                )
+            statuses.append([result["status"] for result in results])
+
+        async with session_factory() as db:
+            jobs = (await db.execute(select(Job).order_by(Job.id))).scalars().all()
+            processed = {
+                row.job_id: row.extraction_status
+                for row in (await db.execute(select(ProcessedJob))).scalars()
+            }
+        await engine.dispose()
+        return statuses, jobs, processed
+
+    return asyncio.run(scenario())
+
+
+@pytest.fixture
+def flaky_agent(monkeypatch):
+    monkeypatch.setattr(job_service, "AgentManager", _FlakyAgent)
+    monkeypatch.setattr(_FlakyAgent, "calls", 0)
+    return _FlakyAgent
+
+
+def test_fallback_extraction_is_not_shared_with_duplicates(database_url, flaky_agent):
+    statuses, jobs, processed = _upload(database_url, [[JOB_DESCRIPTION]] * 3)
+    # The LLM is retried after the fallback, and its extraction is then shared
+    assert statuses == [["fallback"], ["processed"], ["shared"]]
+    assert processed == {jobs[0].job_id: "fallback", jobs[1].job_id: "processed"}
+    assert jobs[2].canonical_job_id == jobs[1].job_id
+    assert flaky_agent.calls == 2
+
+
+def test_fallback_extraction_is_not_shared_within_a_request(database_url, flaky_agent):
+    statuses, jobs, processed = _upload(database_url, [[JOB_DESCRIPTION] * 2])
+    # The duplicate gets its own fallback data instead of pointing at the first copy
+    assert statuses == [["fallback", "fallback"]]
+    assert [job.canonical_job_id for job in jobs] == [None, None]
+    assert processed == {job.job_id: "fallback" for job in jobs}
+    assert flaky_agent.calls == 1
@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+import pytest
+
+from app.base import create_app
+from app.services import job_ingestion
+from app.services.job_ingestion import JobIngestion
+
+MAX_LINE_BYTES = 64
+OVERSIZED = "Line exceeds the maximum allowed size."
+
+
+def _read(chunks, default_resume_id="r1"):
+    async def source():
+        for chunk in chunks:
+            yield chunk
+
+    async def scenario():
+        ingestion = JobIngestion(session_factory=None, max_line_bytes=MAX_LINE_BYTES)
+        return [
+            (record.line, record.resume_id, record.job_description, record.error)
+            async for record in ingestion.read_records(source(), default_resume_id)
+        ]
+
+    return asyncio.run(scenario())
+
+
+def test_lines_split_across_chunks():
+    assert _read(
+        [
+            b'{"job_description": "Py',
+            b'thon"}\n{"job_desc',
+            b'ription": "Go", "resume_id": "r2"}\n',
+        ]
+    ) == [(1, "r1", "Python", None), (2, "r2", "Go", None)]
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        # Spread over several chunks before its newline
+        [b'{"job_description": "', b"x" * 40, b"x" * 40, b"x" * 40, b'"}\n{"job_description": "Go"}\n'],
+        # Completed by the chunk holding its newline
+        [b'{"job_description": "', b"x" * 60 + b'"}\n{"job_description": "Go"}\n'],
+    ],
+)
+def test_oversized_line_is_reported_and_skipped(chunks):
+    assert _read(chunks) == [(1, None, None, OVERSIZED), (2, "r1", "Go", None)]
+
+
+def test_trailing_line_without_newline():
+    assert _read([b'{"job_description": "Python"}\n{"job_description"', b': "Go"}']) == [
+        (1, "r1", "Python", None),
+        (2, "r1", "Go", None),
+    ]
+    assert _read([b'{"job_description": "Python"}\n', b"x" * 100]) == [
+        (1, "r1", "Python", None),
+        (2, None, None, OVERSIZED),
+    ]
+
+
+def test_blank_lines_are_skipped_but_counted():
+    assert _read([b'\n  \n{"job_description": "Python"}\n\n', b'{"job_description": "Go"}\n\n']) == [
+        (3, "r1", "Python", None),
+        (5, "r1", "Go", None),
+    ]
+
+
+def test_invalid_lines_are_reported():
+    records = _read(
+        [b'not json\n["a list"]\n{"job_description": ""}\n{"job_description": "Go"}\n'],
+        default_resume_id=None,
+    )
+    assert [(line, error.split(":")[0]) for line, _, _, error in records] == [
+        (1, "Invalid JSON"),
+        (2, "Each line must be a JSON object."),
+        (3, "job_description must be a non-empty string."),
+        (4, "resume_id is required."),
+    ]
+
+
+class _StubJobService:
+    def __init__(self, db):
+        pass
+
+    async def create_and_store_jobs(self, job_data):
+        return [{"job_id": f"job-{job_data['job_descriptions'][0]}", "status": "processed"}]
+
+
+def test_ingest_streams_results_while_the_body_is_read(monkeypatch):
+    monkeypatch.setattr(job_ingestion, "JobService", _StubJobService)
+    body = [
+        json.dumps({"job_description": name, "id": n}).encode() + b"\n"
+        for n, name in enumerate(["Python", "Go", "Rust"])
+    ]
+    events = []
+
+    async def receive():
+        # Slow enough for the first results to go out before the last line arrives
+        await asyncio.sleep(0.05)
+        received = events.count("received")
+        events.append("received")
+        return {
+            "type": "http.request",
+            "body": body[received],
+            "more_body": received + 1 < len(body),
+        }
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            events.extend(json.loads(line) for line in message["body"].decode().splitlines())
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/jobs/ingest",
+        "raw_path": b"/api/v1/jobs/ingest",
+        "query_string": b"resume_id=r1",
+        "headers": [(b"content-type", b"application/x-ndjson"), (b"host", b"test")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    asyncio.run(create_app()(scope, receive, send))
+
+    results = [event for event in events if event != "received"]
+    assert sorted((r["id"], r["job_id"]) for r in results[:-1]) == [
+        (0, "job-Python"),
+        (1, "job-Go"),
+        (2, "job-Rust"),
+    ]
+    assert results[-1] == {"status": "completed", "total": 3, "succeeded": 3, "failed": 0}
+    # Every line reached the ingestion, and results went out while it was still reading
+    assert events.count("received") == len(body)
+    assert events.index(results[0]) < len(events) - 1 - events[::-1].index("received")
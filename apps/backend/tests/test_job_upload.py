@@ -0,0 +1,87 @@
+import asyncio
+import uuid
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Resume, Job
+from app.schemas.pydantic import StructuredJobModel
+from app.services.job_service import JobService
+
+RESUME_ID = str(uuid.uuid4())
+
+
+@pytest.fixture
+def client(api_client, database_url):
+    async def seed():
+        engine = create_async_engine(database_url)
+        async with async_sessionmaker(bind=engine)() as db:
+            db.add(Resume(resume_id=RESUME_ID, content="# Jane Doe", content_type="md"))
+            await db.commit()
+        await engine.dispose()
+
+    asyncio.run(seed())
+    return api_client
+
+
+def _failing_extraction(error: Exception):
+    async def build(self, job_id, job_description_text):
+        raise error
+
+    return build
+
+
+def _invalid_job() -> ValidationError:
+    try:
+        StructuredJobModel.model_validate({})
+    except ValidationError as e:
+        return e
+
+
+def _upload(client):
+    return client.post(
+        "/api/v1/jobs/upload",
+        json={"resume_id": RESUME_ID, "job_descriptions": ["Python Engineer", "Data Engineer"]},
+    )
+
+
+def _stored_jobs(database_url) -> int:
+    async def count():
+        engine = create_async_engine(database_url)
+        async with engine.connect() as conn:
+            stored = (await conn.execute(select(func.count()).select_from(Job))).scalar_one()
+        await engine.dispose()
+        return stored
+
+    return asyncio.run(count())
+
+
+def test_upload_fails_when_no_job_description_is_stored(client, database_url, monkeypatch):
+    monkeypatch.setattr(
+        JobService, "_build_processed_job", _failing_extraction(RuntimeError("database is locked"))
+    )
+
+    response = _upload(client)
+
+    assert response.status_code == 500
+    results = response.json()["detail"]["results"]
+    assert [(result["status"], result["error_type"]) for result in results] == [
+        ("failed", "processing"),
+        ("failed", "processing"),
+    ]
+    assert _stored_jobs(database_url) == 0
+
+
+def test_upload_reports_invalid_job_descriptions_as_unprocessable(
+    client, database_url, monkeypatch
+):
+    monkeypatch.setattr(JobService, "_build_processed_job", _failing_extraction(_invalid_job()))
+
+    response = _upload(client)
+
+    assert response.status_code == 422
+    results = response.json()["detail"]["results"]
+    assert [result["error_type"] for result in results] == ["validation", "validation"]
+    assert _stored_jobs(database_url) == 0
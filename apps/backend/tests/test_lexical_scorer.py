@@ -0,0 +1,162 @@
+import asyncio
+import math
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Resume, Job, ProcessedJob
+from app.services import score_improvement_service
+from app.services.lexical_scorer import (
+    BM25_B,
+    BM25_K1,
+    CorpusSnapshot,
+    LexicalIndex,
+    LexicalScorer,
+    tokenize,
+)
+
+JOB_KEYWORDS = ["Python", "FastAPI", "PostgreSQL"]
+RESUMES = {
+    "all": "Python FastAPI PostgreSQL services",
+    "two": "Python FastAPI services",
+    "one": "Python scripts",
+    "none": "Java Spring",
+}
+
+
+def test_tokenize_keeps_technical_terms():
+    assert tokenize("Experience with C++, C#, Node.js and CI/CD.") == [
+        "experience",
+        "c++",
+        "c#",
+        "node.js",
+        "ci/cd",
+    ]
+
+
+def test_bm25_and_coverage():
+    corpus = CorpusSnapshot(
+        document_count=10, average_length=8.0, document_frequencies={"python": 2}
+    )
+    # Four terms, half the average length
+    text = "Python developer, Python and FastAPI"
+
+    score = LexicalScorer.score(["Python", "Go", "FastAPI developer"], text, corpus)
+
+    idf = {
+        "python": math.log(1 + (10 - 2 + 0.5) / (2 + 0.5)),
+        "go": math.log(1 + (10 + 0.5) / 0.5),
+        "fastapi": math.log(1 + (10 + 0.5) / 0.5),
+        "developer": math.log(1 + (10 + 0.5) / 0.5),
+    }
+    length_norm = 1 - BM25_B + BM25_B * 4 / 8
+
+    def term_score(term, tf):
+        return idf[term] * tf * (BM25_K1 + 1) / (tf + BM25_K1 * length_norm)
+
+    bm25 = term_score("python", 2) + term_score("fastapi", 1) + term_score("developer", 1)
+    assert score["bm25"] == pytest.approx(bm25)
+    assert score["bm25_normalized"] == pytest.approx(
+        bm25 / (sum(idf.values()) * (BM25_K1 + 1))
+    )
+    # A keyword counts as covered only when all of its terms occur
+    assert score["keyword_coverage"] == pytest.approx(2 / 3)
+    assert score["matched_keywords"] == ["Python", "FastAPI developer"]
+    assert score["missing_keywords"] == ["Go"]
+
+
+def test_corpus_statistics_are_updated_incrementally(database_url):
+    async def scenario():
+        engine = create_async_engine(database_url)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as db:
+            index = LexicalIndex(db)
+            await index.add_documents(["Python FastAPI", "Python Go services"])
+            await db.commit()
+            await index.add_document("Go Rust")
+            await db.commit()
+            snapshot = await index.snapshot(["python", "go", "rust", "java"])
+        await engine.dispose()
+        return snapshot
+
+    snapshot = asyncio.run(scenario())
+    assert snapshot.document_count == 3
+    assert snapshot.average_length == pytest.approx(7 / 3)
+    assert snapshot.document_frequencies == {"python": 2, "go": 2, "rust": 1}
+    assert snapshot.idf("java") > snapshot.idf("rust") > snapshot.idf("python")
+
+
+class _EmbeddingStub:
+    """
+    Embeds the job keywords and the "two" resume alike, so re-ranking puts it
+    ahead of "all", the best lexical match.
+    """
+
+    embedded: list = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def embed(self, text: str):
+        type(self).embedded.append(text)
+        if text in (", ".join(JOB_KEYWORDS), RESUMES["two"]):
+            return [1.0, 0.0]
+        return [1.0, 1.0]
+
+
+@pytest.fixture
+def ranking_client(api_client, database_url, monkeypatch):
+    monkeypatch.setattr(score_improvement_service, "AgentManager", _EmbeddingStub)
+    monkeypatch.setattr(score_improvement_service, "EmbeddingManager", _EmbeddingStub)
+    monkeypatch.setattr(_EmbeddingStub, "embedded", [])
+
+    async def seed():
+        engine = create_async_engine(database_url)
+        async with async_sessionmaker(bind=engine)() as db:
+            for resume_id, content in RESUMES.items():
+                db.add(Resume(resume_id=resume_id, content=content, content_type="md"))
+            db.add(Job(job_id="j1", resume_id="all", content="Backend engineer"))
+            db.add(
+                ProcessedJob(
+                    job_id="j1",
+                    job_title="Backend engineer",
+                    job_summary="Build services.",
+                    extracted_keywords=JOB_KEYWORDS,
+                    extraction_status="processed",
+                )
+            )
+            await LexicalIndex(db).add_documents(RESUMES.values())
+            await db.commit()
+        await engine.dispose()
+
+    asyncio.run(seed())
+    return api_client
+
+
+def _rank(client, **params):
+    response = client.get("/api/v1/resumes/ranking", params={"job_id": "j1", **params})
+    assert response.status_code == 200
+    return [
+        (item["resume_id"], item["cosine_similarity"] is not None)
+        for item in response.json()["data"]
+    ]
+
+
+def test_ranking_gates_on_coverage_and_reranks_the_top_candidates(ranking_client):
+    assert _rank(ranking_client, min_coverage=0.5, rerank_top_k=2) == [
+        ("two", True),
+        ("all", True),
+    ]
+    # Only the job and the two candidates were embedded
+    assert sorted(_EmbeddingStub.embedded) == sorted(
+        [", ".join(JOB_KEYWORDS), RESUMES["all"], RESUMES["two"]]
+    )
+
+
+def test_ranking_only_embeds_the_top_k(ranking_client):
+    assert _rank(ranking_client, rerank_top_k=1, limit=3) == [
+        ("all", True),
+        ("two", False),
+        ("one", False),
+    ]
+    assert len(_EmbeddingStub.embedded) == 2
@@ -0,0 +1,190 @@
+import json
+import base64
+import asyncio
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Resume, ProcessedResume, Job, ProcessedJob
+from app.services.exceptions import InvalidListQueryError
+from app.services.listing import RecordLister, decode_cursor, encode_cursor
+
+T0 = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+# r1, r2 and r3 were created within the same second
+CREATED_AT = {
+    "r0": T0,
+    "r1": T0 + timedelta(seconds=1),
+    "r2": T0 + timedelta(seconds=1),
+    "r3": T0 + timedelta(seconds=1),
+    "r4": T0 + timedelta(seconds=2),
+}
+
+
+def _stored(conn, value: datetime):
+    """
+    ``value`` as the database stores it for the CURRENT_TIMESTAMP server
+    default: naive UTC text to the second on SQLite.
+    """
+    if conn.dialect.name == "sqlite":
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return value
+
+
+async def _seed(engine) -> None:
+    async with async_sessionmaker(bind=engine)() as db:
+        for resume_id in CREATED_AT:
+            db.add(Resume(resume_id=resume_id, content=f"# {resume_id}", content_type="md"))
+        db.add(ProcessedResume(resume_id="r1", personal_data={"firstName": "Jane"}))
+        db.add(Job(job_id="j1", resume_id="r0", content="Python"))
+        db.add(Job(job_id="j2", resume_id="r0", content="Python", canonical_job_id="j1"))
+        db.add(ProcessedJob(job_id="j1", job_title="Engineer", job_summary="Build."))
+        await db.commit()
+
+    async with engine.begin() as conn:
+        for resume_id, created_at in CREATED_AT.items():
+            await conn.execute(
+                text("UPDATE resumes SET created_at = :created_at WHERE resume_id = :resume_id"),
+                {"created_at": _stored(conn, created_at), "resume_id": resume_id},
+            )
+
+
+@pytest.fixture
+def lister(database_url):
+    """
+    Seeds the database, then runs coroutine functions with a RecordLister over it.
+    """
+
+    async def seed():
+        engine = create_async_engine(database_url)
+        await _seed(engine)
+        await engine.dispose()
+
+    asyncio.run(seed())
+
+    def run(func):
+        async def scenario():
+            engine = create_async_engine(database_url)
+            try:
+                async with async_sessionmaker(bind=engine, expire_on_commit=False)() as db:
+                    return await func(RecordLister(db))
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(scenario())
+
+    return run
+
+
+async def _all_pages(lister: RecordLister, order: str, limit: int = 2):
+    pages, cursor = [], None
+    # Bounded, so a cursor that does not advance fails instead of looping
+    for _ in range(len(CREATED_AT)):
+        page = await lister.resumes(limit=limit, cursor=cursor, order=order)
+        pages.append([item["resume_id"] for item in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    return pages
+
+
+@pytest.mark.parametrize(
+    "order, pages",
+    [
+        ("desc", [["r4", "r3"], ["r2", "r1"], ["r0"]]),
+        ("asc", [["r0", "r1"], ["r2", "r3"], ["r4"]]),
+    ],
+)
+def test_pages_follow_created_at_then_id(lister, order, pages):
+    # Pages split within the rows sharing a timestamp without skipping or repeating any
+    assert lister(lambda lister: _all_pages(lister, order)) == pages
+
+
+def test_rows_added_between_pages_do_not_shift_later_pages(lister):
+    async def pages(lister):
+        first = await lister.resumes(limit=2)
+        lister.db.add(Resume(resume_id="r5", content="# r5", content_type="md"))
+        await lister.db.commit()
+        second = await lister.resumes(limit=2, cursor=first["next_cursor"])
+        return [item["resume_id"] for item in second["items"]]
+
+    assert lister(pages) == ["r2", "r1"]
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 1, 1, 10, 0, 1, tzinfo=timezone.utc)
+    cursor = encode_cursor("desc", created_at, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "desc") == (created_at, 42)
+
+
+def _raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@pytest.mark.parametrize(
+    "cursor, message",
+    [
+        (encode_cursor("asc", T0, 1), "issued for order 'asc'"),
+        ("not a cursor!", "Malformed"),
+        (_raw_cursor([1, 2]), "Malformed"),
+        (_raw_cursor(["desc", "yesterday", 1]), "Malformed"),
+        (_raw_cursor(["desc", T0.isoformat(), "1"]), "Malformed"),
+    ],
+)
+def test_invalid_cursors_are_rejected(cursor, message):
+    with pytest.raises(InvalidListQueryError, match=message):
+        decode_cursor(cursor, "desc")
+
+
+def test_fields_select_what_is_returned(lister):
+    async def pages(lister):
+        default = await lister.resumes(limit=1)
+        chosen = await lister.resumes(
+            limit=5, order="asc", fields=["resume_id", "processed_resume", "resume_id"]
+        )
+        jobs = await lister.jobs(limit=5, order="asc", fields=["job_id", "processed_job"])
+        return default["items"], chosen["items"], jobs["items"]
+
+    default, chosen, jobs = lister(pages)
+    assert set(default[0]) == {
+        "resume_id",
+        "content_type",
+        "processing_status",
+        "processing_error",
+        "created_at",
+    }
+    assert [list(item) for item in chosen] == [["resume_id", "processed_resume"]] * 5
+    processed = {item["resume_id"]: item["processed_resume"] for item in chosen}
+    assert processed["r1"]["personal_data"] == {"firstName": "Jane"}
+    assert processed["r0"] is None
+    # A duplicate job lists the processed data of its canonical job
+    assert [(item["job_id"], item["processed_job"]["job_title"]) for item in jobs] == [
+        ("j1", "Engineer"),
+        ("j2", "Engineer"),
+    ]
+
+
+def test_unknown_fields_and_orders_are_rejected(lister):
+    with pytest.raises(InvalidListQueryError, match="Unknown field"):
+        lister(lambda lister: lister.resumes(limit=1, fields=["resume_id", "password"]))
+    with pytest.raises(InvalidListQueryError, match="Unknown order"):
+        lister(lambda lister: lister.resumes(limit=1, order="random"))
+
+
+def test_created_at_bounds_match_stored_timestamps(lister):
+    # An exact match on a stored timestamp, given in another timezone: on
+    # SQLite it is only found when bound in the stored text format
+    bound = (T0 + timedelta(seconds=1)).astimezone(timezone(timedelta(hours=2)))
+
+    async def pages(lister):
+        after = await lister.resumes(limit=10, order="asc", created_after=bound)
+        before = await lister.resumes(limit=10, order="asc", created_before=bound)
+        return (
+            [item["resume_id"] for item in after["items"]],
+            [item["resume_id"] for item in before["items"]],
+        )
+
+    assert lister(pages) == (["r1", "r2", "r3", "r4"], ["r0"])
@@ -0,0 +1,74 @@
+import asyncio
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.migrations import run_migrations
+from app.models import Resume, ProcessedResume, Job, ProcessedJob, CorpusStats
+
+JOB_MD = "Senior Backend Engineer\n\nPython, PostgreSQL and AWS experience."
+
+
+def test_migrations_bring_existing_rows_up_to_date(database_url):
+    async def scenario():
+        engine = create_async_engine(database_url)
+        async with engine.begin() as conn:
+            # Rows stored before the hashes, corpus statistics and job
+            # deduplication existed
+            await conn.execute(
+                Resume.__table__.insert(),
+                [
+                    {"resume_id": f"r{n}", "content": f"# Resume {n}\nPython", "content_type": "md"}
+                    for n in range(3)
+                ],
+            )
+            await conn.execute(
+                Job.__table__.insert(),
+                [{"job_id": f"j{n}", "resume_id": "r0", "content": JOB_MD} for n in range(3)],
+            )
+            await conn.execute(
+                ProcessedJob.__table__.insert(),
+                [
+                    {"job_id": f"j{n}", "job_title": "Engineer", "job_summary": "Build."}
+                    for n in range(2)
+                ],
+            )
+            await conn.execute(text("ALTER TABLE processed_resumes DROP COLUMN edited_at"))
+            await conn.execute(
+                text(
+                    "INSERT INTO processed_resumes (resume_id, personal_data) "
+                    "VALUES ('r0', '{}')"
+                )
+            )
+            await conn.execute(text("DELETE FROM schema_migrations"))
+
+        async with engine.begin() as conn:
+            await conn.run_sync(run_migrations)
+
+        async with engine.connect() as conn:
+            stats = (await conn.execute(select(CorpusStats.document_count))).scalar_one()
+            jobs = (
+                await conn.execute(select(Job.job_id, Job.canonical_job_id).order_by(Job.id))
+            ).all()
+            processed = (await conn.execute(select(ProcessedJob.job_id))).scalars().all()
+            statuses = (
+                await conn.execute(
+                    select(Resume.resume_id, Resume.processing_status).order_by(Resume.id)
+                )
+            ).all()
+            edited_at = (await conn.execute(select(ProcessedResume.edited_at))).scalar_one()
+        await engine.dispose()
+        return stats, jobs, processed, statuses, edited_at
+
+    stats, jobs, processed, statuses, edited_at = asyncio.run(scenario())
+    assert stats == 6
+    # Duplicates keep processed data of their own; only j2, which has none, shares j0's
+    assert [tuple(row) for row in jobs] == [("j0", None), ("j1", None), ("j2", "j0")]
+    assert sorted(processed) == ["j0", "j1"]
+    assert [tuple(row) for row in statuses] == [
+        ("r0", "processed"),
+        ("r1", "failed"),
+        ("r2", "failed"),
+    ]
+    # Processed data of unknown history is not reused for duplicate uploads
+    assert edited_at is not None
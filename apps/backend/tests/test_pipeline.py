@@ -0,0 +1,196 @@
+import asyncio
+
+import pytest
+
+from app.services.exceptions import PipelineStageTimeoutError
+from app.services.pipeline import Stage, StageGraph, bounded_map
+
+
+def test_stages_run_after_their_dependencies_and_get_their_results():
+    events = []
+
+    def stage(name, value):
+        async def func(**deps):
+            events.append(("start", name))
+            await asyncio.sleep(0.01)
+            events.append(("end", name))
+            return value(**deps)
+
+        return func
+
+    graph = StageGraph(
+        [
+            Stage("d", stage("d", lambda b, c: b + c), depends_on=("b", "c")),
+            Stage("b", stage("b", lambda a: a * 2), depends_on=("a",)),
+            Stage("c", stage("c", lambda a: a * 3), depends_on=("a",)),
+            Stage("a", stage("a", lambda: 1)),
+        ]
+    )
+
+    assert asyncio.run(graph.run()) == {"a": 1, "b": 2, "c": 3, "d": 5}
+    # b and c are independent, so they run concurrently
+    assert events[:4] == [("start", "a"), ("end", "a"), ("start", "b"), ("start", "c")]
+    assert events[-2:] == [("start", "d"), ("end", "d")]
+    assert set(graph.timings) == {"a", "b", "c", "d"}
+
+
+def test_failing_stage_cancels_the_rest_of_the_graph():
+    started, cancelled = [], []
+
+    async def fail():
+        raise ValueError("no keywords")
+
+    async def dependent(extract):
+        started.append("dependent")
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    graph = StageGraph(
+        [
+            Stage("extract", fail),
+            Stage("dependent", dependent, depends_on=("extract",)),
+            Stage("slow", slow),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="no keywords"):
+        asyncio.run(graph.run())
+    assert started == []
+    assert cancelled == ["slow"]
+
+
+def test_stage_timeout_names_the_stage():
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def fast():
+        return "ok"
+
+    graph = StageGraph([Stage("fast", fast, timeout=1), Stage("embed", slow, timeout=0.05)])
+
+    with pytest.raises(PipelineStageTimeoutError) as excinfo:
+        asyncio.run(graph.run())
+    assert excinfo.value.stage == "embed"
+    assert excinfo.value.timeout == 0.05
+    assert graph.timings["embed"] < 1
+
+
+@pytest.mark.parametrize(
+    "stages, message",
+    [
+        ([Stage("a", None, depends_on=("missing",))], "unknown stage"),
+        ([Stage("a", None, depends_on=("b",)), Stage("b", None, depends_on=("a",))], "Cycle"),
+        ([Stage("a", None), Stage("a", None)], "Duplicate"),
+    ],
+)
+def test_invalid_graphs_are_rejected(stages, message):
+    with pytest.raises(ValueError, match=message):
+        StageGraph(stages)
+
+
+def test_bounded_map_limits_concurrency_and_reports_errors_per_item():
+    in_flight = 0
+    peak = 0
+    drawn = []
+
+    def items():
+        for n in range(6):
+            drawn.append(n)
+            yield n
+
+    async def square(n):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if n == 3:
+            raise ValueError("three")
+        return n * n
+
+    async def scenario():
+        outcomes = {}
+        async for item, result, error in bounded_map(square, items(), 2):
+            if not outcomes:
+                # Items are drawn as slots free up, not up front
+                assert len(drawn) == 2
+            outcomes[item] = str(error) if error else result
+        return outcomes
+
+    assert asyncio.run(scenario()) == {0: 0, 1: 1, 2: 4, 3: "three", 4: 16, 5: 25}
+    assert peak == 2
+
+
+def test_bounded_map_does_not_read_an_async_source_ahead_of_free_slots():
+    produced = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def items():
+            for n in range(5):
+                produced.append(n)
+                yield n
+
+        async def wait(n):
+            await release.wait()
+            return n
+
+        results = []
+
+        async def consume():
+            async for item, result, error in bounded_map(wait, items(), 2):
+                results.append(result)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        stalled = list(produced)
+        release.set()
+        await consumer
+        return stalled, sorted(results)
+
+    stalled, results = asyncio.run(scenario())
+    assert stalled == [0, 1]
+    assert results == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("source", ["sync", "async"])
+def test_closing_bounded_map_cancels_calls_in_flight(source):
+    started, cancelled, closed = [], [], []
+
+    async def async_items():
+        try:
+            for n in range(10):
+                yield n
+        finally:
+            closed.append(True)
+
+    async def call(n):
+        if n == 0:
+            # Done once the other slots are busy
+            await asyncio.sleep(0.05)
+            return n
+        started.append(n)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(n)
+            raise
+
+    async def scenario():
+        items = range(10) if source == "sync" else async_items()
+        results = bounded_map(call, items, 3)
+        first = await results.__anext__()
+        await results.aclose()
+        return first
+
+    assert asyncio.run(scenario()) == (0, 0, None)
+    assert sorted(started) == [1, 2]
+    assert sorted(cancelled) == [1, 2]
+    if source == "async":
+        assert closed == [True]
@@ -0,0 +1,35 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import ImprovementResult
+from app.services.result_store import ImprovementResultStore
+
+
+def test_put_when_another_session_stores_the_same_key_first(database_url):
+    async def scenario():
+        engine = create_async_engine(database_url)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        async with session_factory() as first, session_factory() as second:
+            # The first run has written its result but not committed yet when
+            # the second run for the same key stores its own
+            first.add(
+                ImprovementResult(
+                    cache_key="key", resume_id="r1", job_id="j1", execution={"run": 1}
+                )
+            )
+            await first.flush()
+            put = asyncio.create_task(
+                ImprovementResultStore(second).put("key", "r1", "j1", {"run": 2})
+            )
+            await asyncio.sleep(0.2)
+            await first.commit()
+            await put
+
+        async with session_factory() as db:
+            execution = await ImprovementResultStore(db).get("key")
+        await engine.dispose()
+        return execution
+
+    assert asyncio.run(scenario()) == {"run": 2}
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core import settings
+from app.models import Resume, ProcessedResume
+from app.services import resume_service
+from app.services.resume_service import ResumeService, file_hash, content_hash
+
+FILE_BYTES = b"%PDF-1.4 Jane Doe"
+RESUME_MD = "# Jane Doe\n\n## Skills\nPython, FastAPI"
+
+
+class _Converter:
+    async def convert(self, file_bytes: bytes, extension: str, **kwargs) -> str:
+        return RESUME_MD
+
+
+@pytest.fixture
+def upload(database_url, monkeypatch):
+    """
+    Stores an extracted resume ``r1`` of FILE_BYTES, optionally edits it by
+    hand, then uploads FILE_BYTES again with the given dedup mode. Returns the
+    id of the upload and the skills stored for it.
+    """
+    monkeypatch.setattr(resume_service, "document_converter", _Converter())
+
+    def run(mode: str, edit: bool):
+        monkeypatch.setattr(settings, "RESUME_DEDUP_MODE", mode)
+
+        async def scenario():
+            engine = create_async_engine(database_url)
+            session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+            async with session_factory() as db:
+                db.add(
+                    Resume(
+                        resume_id="r1",
+                        content=RESUME_MD,
+                        content_type="md",
+                        file_hash=file_hash(FILE_BYTES),
+                        content_hash=content_hash(RESUME_MD),
+                        processing_status="processed",
+                    )
+                )
+                db.add(
+                    ProcessedResume(
+                        resume_id="r1",
+                        personal_data={"firstName": "Jane"},
+                        skills=[{"category": "Languages", "skill_name": "Python"}],
+                    )
+                )
+                await db.commit()
+
+            async with session_factory() as db:
+                service = ResumeService(db)
+                if edit:
+                    await service.update_processed_resume_data(
+                        "r1", {"skills": [{"category": "Languages", "skill_name": "COBOL"}]}
+                    )
+                resume_id = await service.convert_and_store_resume(
+                    FILE_BYTES, "application/pdf", "resume.pdf", defer_extraction=True
+                )
+                skills = await db.scalar(
+                    select(ProcessedResume.skills).where(ProcessedResume.resume_id == resume_id)
+                )
+            await engine.dispose()
+            return resume_id, skills
+
+        return asyncio.run(scenario())
+
+    return run
+
+
+def test_reupload_reuses_unedited_extraction(upload):
+    resume_id, skills = upload("reuse", edit=False)
+    assert resume_id != "r1"
+    assert skills == [{"category": "Languages", "skill_name": "Python"}]
+
+
+def test_reupload_does_not_inherit_manual_edits(upload):
+    resume_id, skills = upload("reuse", edit=True)
+    # Stored for a fresh extraction instead of copying the edited data
+    assert resume_id != "r1"
+    assert skills is None
+
+
+def test_return_existing_returns_unedited_resume(upload):
+    assert upload("return_existing", edit=False)[0] == "r1"
+
+
+def test_return_existing_skips_edited_resume(upload):
+    assert upload("return_existing", edit=True)[0] != "r1"
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.router.v1 import resume as resume_router
+from app.models import Resume
+from app.services import resume_service
+
+
+class _Converter:
+    async def convert(self, file_bytes: bytes, extension: str, **kwargs) -> str:
+        return "# Jane Doe\n\n## Skills\nPython"
+
+
+async def _unavailable_queue(kind, payload):
+    raise RuntimeError("database is locked")
+
+
+@pytest.fixture
+def client(api_client, monkeypatch):
+    monkeypatch.setattr(resume_service, "document_converter", _Converter())
+    monkeypatch.setattr(resume_router.task_queue, "submit", _unavailable_queue)
+    return api_client
+
+
+def test_upload_reports_resume_failed_when_extraction_cannot_be_queued(client, database_url):
+    response = client.post(
+        "/api/v1/resumes/upload",
+        params={"defer_extraction": "true"},
+        files={"file": ("resume.pdf", b"%PDF-1.4 Jane Doe", "application/pdf")},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["processing_status"] == "failed"
+
+    async def stored():
+        engine = create_async_engine(database_url)
+        async with engine.connect() as conn:
+            row = (
+                await conn.execute(
+                    select(Resume.processing_status, Resume.processing_error).where(
+                        Resume.resume_id == body["resume_id"]
+                    )
+                )
+            ).one()
+        await engine.dispose()
+        return row
+
+    status, error = asyncio.run(stored())
+    assert status == "failed"
+    assert error == "Failed to queue the extraction: database is locked"
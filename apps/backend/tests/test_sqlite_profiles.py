@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import async_engine
+from app.core.database import SQLITE_PROFILES, configure_sqlite, settings
+
+PRAGMAS = (
+    "journal_mode",
+    "synchronous",
+    "foreign_keys",
+    "busy_timeout",
+    "cache_size",
+    "temp_store",
+)
+
+
+async def _read_pragmas(engine) -> list:
+    """
+    Reads the PRAGMAs back on two connections open at the same time, so
+    both were set up by the engine rather than one being reused.
+    """
+    async with engine.connect() as first, engine.connect() as second:
+        return [
+            {name: (await conn.exec_driver_sql(f"PRAGMA {name}")).scalar() for name in PRAGMAS}
+            for conn in (first, second)
+        ]
+
+
+def _pragmas(tmp_path, pragmas) -> list:
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        configure_sqlite(engine.sync_engine, pragmas)
+        try:
+            return await _read_pragmas(engine)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    "profile, expected",
+    [
+        # synchronous=FULL is SQLite's default
+        ("baseline", {"synchronous": 2}),
+        ("tuned", {"synchronous": 1, "cache_size": -65536, "temp_store": 2}),
+    ],
+)
+def test_profile_pragmas_are_applied_to_new_connections(tmp_path, profile, expected):
+    for pragmas in _pragmas(tmp_path, SQLITE_PROFILES[profile]):
+        assert pragmas["journal_mode"] == "wal"
+        assert pragmas["foreign_keys"] == 1
+        assert pragmas["busy_timeout"] == 5000
+        assert {name: pragmas[name] for name in expected} == expected
+
+
+def test_pragma_overrides_take_precedence(tmp_path):
+    overridden = {**SQLITE_PROFILES["tuned"], "synchronous": "FULL", "journal_mode": "DELETE"}
+    for pragmas in _pragmas(tmp_path, overridden):
+        assert pragmas["synchronous"] == 2
+        assert pragmas["journal_mode"] == "delete"
+
+
+def test_app_engine_applies_the_configured_pragmas(tmp_path):
+    async def scenario():
+        try:
+            return await _read_pragmas(async_engine)
+        finally:
+            await async_engine.dispose()
+
+    assert asyncio.run(scenario()) == _pragmas(tmp_path, settings.SQLITE_PRAGMAS)
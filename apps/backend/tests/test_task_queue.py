@@ -0,0 +1,71 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.services.task_queue import TaskQueue
+
+
+def _make_queue(engine, **kwargs) -> TaskQueue:
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    return TaskQueue(session_factory=session_factory, workers=1, poll_interval=0.01, **kwargs)
+
+
+async def _wait_until_terminal(queue: TaskQueue, task_id: str) -> dict:
+    async for snapshot in queue.follow(task_id):
+        pass
+    return snapshot
+
+
+def test_worker_survives_a_task_whose_result_cannot_be_stored(database_url):
+    async def scenario():
+        engine = create_async_engine(database_url)
+        queue = _make_queue(engine)
+
+        async def unserializable(payload):
+            return object()
+
+        async def echo(payload):
+            return payload
+
+        queue.register("unserializable", unserializable)
+        queue.register("echo", echo)
+        await queue.start()
+        try:
+            await queue.submit("unserializable", {})
+            # Give the worker time to fail storing the first result
+            await asyncio.sleep(0.2)
+            ok = await queue.submit("echo", {"value": 1})
+            return await asyncio.wait_for(_wait_until_terminal(queue, ok), timeout=5)
+        finally:
+            await queue.stop()
+            await engine.dispose()
+
+    snapshot = asyncio.run(scenario())
+    assert snapshot["status"] == "succeeded"
+    assert snapshot["result"] == {"value": 1}
+
+
+def test_heartbeat_keeps_renewing_after_a_failed_renewal(database_url):
+    async def scenario():
+        engine = create_async_engine(database_url)
+        queue = _make_queue(engine, lease_seconds=0)
+        session_factory = queue._session_factory
+        calls = 0
+
+        def flaky_factory():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("database is locked")
+            return session_factory()
+
+        queue._session_factory = flaky_factory
+        heartbeat = asyncio.create_task(queue._heartbeat("missing"))
+        await asyncio.sleep(0.1)
+        assert not heartbeat.done()
+        heartbeat.cancel()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+        await engine.dispose()
+        return calls
+
+    assert asyncio.run(scenario()) > 1